@@ -0,0 +1,32 @@
+"""add instance list indexes
+
+Revision ID: a7c1e3f5b9d2
+Revises: d5e6f7a8b9c0
+Create Date: 2026-03-04 10:00:00.000000
+
+"""
+
+from alembic import op
+
+revision = "a7c1e3f5b9d2"
+down_revision = "d5e6f7a8b9c0"
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = (
+    ("ix_instances_status_org_code", "instances", ["status", "org_code"]),
+    ("ix_instances_app_port", "instances", ["app_port"]),
+    ("ix_health_checks_instance_checked_at", "health_checks", ["instance_id", "checked_at"]),
+)
+
+
+def upgrade() -> None:
+    # Databases bootstrapped from the models already have these indexes.
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -14,6 +14,8 @@ celery_app.autodiscover_tasks(
         "app.tasks.cleanup",
         "app.tasks.monitoring",
         "app.tasks.lifecycle",
+        "app.tasks.instance_ops",
+        "app.tasks.domains",
         "app.tasks.server_setup",
         "app.tasks.webhooks",
         "app.tasks.dr",
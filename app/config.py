@@ -17,10 +17,16 @@ class Settings(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     database_url: str | None = os.getenv("DATABASE_URL")
-    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    # Sized for admin bursts; a short timeout fails fast (503) instead of parking request threads for 30s.
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
     db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
-    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
-    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "5"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+    # Read-only pool for GET pages on the replica at DATABASE_READ_URL; unset, they read on the primary session.
+    database_read_url: str | None = os.getenv("DATABASE_READ_URL")
+    db_read_pool_size: int = int(os.getenv("DB_READ_POOL_SIZE", "15"))
+    # Worker threads for sync routes/dependencies (anyio default is 40).
+    threadpool_size: int = int(os.getenv("THREADPOOL_SIZE", "40"))
 
     # Avatar settings
     avatar_upload_dir: str = os.getenv("AVATAR_UPLOAD_DIR", "static/avatars")
@@ -39,6 +45,10 @@ class Settings(BaseModel):
     # Runtime flags
     testing: bool = _env_bool("TESTING")
     use_cdn_assets: bool = _env_bool("USE_CDN_ASSETS", "true")
+    # Re-stat template files on every render; only useful when editing templates on a live server.
+    template_auto_reload: bool = _env_bool("TEMPLATE_AUTO_RELOAD")
+    # Directory for compiled template bytecode, so restarts skip parsing; unset keeps it in memory only.
+    template_bytecode_cache_dir: str = os.getenv("TEMPLATE_BYTECODE_CACHE_DIR", "")
 
     # Platform-specific
     dotmac_source_path: str = os.getenv("DOTMAC_SOURCE_PATH", "/opt/dotmac")
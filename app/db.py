@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
@@ -19,4 +19,36 @@ def get_engine():
     )
 
 
-SessionLocal = sessionmaker(bind=get_engine(), autoflush=False, autocommit=False)
+def get_read_engine():
+    """Engine for read-only GET pages on the replica at ``DATABASE_READ_URL``, or ``None`` without one."""
+    if not settings.database_read_url:
+        return None
+    return create_engine(
+        settings.database_read_url,
+        pool_pre_ping=True,
+        pool_size=settings.db_read_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_use_lifo=True,
+        isolation_level="AUTOCOMMIT",
+    )
+
+
+_engine = get_engine()
+SessionLocal = sessionmaker(bind=_engine, autoflush=False, autocommit=False, expire_on_commit=False)
+_read_engine = get_read_engine()
+ReadSessionLocal = (
+    sessionmaker(bind=_read_engine, autoflush=False, autocommit=False, expire_on_commit=False)
+    if _read_engine is not None
+    else None
+)
+# Same pool, but commits return before the WAL is flushed. A database crash can drop the last few
+# hundred milliseconds of these commits (never corrupt them), so only use it for writes that are cheap to redo.
+SoftCommitSessionLocal = sessionmaker(bind=_engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+@event.listens_for(SoftCommitSessionLocal, "after_begin")
+def _skip_commit_fsync(session, transaction, connection):
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET LOCAL synchronous_commit = off")
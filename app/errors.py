@@ -3,6 +3,7 @@ import logging
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, RedirectResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,15 @@ def register_error_handlers(app) -> None:
             content=_error_payload("validation_error", "Validation error", exc.errors()),
         )
 
+    @app.exception_handler(PoolTimeoutError)
+    async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+        logger.warning("Database pool exhausted: %s %s", request.method, request.url.path)
+        return JSONResponse(
+            status_code=503,
+            content=_error_payload("db_pool_exhausted", "Database busy, retry shortly", None),
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
         logger.exception("Unhandled exception")
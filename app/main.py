@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from threading import Lock
 from time import monotonic
 
+import anyio.to_thread
 import redis as redis_lib
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -57,7 +58,7 @@ from app.web.domains_web import router as domains_web_router
 from app.web.dr_web import router as dr_web_router
 from app.web.drift_web import router as drift_web_router
 from app.web.git_repos_web import router as git_repos_web_router
-from app.web.helpers import CSRF_COOKIE_NAME
+from app.web.helpers import CSRF_COOKIE_NAME, precompile_templates
 from app.web.instances import router as instances_router
 from app.web.logs_web import router as logs_web_router
 from app.web.maintenance_web import router as maintenance_web_router
@@ -85,6 +86,10 @@ async def lifespan(app: FastAPI):
     logger.info(f"App version: {app_version}")
     logger.info(f"Python version: {python_version}")
 
+    # Sync routes and their DB sessions all run on anyio's default thread limiter; size it explicitly
+    # alongside the DB pool instead of inheriting the library default.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
     db = SessionLocal()
     try:
         # Check database connectivity
@@ -119,6 +124,8 @@ async def lifespan(app: FastAPI):
         logger.info("Startup seeding completed successfully")
     finally:
         db.close()
+
+    logger.info("Precompiled %d templates", precompile_templates())
     yield
 
 
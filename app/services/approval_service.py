@@ -113,6 +113,21 @@ class ApprovalService:
         stmt = stmt.order_by(DeployApproval.created_at.desc())
         return list(self.db.scalars(stmt).all())
 
+    def get_pending_upgrade_ids(self, instance_id: UUID, max_age_days: int = 7) -> set[UUID]:
+        """Upgrade ids with a pending approval for one instance.
+
+        Reads ids only. Approvals older than ``max_age_days`` are skipped rather than marked expired,
+        so page renders never write; :meth:`get_pending` still performs the expiry.
+        """
+        cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
+        stmt = select(DeployApproval.upgrade_id).where(
+            DeployApproval.instance_id == instance_id,
+            DeployApproval.status == ApprovalStatus.pending,
+            DeployApproval.upgrade_id.is_not(None),
+            DeployApproval.created_at >= cutoff,
+        )
+        return set(self.db.scalars(stmt).all())
+
     def get_history(self, instance_id: UUID, limit: int = 50) -> list[DeployApproval]:
         stmt = (
             select(DeployApproval)
@@ -43,8 +43,10 @@ from app.schemas.auth import (
     UserCredentialUpdate,
 )
 from app.services import settings_spec
+from app.services.auth_cache import invalidate_session_state_on_commit
 from app.services.auth_flow import hash_password, hash_session_token
 from app.services.common import coerce_uuid
+from app.services.redis_client import get_redis_client
 from app.services.response import ListResponseMixin
 from app.services.settings_crypto import resolve_setting_value
 
@@ -102,7 +104,6 @@ def hash_api_key_candidates(value: str) -> list[str]:
 
 _API_KEY_WINDOW_SECONDS = 60
 _API_KEY_MAX_PER_WINDOW = 5
-_REDIS_CLIENT: redis.Redis | None = None
 
 
 def _auth_setting(db: Session, key: str) -> str | None:
@@ -128,24 +129,6 @@ def _auth_int_setting(db: Session, key: str, default: int) -> int:
         return default
 
 
-def _get_redis_client() -> redis.Redis | None:
-    global _REDIS_CLIENT
-    if _REDIS_CLIENT is not None:
-        return _REDIS_CLIENT
-    url = os.getenv("REDIS_URL")
-    if not url:
-        logger.warning("REDIS_URL environment variable is not set")
-        return None
-    try:
-        client = redis.Redis.from_url(url, decode_responses=True)
-        client.ping()
-        _REDIS_CLIENT = client
-        return client
-    except redis.RedisError as e:
-        logger.error(f"Failed to connect to Redis: {e}")
-        return None
-
-
 def _validate_enum(value: str | None, enum_cls: type, label: str) -> Any:
     if value is None:
         return None
@@ -414,6 +397,7 @@ class Sessions(ListResponseMixin):
             _ensure_person(db, str(data["person_id"]))
         for key, value in data.items():
             setattr(session, key, value)
+        invalidate_session_state_on_commit(db, session.id)
         db.commit()
         db.refresh(session)
         return session
@@ -425,6 +409,7 @@ class Sessions(ListResponseMixin):
             raise HTTPException(status_code=404, detail="Session not found")
         session.status = SessionStatus.revoked
         session.revoked_at = datetime.now(UTC)
+        invalidate_session_state_on_commit(db, session.id)
         db.commit()
 
 
@@ -436,7 +421,7 @@ class ApiKeys(ListResponseMixin):
         client_ip = _get_client_ip(request) if request is not None else "unknown"
         window_seconds = _auth_int_setting(db, "api_key_rate_window_seconds", _API_KEY_WINDOW_SECONDS)
         max_per_window = _auth_int_setting(db, "api_key_rate_max", _API_KEY_MAX_PER_WINDOW)
-        redis_client = _get_redis_client()
+        redis_client = get_redis_client()
         if not redis_client:
             raise HTTPException(
                 status_code=503,
@@ -0,0 +1,183 @@
+"""Redis-backed cache of auth session state for web request validation.
+
+Every authenticated web request checks that its session is still active and
+unexpired. The session row changes rarely, so its status and expiry are packed
+into a small Redis value shared by all workers and the database is only hit on
+a miss. The cache is disabled when ``REDIS_URL`` is not set or Redis is down.
+
+Invalidations are queued on the DB session and applied after it commits, so a
+concurrent request cannot re-cache the pre-commit row. They leave a short-lived
+tombstone that readers never overwrite. If an invalidation cannot reach Redis,
+this process stops reading the cache until it has bumped the shared generation,
+which drops every cached state at once.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import time
+from dataclasses import dataclass
+from datetime import UTC
+from uuid import UUID
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.auth import Session as AuthSession
+from app.models.auth import SessionStatus
+from app.services.redis_client import get_redis_client, mark_redis_unavailable
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "auth:sess"
+_GENERATION_KEY = f"{_KEY_PREFIX}:gen"
+_TOMBSTONE = b"-"
+_PENDING_INFO_KEY = "auth_cache.pending_invalidations"
+_STATE_FORMAT = "<Bq"  # (is_active, expires_at epoch seconds)
+_STATE_SIZE = struct.calcsize(_STATE_FORMAT)
+_NO_EXPIRY = -1
+_MAX_TTL_SECONDS = 60
+# Set when an invalidation could not be delivered; cleared once the generation bump lands.
+_invalidation_missed = False
+
+
+@dataclass(frozen=True)
+class SessionState:
+    """The subset of an auth session needed to authorize a request."""
+
+    active: bool
+    expires_at: int | None
+
+    @classmethod
+    def from_session(cls, session: AuthSession) -> SessionState:
+        expires_at = session.expires_at
+        if expires_at is not None and expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        return cls(
+            active=session.status == SessionStatus.active,
+            expires_at=int(expires_at.timestamp()) if expires_at is not None else None,
+        )
+
+    def is_valid(self, now: float | None = None) -> bool:
+        if not self.active:
+            return False
+        if self.expires_at is None:
+            return True
+        return self.expires_at > (time.time() if now is None else now)
+
+
+def _cache_key(session_id: UUID | str) -> str:
+    return f"{_KEY_PREFIX}:{session_id}"
+
+
+def _pack(state: SessionState) -> bytes:
+    expires_at = _NO_EXPIRY if state.expires_at is None else state.expires_at
+    return struct.pack(_STATE_FORMAT, 1 if state.active else 0, expires_at)
+
+
+def _unpack(raw: bytes) -> SessionState | None:
+    if len(raw) != _STATE_SIZE:
+        return None
+    active, expires_at = struct.unpack(_STATE_FORMAT, raw)
+    return SessionState(active=bool(active), expires_at=None if expires_at == _NO_EXPIRY else expires_at)
+
+
+def _trusted_client() -> redis.Redis | None:
+    """Return the client only if no invalidation from this process has been lost."""
+    global _invalidation_missed
+    client = get_redis_client()
+    if client is None or not _invalidation_missed:
+        return client
+    try:
+        client.incr(_GENERATION_KEY)
+    except redis.RedisError as exc:
+        logger.warning("Auth session cache generation bump failed: %s", exc)
+        mark_redis_unavailable()
+        return None
+    _invalidation_missed = False
+    return client
+
+
+def get_session_state(db: Session, session_id: UUID) -> SessionState | None:
+    """Return the cached state of an auth session, loading it from the DB on a miss.
+
+    Returns None when the session does not exist.
+    """
+    client = _trusted_client()
+    key = _cache_key(session_id)
+    generation = b"0"
+    if client is not None:
+        try:
+            generation, raw = client.mget([_GENERATION_KEY, key])
+        except redis.RedisError as exc:
+            logger.warning("Auth session cache read failed: %s", exc)
+            mark_redis_unavailable()
+            client = None
+        else:
+            generation = generation or b"0"
+            if raw == _TOMBSTONE:
+                # Recently invalidated: read the row but leave the tombstone in place.
+                client = None
+            elif isinstance(raw, bytes):
+                entry_generation, sep, packed = raw.partition(b"|")
+                cached = _unpack(packed) if sep and entry_generation == generation else None
+                if cached is not None:
+                    return cached
+
+    session = db.get(AuthSession, session_id)
+    if session is None:
+        return None
+    state = SessionState.from_session(session)
+
+    if client is not None:
+        ttl = _MAX_TTL_SECONDS
+        if state.expires_at is not None:
+            ttl = min(ttl, state.expires_at - int(time.time()))
+        if ttl > 0:
+            try:
+                # NX: never replace a tombstone written by an invalidation that raced this read.
+                client.set(key, generation + b"|" + _pack(state), ex=ttl, nx=True)
+            except redis.RedisError as exc:
+                logger.warning("Auth session cache write failed: %s", exc)
+                mark_redis_unavailable()
+    return state
+
+
+def invalidate_session_state(session_id: UUID | str) -> None:
+    """Drop the cached state for a session; call only once the change is committed.
+
+    Prefer :func:`invalidate_session_state_on_commit` inside a unit of work.
+    """
+    global _invalidation_missed
+    if not os.getenv("REDIS_URL"):
+        return
+    # Security-relevant: skip the retry backoff and try to reach Redis now.
+    client = get_redis_client(ignore_backoff=True)
+    if client is None:
+        _invalidation_missed = True
+        return
+    try:
+        client.set(_cache_key(session_id), _TOMBSTONE, ex=_MAX_TTL_SECONDS)
+    except redis.RedisError as exc:
+        logger.warning("Auth session cache invalidation failed: %s", exc)
+        mark_redis_unavailable()
+        _invalidation_missed = True
+
+
+def invalidate_session_state_on_commit(db: Session, session_id: UUID | str) -> None:
+    """Queue an invalidation that runs after ``db`` commits (and is dropped on rollback)."""
+    db.info.setdefault(_PENDING_INFO_KEY, set()).add(session_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    for session_id in session.info.pop(_PENDING_INFO_KEY, ()):
+        invalidate_session_state(session_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INFO_KEY, None)
@@ -5,6 +5,8 @@ import hmac
 import logging
 import os
 import secrets
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
@@ -39,6 +41,8 @@ from app.models.organization_member import OrganizationMember
 from app.models.person import Person
 from app.models.rbac import Permission, PersonRole, Role, RolePermission
 from app.schemas.auth_flow import LoginResponse, LogoutResponse, TokenResponse
+from app.services.auth_cache import invalidate_session_state_on_commit
+from app.services.bounded_cache import BoundedCache
 from app.services.common import coerce_uuid
 from app.services.response import ListResponseMixin
 from app.services.secrets import resolve_secret
@@ -274,8 +278,45 @@ def _decode_jwt(db: Session | None, token: str, expected_type: str) -> dict:
     return payload
 
 
+# Verified access-token payloads keyed by a digest of the token, held until the
+# token's own ``exp``. Repeat requests with the same token skip the secret lookup
+# and signature check. The signing key is re-read at most every
+# _TOKEN_CACHE_KEY_RECHECK_SECONDS and the cache is dropped when it changes, so
+# cached payloads do not outlive a secret rotation by more than that.
+_VALID_TOKEN_CACHE: BoundedCache[bytes, tuple[dict, float]] = BoundedCache(50_000)
+_TOKEN_CACHE_KEY_LOCK = threading.Lock()
+_TOKEN_CACHE_KEY_RECHECK_SECONDS = 60.0
+_token_cache_key_id: bytes | None = None
+_token_cache_key_checked_at = float("-inf")
+
+
+def _sync_token_cache_key(db: Session | None) -> None:
+    """Drop cached payloads if the signing secret or algorithm changed since they were verified."""
+    global _token_cache_key_id, _token_cache_key_checked_at
+    key_id = hashlib.blake2b(f"{_jwt_algorithm(db)}:{_jwt_secret(db)}".encode(), digest_size=16).digest()
+    with _TOKEN_CACHE_KEY_LOCK:
+        if key_id != _token_cache_key_id:
+            _VALID_TOKEN_CACHE.clear()
+            _token_cache_key_id = key_id
+        _token_cache_key_checked_at = time.monotonic()
+
+
 def decode_access_token(db: Session | None, token: str) -> dict:
-    return _decode_jwt(db, token, "access")
+    if time.monotonic() - _token_cache_key_checked_at > _TOKEN_CACHE_KEY_RECHECK_SECONDS:
+        _sync_token_cache_key(db)
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _VALID_TOKEN_CACHE.get(digest)
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at > time.time():
+            return dict(payload)
+        _VALID_TOKEN_CACHE.pop(digest)
+
+    payload = _decode_jwt(db, token, "access")
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, int | float):
+        _VALID_TOKEN_CACHE.set(digest, (payload, float(expires_at)))
+    return dict(payload)
 
 
 def _person_or_404(db: Session, person_id: str) -> Person:
@@ -403,6 +444,7 @@ def revoke_sessions_for_person(
     for session in sessions:
         session.status = SessionStatus.revoked
         session.revoked_at = now
+        invalidate_session_state_on_commit(db, session.id)
     return len(sessions)
 
 
@@ -649,6 +691,7 @@ class AuthFlow(ListResponseMixin):
                 if reused_session and reused_session.status == SessionStatus.active:
                     reused_session.status = SessionStatus.revoked
                     reused_session.revoked_at = _now()
+                    invalidate_session_state_on_commit(db, reused_session.id)
                 db.commit()
                 raise HTTPException(
                     status_code=401,
@@ -658,6 +701,7 @@ class AuthFlow(ListResponseMixin):
         expires_at = _as_utc(session.expires_at)
         if expires_at and expires_at <= _now():
             session.status = SessionStatus.expired
+            invalidate_session_state_on_commit(db, session.id)
             db.commit()
             raise HTTPException(status_code=401, detail="Refresh token expired")
 
@@ -707,6 +751,7 @@ class AuthFlow(ListResponseMixin):
             raise HTTPException(status_code=404, detail="Session not found")
         session.status = SessionStatus.revoked
         session.revoked_at = _now()
+        invalidate_session_state_on_commit(db, session.id)
         db.commit()
         return {"revoked_at": session.revoked_at}
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.models.auth import Session as AuthSession
 from app.models.auth import SessionStatus
+from app.services.auth_cache import invalidate_session_state_on_commit
 from app.services.auth_flow import decode_access_token
 from app.services.common import coerce_uuid
 
@@ -42,6 +43,7 @@ def revoke_session(db: Session, person_id: str, session_id: str) -> datetime:
     now = datetime.now(UTC)
     session.status = SessionStatus.revoked
     session.revoked_at = now
+    invalidate_session_state_on_commit(db, session.id)
     db.flush()
     return now
 
@@ -64,6 +66,7 @@ def revoke_all_others(db: Session, person_id: str, current_session_id: str | Non
     for session in sessions:
         session.status = SessionStatus.revoked
         session.revoked_at = now
+        invalidate_session_state_on_commit(db, session.id)
     db.flush()
     return now, len(sessions)
 
@@ -78,6 +81,7 @@ def revoke_by_access_token(db: Session, access_token: str) -> None:
         session = db.get(AuthSession, coerce_uuid(session_id))
         if session and session.status == SessionStatus.active:
             session.status = SessionStatus.revoked
+            invalidate_session_state_on_commit(db, session.id)
             db.flush()
     except Exception:
         logger.debug("Failed to revoke session from access token", exc_info=True)
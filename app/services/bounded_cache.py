@@ -0,0 +1,45 @@
+"""Thread-safe, size-capped in-process cache shared by the hot-path memoizers."""
+
+from __future__ import annotations
+
+import threading
+
+
+class BoundedCache[K, V]:
+    """A dict capped at ``maxsize`` entries that evicts the oldest insert first.
+
+    Every operation holds one lock, so threadpool handlers can share an instance. Expiry, where
+    needed, is left to the caller (store a timestamp in the value).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: dict[K, V] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self._maxsize:
+                # Dicts keep insertion order, so the first key is the oldest.
+                del self._data[next(iter(self._data))]
+            self._data[key] = value
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
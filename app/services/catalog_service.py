@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import Row, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.models.catalog import AppCatalogItem
@@ -62,6 +62,27 @@ class CatalogService:
         stmt = stmt.order_by(AppCatalogItem.created_at.desc())
         return list(self.db.scalars(stmt).all())
 
+    def list_for_form(self) -> list[Row]:
+        """Active items as ``(catalog_id, label, version, git_ref)`` rows for the instance form, newest first."""
+        stmt = (
+            select(AppCatalogItem.catalog_id, AppCatalogItem.label, AppCatalogItem.version, AppCatalogItem.git_ref)
+            .where(AppCatalogItem.is_active.is_(True))
+            .order_by(AppCatalogItem.created_at.desc())
+        )
+        return list(self.db.execute(stmt).all())
+
+    def get_catalog_signature(self) -> str:
+        """Cheap change marker for the active catalog: ``"<count>:<newest created_at>"`` in one aggregate query.
+
+        Items are never edited in place, so any create or deactivation changes the count or the newest timestamp.
+        """
+        count, newest = self.db.execute(
+            select(func.count(AppCatalogItem.catalog_id), func.max(AppCatalogItem.created_at)).where(
+                AppCatalogItem.is_active.is_(True)
+            )
+        ).one()
+        return f"{count}:{newest.isoformat() if newest else ''}"
+
     def get_index_bundle(self) -> dict[str, object]:
         from app.services.git_repo_service import GitRepoService
 
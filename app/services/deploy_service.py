@@ -110,18 +110,21 @@ class DeployService:
 
     def has_active_deployment(self, instance_id: UUID) -> bool:
         """Check if there is already an active (pending/running) deployment."""
-        from sqlalchemy import func, select
+        from sqlalchemy import exists, select
 
-        stmt = select(func.count(DeploymentLog.id)).where(
-            DeploymentLog.instance_id == instance_id,
-            DeploymentLog.status.in_(
-                [
-                    DeployStepStatus.pending,
-                    DeployStepStatus.running,
-                ]
-            ),
+        # EXISTS stops at the first pending/running step instead of counting every one.
+        stmt = select(
+            exists().where(
+                DeploymentLog.instance_id == instance_id,
+                DeploymentLog.status.in_(
+                    [
+                        DeployStepStatus.pending,
+                        DeployStepStatus.running,
+                    ]
+                ),
+            )
         )
-        return (self.db.scalar(stmt) or 0) > 0
+        return bool(self.db.scalar(stmt))
 
     def create_deployment(
         self,
@@ -219,12 +222,11 @@ class DeployService:
 
         instance = InstanceService(self.db).get_or_404(instance_id)
 
-        if not deployment_id:
-            deployment_id = self.get_latest_deployment_id(instance_id)
-
-        logs: list[DeploymentLog] = []
+        logs: list[DeploymentLog]
         if deployment_id:
             logs = self.get_deployment_logs(instance_id, deployment_id)
+        else:
+            deployment_id, logs = self.get_latest_deployment_logs(instance_id)
 
         is_running = any(log.status in (DeployStepStatus.pending, DeployStepStatus.running) for log in logs)
 
@@ -270,6 +272,23 @@ class DeployService:
         )
         return self.db.scalar(stmt)
 
+    def get_latest_deployment_logs(self, instance_id: UUID) -> tuple[str | None, list[DeploymentLog]]:
+        """Get the most recent deployment_id for an instance and its logs in one query."""
+        latest_id = (
+            select(DeploymentLog.deployment_id)
+            .where(DeploymentLog.instance_id == instance_id)
+            .order_by(DeploymentLog.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(DeploymentLog)
+            .where(DeploymentLog.instance_id == instance_id, DeploymentLog.deployment_id == latest_id)
+            .order_by(DeploymentLog.id)
+        )
+        logs = list(self.db.scalars(stmt).all())
+        return (logs[0].deployment_id if logs else None), logs
+
     def mark_stuck_deployments(self, max_age_minutes: int = 60) -> int:
         """Mark instances stuck in deploying state as error."""
         cutoff = datetime.now(UTC) - timedelta(minutes=max_age_minutes)
@@ -13,7 +13,7 @@ import shlex
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
 from sqlalchemy.orm import Session
 
 from app.models.instance import Instance
@@ -85,7 +85,7 @@ class DomainService:
 
         # If setting as primary, unset current primary
         if is_primary:
-            self._unset_primary(instance_id)
+            self._set_primary(instance_id, None)
 
         verification_token = f"dotmac-verify-{secrets.token_hex(16)}"
 
@@ -185,18 +185,23 @@ class DomainService:
     def set_primary(self, instance_id: UUID, domain_id: UUID) -> InstanceDomain:
         """Set a domain as the primary domain for its instance."""
         inst_domain = self._get_for_instance(instance_id, domain_id)
-        self._unset_primary(inst_domain.instance_id)
-        inst_domain.is_primary = True
-        self.db.flush()
+        self._set_primary(inst_domain.instance_id, inst_domain.domain_id)
         return inst_domain
 
-    def _unset_primary(self, instance_id: UUID) -> None:
-        stmt = select(InstanceDomain).where(
-            InstanceDomain.instance_id == instance_id,
-            InstanceDomain.is_primary.is_(True),
+    def _set_primary(self, instance_id: UUID, domain_id: UUID | None) -> None:
+        """Make ``domain_id`` the instance's only primary domain (None clears it) in one UPDATE.
+
+        Only the current primary and the new one are touched, so other rows keep their ``updated_at``.
+        """
+        touched = InstanceDomain.is_primary.is_(True)
+        if domain_id is not None:
+            touched = or_(touched, InstanceDomain.domain_id == domain_id)
+        self.db.execute(
+            update(InstanceDomain)
+            .where(InstanceDomain.instance_id == instance_id, touched)
+            .values(is_primary=InstanceDomain.domain_id == domain_id)
+            .execution_options(synchronize_session="fetch")
         )
-        for d in self.db.scalars(stmt).all():
-            d.is_primary = False
 
     def get_expiring_certs(self, days_until_expiry: int = 14) -> list[InstanceDomain]:
         """Find domains with SSL certificates expiring soon."""
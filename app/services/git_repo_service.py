@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, case, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.models.git_repository import GitAuthType, GitRepository, RegistryEnvironment
@@ -98,6 +98,74 @@ class GitRepoService:
         self.db.flush()
         return repo
 
+    def update_repo_fields(
+        self,
+        repo_id: UUID,
+        *,
+        label: str,
+        auth_type: GitAuthType,
+        default_branch: str,
+        is_platform_default: bool,
+        registry_url: str,
+        environment: str,
+        credential: str | None = None,
+    ) -> None:
+        """Apply the full edit form as a single UPDATE (plus one more to clear the old default).
+
+        A blank ``credential`` keeps the stored token; token auth still requires one to exist.
+        """
+        registry_val = registry_url.strip()
+        if not registry_val:
+            raise ValueError("Registry URL is required")
+        values: dict[str, object] = {
+            "label": label,
+            "auth_type": auth_type,
+            "default_branch": default_branch,
+            "is_platform_default": is_platform_default,
+            "registry_url": registry_val,
+            "environment": RegistryEnvironment(environment),
+            "is_active": True,
+        }
+        stmt = update(GitRepository).where(GitRepository.repo_id == repo_id)
+        if auth_type != GitAuthType.token:
+            values["token_encrypted"] = None
+        elif credential:
+            values["token_encrypted"] = encrypt_value(credential)
+        else:
+            stmt = stmt.where(GitRepository.token_encrypted.is_not(None))
+
+        updated = self.db.scalar(
+            stmt.values(**values).returning(GitRepository.repo_id).execution_options(synchronize_session="fetch")
+        )
+        if updated is None:
+            if not self.get_by_id(repo_id):
+                raise ValueError("Repo not found")
+            raise ValueError("Token is required for token auth")
+
+        if is_platform_default:
+            self.db.execute(
+                update(GitRepository)
+                .where(GitRepository.is_platform_default.is_(True), GitRepository.repo_id != repo_id)
+                .values(is_platform_default=False)
+                .execution_options(synchronize_session="fetch")
+            )
+
+    def set_platform_default(self, repo_id: UUID) -> None:
+        """Make ``repo_id`` the active platform default and clear the previous one in a single UPDATE."""
+        is_target = GitRepository.repo_id == repo_id
+        stmt = (
+            update(GitRepository)
+            .where(or_(is_target, GitRepository.is_platform_default.is_(True)))
+            .values(
+                is_platform_default=is_target,
+                is_active=case((is_target, True), else_=GitRepository.is_active),
+            )
+            .returning(GitRepository.repo_id)
+            .execution_options(synchronize_session="fetch")
+        )
+        if repo_id not in set(self.db.scalars(stmt).all()):
+            raise ValueError("Repo not found")
+
     def delete_repo(self, repo_id: UUID) -> None:
         repo = self.get_by_id(repo_id)
         if not repo:
@@ -137,8 +205,22 @@ class GitRepoService:
         stmt = stmt.order_by(GitRepository.created_at.desc())
         return list(self.db.scalars(stmt).all())
 
-    def list_for_web(self, active_only: bool = False) -> list[GitRepository]:
-        return self.list_repos(active_only=active_only)
+    def list_for_web(self, active_only: bool = False) -> list[Row]:
+        """Column rows for the catalog registry table; skips the encrypted credential columns."""
+        stmt = select(
+            GitRepository.repo_id,
+            GitRepository.label,
+            GitRepository.auth_type,
+            GitRepository.environment,
+            GitRepository.default_branch,
+            GitRepository.registry_url,
+            GitRepository.is_platform_default,
+            GitRepository.is_active,
+        )
+        if active_only:
+            stmt = stmt.where(GitRepository.is_active.is_(True))
+        stmt = stmt.order_by(GitRepository.created_at.desc())
+        return list(self.db.execute(stmt).all())
 
     def create_from_form(
         self,
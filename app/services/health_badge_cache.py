@@ -0,0 +1,86 @@
+"""Redis-backed cache of health badge ETags for the instance badge poll.
+
+Every open dashboard polls each instance's badge. The badge only changes when a
+new health check lands or the latest one goes stale, so its ETag is kept in Redis
+and a matching ``If-None-Match`` is answered without querying health checks.
+The health poll task bumps a shared generation after committing new checks,
+which invalidates every cached tag at once. The cache is disabled when
+``REDIS_URL`` is not set or Redis is down.
+"""
+
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+import redis
+
+from app.config import settings as platform_settings
+from app.services.redis_client import get_redis_client, mark_redis_unavailable
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "health:badge"
+_GENERATION_KEY = f"{_KEY_PREFIX}:gen"
+
+
+def _cache_key(instance_id: UUID | str) -> str:
+    return f"{_KEY_PREFIX}:{instance_id}"
+
+
+def get_badge_etag(instance_id: UUID) -> tuple[bytes | None, str | None]:
+    """Return ``(generation, etag)`` for an instance's badge.
+
+    ``etag`` is None on a miss or when the entry predates the current generation. ``generation`` is
+    None when the cache is unavailable; otherwise pass it back to :func:`remember_badge_etag`.
+    """
+    client = get_redis_client()
+    if client is None:
+        return None, None
+    try:
+        generation, entry = client.mget([_GENERATION_KEY, _cache_key(instance_id)])
+    except redis.RedisError as exc:
+        logger.warning("Health badge cache read failed: %s", exc)
+        mark_redis_unavailable()
+        return None, None
+    generation = generation or b"0"
+    if isinstance(entry, bytes):
+        entry_generation, sep, etag = entry.partition(b"|")
+        if sep and entry_generation == generation:
+            return generation, etag.decode("ascii")
+    return generation, None
+
+
+def remember_badge_etag(instance_id: UUID, generation: bytes | None, etag: str, fresh_seconds: int | None) -> None:
+    """Cache a freshly computed badge ETag under the generation read before the health query.
+
+    ``fresh_seconds`` is how long until the latest check goes stale (None if it already is), so a tag
+    never outlives the staleness flip it encodes.
+    """
+    if generation is None:
+        return
+    client = get_redis_client()
+    if client is None:
+        return
+    ttl = max(platform_settings.health_stale_seconds // 2, 1)
+    if fresh_seconds is not None:
+        ttl = min(ttl, fresh_seconds)
+    if ttl <= 0:
+        return
+    try:
+        client.setex(_cache_key(instance_id), ttl, generation + b"|" + etag.encode("ascii"))
+    except redis.RedisError as exc:
+        logger.warning("Health badge cache write failed: %s", exc)
+        mark_redis_unavailable()
+
+
+def invalidate_badge_etags() -> None:
+    """Drop every cached badge ETag after new health checks are committed."""
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.incr(_GENERATION_KEY)
+    except redis.RedisError as exc:
+        logger.warning("Health badge cache invalidation failed: %s", exc)
+        mark_redis_unavailable()
@@ -6,6 +6,7 @@ Includes resource monitoring: CPU, memory, disk, DB size, active connections.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import shlex
@@ -15,8 +16,8 @@ from typing import Any, TypedDict
 from uuid import UUID
 
 import httpx
-from sqlalchemy import delete, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, delete, func, select
+from sqlalchemy.orm import Session, aliased
 
 from app.config import settings as platform_settings
 from app.models.health_check import HealthCheck, HealthStatus
@@ -278,23 +279,19 @@ class HealthService:
         if not instance_ids:
             return {}
 
-        # Subquery: max checked_at per instance_id
-        latest_sub = (
-            select(
-                HealthCheck.instance_id,
-                func.max(HealthCheck.checked_at).label("max_checked_at"),
+        # One pass over the (instance_id, checked_at) index: rank each instance's checks newest first
+        # and keep rank 1. Unlike a max(checked_at) join, two checks with the same timestamp can't both win.
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=HealthCheck.instance_id,
+                order_by=(HealthCheck.checked_at.desc(), HealthCheck.id.desc()),
             )
-            .where(HealthCheck.instance_id.in_(instance_ids))
-            .group_by(HealthCheck.instance_id)
-            .subquery()
-        )
-
-        stmt = select(HealthCheck).join(
-            latest_sub,
-            (HealthCheck.instance_id == latest_sub.c.instance_id)
-            & (HealthCheck.checked_at == latest_sub.c.max_checked_at),
+            .label("rank")
         )
-        checks = list(self.db.scalars(stmt).all())
+        ranked = select(HealthCheck, rank).where(HealthCheck.instance_id.in_(instance_ids)).subquery()
+        latest = aliased(HealthCheck, ranked)
+        checks = self.db.scalars(select(latest).where(ranked.c.rank == 1)).all()
         return {check.instance_id: check for check in checks}
 
     def get_recent_checks(self, instance_id: UUID, limit: int = 20) -> list[HealthCheck]:
@@ -445,8 +442,6 @@ class HealthService:
         with 'instance', 'health', and 'health_state' keys, and etag is a
         content hash for HTMX caching.
         """
-        import hashlib
-
         instance_ids = [inst.instance_id for inst in instances]
         health_map = self.get_latest_checks_batch(instance_ids)
         now = datetime.now(UTC)
@@ -465,27 +460,41 @@ class HealthService:
             etag_parts.append(
                 f"{inst.instance_id}:{inst.status.value}:{health_state}:{check.response_ms if check else ''}"
             )
-        etag = '"' + hashlib.sha256("|".join(etag_parts).encode()).hexdigest()[:16] + '"'
+        etag = '"' + hashlib.blake2b("|".join(etag_parts).encode(), digest_size=8).hexdigest() + '"'
         return instance_data, etag
 
+    def get_badge_fields(self, instance_id: UUID) -> Row | None:
+        """Return just the columns the health badge renders from the latest check.
+
+        The badge is polled by every open dashboard; loading the full row would pull the
+        resource metrics and error text on each hit only to discard them.
+        """
+        stmt = (
+            select(HealthCheck.id, HealthCheck.status, HealthCheck.response_ms, HealthCheck.checked_at)
+            .where(HealthCheck.instance_id == instance_id)
+            .order_by(HealthCheck.checked_at.desc(), HealthCheck.id.desc())
+            .limit(1)
+        )
+        return self.db.execute(stmt).first()
+
     def get_badge_state(self, instance_id: UUID) -> dict:
         """Return health badge data + ETag payload."""
-        import hashlib
-
-        check = self.get_latest_check(instance_id)
+        check = self.get_badge_fields(instance_id)
 
         is_stale = False
-        if check and check.checked_at:
-            age = (datetime.now(UTC) - check.checked_at).total_seconds()
+        fresh_seconds = None
+        checked_at = _as_utc(check.checked_at) if check else None
+        if checked_at:
+            age = (datetime.now(UTC) - checked_at).total_seconds()
             is_stale = age > platform_settings.health_stale_seconds
+            if not is_stale:
+                fresh_seconds = int(platform_settings.health_stale_seconds - age)
 
-        tag_parts = f"{check.status.value if check else 'none'}"
-        tag_parts += f":{check.response_ms if check else ''}"
-        tag_parts += f":{check.checked_at.isoformat() if check and check.checked_at else ''}"
-        tag_parts += f":{is_stale}"
-        etag = '"' + hashlib.sha256(tag_parts.encode()).hexdigest()[:16] + '"'
+        # The check id already pins status, latency and time; staleness is the only other input. Both are
+        # small integers, so they make the tag as they are — there is nothing to gain from hashing them.
+        etag = f'"{check.id if check else 0}-{int(is_stale)}"'
 
-        return {"health": check, "is_stale": is_stale, "etag": etag}
+        return {"health": check, "is_stale": is_stale, "etag": etag, "fresh_seconds": fresh_seconds}
 
     def get_top_resource_consumers(self, limit: int = 5) -> list[_ConsumerRow]:
         """Get instances with highest resource usage from latest health checks."""
@@ -19,9 +19,12 @@ from typing import Any
 from uuid import UUID
 
 from sqlalchemy import String, case, cast, delete, func, literal, or_, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased, joinedload, raiseload
 
+from app.config import settings as platform_settings
 from app.db import Base
+from app.models.catalog import AppCatalogItem
+from app.models.health_check import HealthCheck, HealthStatus
 from app.models.instance import (
     AccountingFramework,
     Instance,
@@ -29,12 +32,30 @@ from app.models.instance import (
     SectorType,
 )
 from app.models.server import Server
+from app.services.approval_service import ApprovalService
+from app.services.backup_service import BackupService
+from app.services.catalog_service import CatalogService
+from app.services.common import validate_git_ref
+from app.services.deploy_service import DeployService
+from app.services.domain_service import DomainService
+from app.services.feature_flag_service import FeatureFlagService
+from app.services.git_repo_service import GitRepoService
+from app.services.health_service import HealthService
+from app.services.module_service import ModuleService
+from app.services.organization_service import OrganizationService
+from app.services.plan_service import PlanService
+from app.services.platform_settings import PlatformSettingsService
+from app.services.resource_enforcement import ResourceEnforcementService
 from app.services.ssh_service import get_ssh_for_server
+from app.services.tenant_audit_service import TenantAuditService
+from app.services.upgrade_service import UpgradeService
 from app.services.view_models import InstanceListItem, PagedResult
 
 logger = logging.getLogger(__name__)
 
 _DOMAIN_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?$")
+# Org codes end up in container names and shell commands; fullmatch also rejects a trailing newline.
+_SLUG_RE = re.compile(r"[a-zA-Z0-9_-]+")
 
 
 def _validate_domain(domain: str) -> str:
@@ -103,6 +124,16 @@ def _sanitize_env_comment(value: str | None) -> str:
     return text.replace("\r\n", " ").replace("\r", " ").replace("\n", " ")
 
 
+def _health_state_case(checked_at: Any, status: Any, stale_cutoff: datetime) -> Any:
+    """SQL mirror of ``HealthService.classify_health`` for a running instance, with "n/a" for the rest."""
+    return case(
+        (Instance.status != InstanceStatus.running, literal("n/a")),
+        (or_(checked_at.is_(None), checked_at < stale_cutoff), literal("unknown")),
+        (status == HealthStatus.healthy, literal("healthy")),
+        else_=literal("unhealthy"),
+    )
+
+
 class InstanceService:
     def __init__(self, db: Session):
         self.db = db
@@ -128,10 +159,34 @@ class InstanceService:
             raise ValueError(f"Instance {instance_id} not found")
         return instance
 
+    def get_with_server(self, instance_id: UUID) -> Instance:
+        """Load an instance with its server joined in, for actions that SSH to the host."""
+        stmt = select(Instance).options(joinedload(Instance.server)).where(Instance.instance_id == instance_id)
+        instance = self.db.scalar(stmt)
+        if not instance:
+            raise ValueError(f"Instance {instance_id} not found")
+        return instance
+
     def get_running(self) -> list[Instance]:
         stmt = select(Instance).where(Instance.status == InstanceStatus.running)
         return list(self.db.scalars(stmt).all())
 
+    def get_list_signature(self) -> str:
+        """Change marker for the instance list page: instance count, last instance write, last health check.
+
+        One aggregate query. Deliberately ignores the page's filters — any change anywhere invalidates every list view.
+        """
+        count, last_update, last_check = self.db.execute(
+            select(
+                func.count(Instance.instance_id),
+                func.max(Instance.updated_at),
+                select(func.max(HealthCheck.checked_at)).scalar_subquery(),
+            )
+        ).one()
+        return (
+            f"{count}:{last_update.isoformat() if last_update else ''}:{last_check.isoformat() if last_check else ''}"
+        )
+
     def list_for_web(
         self,
         *,
@@ -142,15 +197,18 @@ class InstanceService:
         sort_dir: str,
         page: int,
         page_size: int,
+        after: str | None = None,
+        with_total: bool = True,
     ) -> PagedResult[InstanceListItem]:
-        """List instances for the web UI with health + catalog context."""
-        from app.config import settings as platform_settings
-        from app.models.catalog import AppCatalogItem
-        from app.models.health_check import HealthCheck, HealthStatus
-        from app.services.health_service import HealthService
+        """List instances for the web UI with health + catalog context.
 
+        ``after`` is the last ``org_code`` of the previous page. With the default org_code sort it replaces
+        the OFFSET with a seek on the unique index; other sorts ignore it and page by offset.
+        ``with_total=False`` skips the COUNT (``total`` is then 0) for callers that only need the next rows.
+        ``status_filter`` may list several comma-separated statuses.
+        """
         q = (q or "").strip()
-        status_value = (status_filter or "").strip().lower() or None
+        status_values = {v for v in (status_filter or "").lower().replace(" ", "").split(",") if v}
         health_value = (health_filter or "").strip().lower() or None
         sort_key = (sort_key or "").strip().lower()
         now = datetime.now(UTC)
@@ -169,13 +227,14 @@ class InstanceService:
             stmt = stmt.where(search_predicate)
             total_stmt = total_stmt.where(search_predicate)
 
-        if status_value:
+        if status_values:
             try:
-                status_enum = InstanceStatus(status_value)
+                statuses = [InstanceStatus(v) for v in status_values]
             except ValueError:
                 return PagedResult(items=[], total=0, page=page, page_size=page_size)
-            stmt = stmt.where(Instance.status == status_enum)
-            total_stmt = total_stmt.where(Instance.status == status_enum)
+            status_predicate = Instance.status == statuses[0] if len(statuses) == 1 else Instance.status.in_(statuses)
+            stmt = stmt.where(status_predicate)
+            total_stmt = total_stmt.where(status_predicate)
 
         latest_checked_at = None
         health_state_expr = None
@@ -194,15 +253,7 @@ class InstanceService:
                 .limit(1)
                 .scalar_subquery()
             )
-            health_state_expr = case(
-                (Instance.status != InstanceStatus.running, literal("n/a")),
-                (
-                    or_(latest_checked_at.is_(None), latest_checked_at < stale_cutoff),
-                    literal("unknown"),
-                ),
-                (latest_health_status == HealthStatus.healthy, literal("healthy")),
-                else_=literal("unhealthy"),
-            )
+            health_state_expr = _health_state_case(latest_checked_at, latest_health_status, stale_cutoff)
 
         if health_value:
             if health_value not in {"healthy", "unhealthy", "unknown", "n/a"}:
@@ -247,92 +298,74 @@ class InstanceService:
         else:
             stmt = stmt.order_by(sort_expr.asc(), Instance.org_code.asc())
 
-        total = self.db.scalar(total_stmt) or 0
+        total = (self.db.scalar(total_stmt) or 0) if with_total else 0
         offset = max(page - 1, 0) * page_size
-        instances = list(self.db.scalars(stmt.limit(page_size).offset(offset)).all())
-
-        instance_ids = [inst.instance_id for inst in instances]
-        health_svc = HealthService(self.db)
-        health_map = health_svc.get_latest_checks_batch(instance_ids)
-
-        catalog_ids = {inst.catalog_item_id for inst in instances if inst.catalog_item_id}
-        item_map: dict[UUID, AppCatalogItem] = {}
-        if catalog_ids:
-            items = list(
-                self.db.scalars(select(AppCatalogItem).where(AppCatalogItem.catalog_id.in_(catalog_ids))).all()
+        if after and sort_expr is Instance.org_code:
+            stmt = stmt.where(Instance.org_code < after if reverse else Instance.org_code > after)
+            offset = 0
+        # The page's latest health check and catalog label ride along as outer joins, so the page is one round-trip.
+        latest_check = aliased(HealthCheck)
+        latest_check_id = (
+            select(HealthCheck.id)
+            .where(HealthCheck.instance_id == Instance.instance_id)
+            .order_by(HealthCheck.checked_at.desc(), HealthCheck.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        page_stmt = (
+            stmt.outerjoin_from(Instance, latest_check, latest_check.id == latest_check_id)
+            .outerjoin_from(Instance, AppCatalogItem, AppCatalogItem.catalog_id == Instance.catalog_item_id)
+            .add_columns(
+                latest_check,
+                _health_state_case(latest_check.checked_at, latest_check.status, stale_cutoff),
+                AppCatalogItem.label,
+                AppCatalogItem.version,
             )
-            item_map = {item.catalog_id: item for item in items}
+            # The rows only read columns; a relationship touched from the template would be one query per row.
+            .options(raiseload("*"))
+        )
 
         rows: list[InstanceListItem] = []
-        for inst in instances:
-            check = health_map.get(inst.instance_id)
-            health_state = health_svc.classify_health(check, now) if inst.status.value == "running" else "n/a"
-            catalog_item = item_map.get(inst.catalog_item_id) if inst.catalog_item_id else None
+        for inst, check, health_state, catalog_label, release_version in self.db.execute(
+            page_stmt.limit(page_size).offset(offset)
+        ):
             rows.append(
                 InstanceListItem(
                     instance=inst,
                     health=check,
                     health_state=health_state,
                     health_checked_at=check.checked_at if check else None,
-                    catalog_label=catalog_item.label if catalog_item else None,
-                    release_version=catalog_item.version if catalog_item else None,
+                    catalog_label=catalog_label,
+                    release_version=release_version,
                 )
             )
         return PagedResult(items=rows, total=total, page=page, page_size=page_size)
 
-    def get_detail_bundle(self, instance_id: UUID) -> dict:
-        """Collect instance detail data for the web UI."""
-        from app.services.approval_service import ApprovalService
-        from app.services.backup_service import BackupService
-        from app.services.catalog_service import CatalogService
-        from app.services.deploy_service import DeployService
-        from app.services.domain_service import DomainService
-        from app.services.feature_flag_service import FeatureFlagService
-        from app.services.git_repo_service import GitRepoService
-        from app.services.health_service import HealthService
-        from app.services.module_service import ModuleService
-        from app.services.plan_service import PlanService
-        from app.services.resource_enforcement import ResourceEnforcementService
-        from app.services.secret_rotation_service import SecretRotationService
-        from app.services.tenant_audit_service import TenantAuditService
-        from app.services.upgrade_service import UpgradeService
-
-        instance = self.get_or_404(instance_id)
+    def get_detail_bundle(self, instance_id: UUID, tab: str = "modules") -> dict:
+        """Collect instance detail data for the web UI: the page header plus the active tab."""
+        # The page reads the plan and no other relationship, so anything else fails loudly instead of lazy-loading.
+        stmt = (
+            select(Instance)
+            .options(joinedload(Instance.plan), raiseload("*"))
+            .where(Instance.instance_id == instance_id)
+        )
+        instance = self.db.scalar(stmt)
+        if not instance:
+            raise ValueError(f"Instance {instance_id} not found")
         created_at = instance.created_at
         if created_at.tzinfo is None:
             created_at = created_at.replace(tzinfo=UTC)
         uptime_seconds = max(0, int((datetime.now(UTC) - created_at).total_seconds()))
 
         health_svc = HealthService(self.db)
-        latest_health = health_svc.get_latest_check(instance_id)
         recent_checks = health_svc.get_recent_checks(instance_id, limit=10)
+        # Same ordering as get_latest_check, so the newest recent check is the latest one.
+        latest_health = recent_checks[0] if recent_checks else None
+
+        latest_deploy_id, deploy_logs = DeployService(self.db).get_latest_deployment_logs(instance_id)
 
-        deploy_svc = DeployService(self.db)
-        latest_deploy_id = deploy_svc.get_latest_deployment_id(instance_id)
-        deploy_logs = []
-        if latest_deploy_id:
-            deploy_logs = deploy_svc.get_deployment_logs(instance_id, latest_deploy_id)
-
-        modules = ModuleService(self.db).get_instance_modules(instance_id)
-        flags = FeatureFlagService(self.db).list_for_instance(instance_id)
-        plans = PlanService(self.db).list_all()
-        backups = BackupService(self.db).list_for_instance(instance_id)
-        domain_svc = DomainService(self.db)
-        domains = domain_svc.list_for_instance(instance_id)
-        now = datetime.now(UTC)
-        cutoff = now + timedelta(days=14)
-        expiring_certs = [d for d in domains if d.ssl_expires_at is not None and d.ssl_expires_at <= cutoff]
-        audit_logs = TenantAuditService(self.db).get_logs(instance_id, limit=20)
-        enforcement_svc = ResourceEnforcementService(self.db)
-        usage_summary = enforcement_svc.get_usage_summary(instance_id)
-        compliance_violations = enforcement_svc.check_plan_compliance(instance_id)
-        rotation_history = SecretRotationService(self.db).get_rotation_history(instance_id, limit=20)
         repos = GitRepoService(self.db).list_repos(active_only=True)
         catalog_items = CatalogService(self.db).list_catalog_items(active_only=True)
-        catalog_map = {item.catalog_id: item for item in catalog_items}
-        upgrades = UpgradeService(self.db).list_upgrades(instance_id, limit=20)
-
-        pending_upgrade_ids = {a.upgrade_id for a in ApprovalService(self.db).get_pending(instance_id) if a.upgrade_id}
 
         return {
             "instance": instance,
@@ -340,40 +373,67 @@ class InstanceService:
             "recent_checks": recent_checks,
             "deploy_logs": deploy_logs,
             "latest_deploy_id": latest_deploy_id,
-            "modules": modules,
-            "flags": flags,
-            "plans": plans,
-            "backups": backups,
-            "domains": domains,
-            "expiring_certs": expiring_certs,
-            "audit_logs": audit_logs,
-            "usage_summary": usage_summary,
-            "compliance_violations": compliance_violations,
-            "rotation_history": rotation_history,
             "repos": repos,
             "catalog_items": catalog_items,
-            "catalog_map": catalog_map,
-            "upgrades": upgrades,
-            "pending_upgrade_ids": pending_upgrade_ids,
             "uptime_seconds": uptime_seconds,
+            **self.get_detail_tab(instance_id, tab, catalog_items=catalog_items),
         }
 
+    def get_detail_tab(self, instance_id: UUID, tab: str, catalog_items: list[AppCatalogItem] | None = None) -> dict:
+        """Collect the data one detail tab renders, so the other tabs' queries wait until they are opened."""
+        if tab == "modules":
+            return {"modules": ModuleService(self.db).get_instance_modules(instance_id)}
+        if tab == "flags":
+            return {"flags": FeatureFlagService(self.db).list_for_instance(instance_id)}
+        if tab == "plan":
+            flags = FeatureFlagService(self.db).list_for_instance(instance_id)
+            enforcement_svc = ResourceEnforcementService(self.db)
+            usage_summary = enforcement_svc.get_usage_summary(instance_id)
+            return {
+                "plans": PlanService(self.db).list_all(),
+                "usage_summary": usage_summary,
+                "compliance_violations": enforcement_svc.check_plan_compliance(
+                    instance_id, usage_summary=usage_summary, flag_entries=flags
+                ),
+            }
+        if tab == "upgrades":
+            if catalog_items is None:
+                catalog_items = CatalogService(self.db).list_catalog_items(active_only=True)
+            return {
+                "catalog_items": catalog_items,
+                "catalog_map": {item.catalog_id: item for item in catalog_items},
+                "upgrades": UpgradeService(self.db).list_upgrades(instance_id, limit=20),
+                "pending_upgrade_ids": ApprovalService(self.db).get_pending_upgrade_ids(instance_id),
+            }
+        if tab == "secrets":
+            # Deferred: secret_rotation_service imports parse_env_file from this module.
+            from app.services.secret_rotation_service import SecretRotationService
+
+            return {"rotation_history": SecretRotationService(self.db).get_rotation_history(instance_id, limit=20)}
+        if tab == "backups":
+            return {"backups": BackupService(self.db).list_for_instance(instance_id)}
+        if tab == "domains":
+            domains = DomainService(self.db).list_for_instance(instance_id)
+            cutoff = datetime.now(UTC) + timedelta(days=14)
+            return {
+                "domains": domains,
+                "expiring_certs": [d for d in domains if d.ssl_expires_at is not None and d.ssl_expires_at <= cutoff],
+            }
+        if tab == "audit":
+            return {"audit_logs": TenantAuditService(self.db).get_logs(instance_id, limit=20)}
+        raise ValueError(f"Unknown detail tab: {tab}")
+
     def resolve_catalog_repo(self, catalog_id: UUID) -> tuple[UUID, str | None]:
         """Validate catalog item and return (repo_id, git_ref)."""
-        from app.services.catalog_service import CatalogService
-        from app.services.git_repo_service import GitRepoService
-
         item = CatalogService(self.db).get_catalog_item(catalog_id)
         if not item or not item.is_active:
             raise ValueError("Selected catalog item is invalid")
-        repo = GitRepoService(self.db).get_by_id(UUID(str(item.git_repo_id)))
+        repo = GitRepoService(self.db).get_by_id(item.git_repo_id)
         if not repo or not repo.is_active:
             raise ValueError("Catalog item registry is invalid")
         return repo.repo_id, item.git_ref
 
     def set_git_repo(self, instance_id: UUID, git_repo_id: UUID) -> None:
-        from app.services.git_repo_service import GitRepoService
-
         instance = self.get_or_404(instance_id)
         repo = GitRepoService(self.db).get_by_id(git_repo_id)
         if not repo or not repo.is_active:
@@ -389,8 +449,6 @@ class InstanceService:
     def assign_plan(self, instance_id: UUID, plan_id: UUID | None) -> Instance:
         instance = self.get_or_404(instance_id)
         if plan_id is not None:
-            from app.services.plan_service import PlanService
-
             plan = PlanService(self.db).get_by_id(plan_id)
             if not plan:
                 raise ValueError("Plan not found")
@@ -448,8 +506,6 @@ class InstanceService:
         # Auto-deploy when admin password is provided
         deployment_id: str | None = None
         if admin_password:
-            from app.services.deploy_service import DeployService
-
             deployment_id = DeployService(self.db).create_deployment(
                 instance.instance_id,
                 admin_password,
@@ -465,8 +521,6 @@ class InstanceService:
         git_branch: str | None = None,
         git_tag: str | None = None,
     ) -> Instance:
-        from app.services.common import validate_git_ref
-
         instance = self.get_or_404(instance_id)
         if git_branch:
             instance.git_branch = validate_git_ref(git_branch, "git_branch")
@@ -520,7 +574,7 @@ class InstanceService:
         org_code = org_code.upper()
 
         # Validate org_code — used in container names and shell commands
-        if not re.match(r"^[A-Z0-9_-]+$", org_code):
+        if not _SLUG_RE.fullmatch(org_code):
             raise ValueError(f"Invalid org_code: {org_code!r} — must be alphanumeric, hyphens, or underscores")
 
         # Auto-allocate ports if not specified
@@ -534,13 +588,9 @@ class InstanceService:
         org_uuid = str(uuid.uuid4())
 
         # Resolve deploy path and app URL
-        from app.services.platform_settings import PlatformSettingsService
-
         ps = PlatformSettingsService(self.db)
         default_deploy = ps.get("default_deploy_path")
 
-        from app.services.organization_service import OrganizationService
-
         org = OrganizationService(self.db).get_or_create(org_code, org_name)
 
         server = self.db.get(Server, server_id)
@@ -580,10 +630,6 @@ class InstanceService:
         self.db.flush()
         if catalog_item_id:
             try:
-                from app.services.catalog_service import CatalogService
-                from app.services.feature_flag_service import FeatureFlagService
-                from app.services.module_service import ModuleService
-
                 catalog_item = CatalogService(self.db).get_catalog_item(catalog_item_id)
                 if catalog_item:
                     mod_svc = ModuleService(self.db)
@@ -606,7 +652,7 @@ class InstanceService:
         return instance
 
     def _exec_compose(self, instance: Instance, command: str) -> None:
-        server = self.db.get(Server, instance.server_id)
+        server = instance.server
         if not server or not instance.deploy_path:
             raise ValueError("Instance server or deploy path not configured")
         ssh = get_ssh_for_server(server)
@@ -616,7 +662,7 @@ class InstanceService:
             raise ValueError(detail)
 
     def start_instance(self, instance_id: UUID) -> Instance:
-        instance = self.get_or_404(instance_id)
+        instance = self.get_with_server(instance_id)
         if instance.status != InstanceStatus.stopped:
             raise ValueError("Instance is not stopped")
         try:
@@ -630,7 +676,7 @@ class InstanceService:
         return instance
 
     def stop_instance(self, instance_id: UUID) -> Instance:
-        instance = self.get_or_404(instance_id)
+        instance = self.get_with_server(instance_id)
         if instance.status != InstanceStatus.running:
             raise ValueError("Instance is not running")
         try:
@@ -644,7 +690,7 @@ class InstanceService:
         return instance
 
     def restart_instance(self, instance_id: UUID) -> Instance:
-        instance = self.get_or_404(instance_id)
+        instance = self.get_with_server(instance_id)
         if instance.status != InstanceStatus.running:
             raise ValueError("Instance is not running")
         try:
@@ -658,13 +704,11 @@ class InstanceService:
 
     def migrate_instance(self, instance_id: UUID) -> Instance:
         """Run alembic migrations inside an instance's app container."""
-        import shlex
-
-        instance = self.get_or_404(instance_id)
+        instance = self.get_with_server(instance_id)
         slug = instance.org_code.lower()
-        if not re.match(r"^[a-zA-Z0-9_-]+$", slug):
+        if not _SLUG_RE.fullmatch(slug):
             raise ValueError(f"Invalid org_code slug: {slug!r}")
-        server = self.db.get(Server, instance.server_id)
+        server = instance.server
         if not server:
             raise ValueError("Server not found for instance")
         ssh = get_ssh_for_server(server)
@@ -682,6 +726,30 @@ class InstanceService:
 
     def delete(self, instance_id: UUID) -> None:
         instance = self.get_or_404(instance_id)
+        self._delete_dependent_rows(instance_id)
+        self.db.delete(instance)
+        self.db.flush()
+
+    def delete_if_not_running(self, instance_id: UUID) -> bool:
+        """Delete a stopped/failed instance without loading it; False if it is running or missing.
+
+        The final DELETE re-checks the status, so an instance started mid-way is left alone and the dependent-row
+        cleanup is rolled back by the caller along with it.
+        """
+        status = self.db.scalar(select(Instance.status).where(Instance.instance_id == instance_id))
+        if status is None or status == InstanceStatus.running:
+            return False
+        self._delete_dependent_rows(instance_id)
+        deleted = self.db.scalar(
+            delete(Instance)
+            .where(Instance.instance_id == instance_id, Instance.status != InstanceStatus.running)
+            .returning(Instance.instance_id)
+        )
+        if deleted is None:
+            raise ValueError("Instance started while being deleted")
+        return True
+
+    def _delete_dependent_rows(self, instance_id: UUID) -> None:
         instance_table = Instance.__table__
 
         # Manually clean dependent rows because many FKs to instances do not
@@ -709,9 +777,6 @@ class InstanceService:
             if required_cols:
                 self.db.execute(delete(table).where(or_(*[col == instance_id for col in required_cols])))
 
-        self.db.delete(instance)
-        self.db.flush()
-
     # ---------------------------------------------------------------
     # File generation (mirrors bootstrap_instance.py from dotmac ERP)
     # ---------------------------------------------------------------
@@ -845,8 +910,6 @@ class InstanceService:
 
         # --- Inject feature flags ---
         try:
-            from app.services.feature_flag_service import FeatureFlagService
-
             flag_svc = FeatureFlagService(self.db)
             flag_vars = flag_svc.get_env_vars(instance.instance_id)
             if flag_vars:
@@ -860,8 +923,6 @@ class InstanceService:
         # --- Inject plan limits ---
         if instance.plan_id:
             try:
-                from app.services.plan_service import PlanService
-
                 plan_svc = PlanService(self.db)
                 plan = plan_svc.get_by_id(instance.plan_id)
                 if plan:
@@ -1278,8 +1339,6 @@ class InstanceService:
         # Resolve container image ref from the repo's registry URL
         image_ref: str | None = None
         try:
-            from app.services.git_repo_service import GitRepoService
-
             repo = GitRepoService(self.db).get_repo_for_instance(instance.instance_id)
             if repo and repo.registry_url:
                 image_ref = GitRepoService.resolve_image_ref(repo, git_ref=git_ref, instance=instance)
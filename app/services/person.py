@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from time import monotonic
 from typing import Any
 
 from fastapi import HTTPException
@@ -16,6 +17,7 @@ import builtins
 from app.models.person import Person, PersonStatus
 from app.models.rbac import PersonRole, Role
 from app.schemas.person import PersonCreate, PersonUpdate
+from app.services.bounded_cache import BoundedCache
 from app.services.common import apply_ordering, apply_pagination, coerce_uuid
 from app.services.response import ListResponseMixin
 
@@ -29,6 +31,32 @@ def _validate_enum(value: str | None, enum_cls: type, label: str) -> Any:
         raise HTTPException(status_code=400, detail=f"Invalid {label}") from exc
 
 
+_PERSON_DISPLAY_CACHE: BoundedCache[str, tuple[str, str, float]] = BoundedCache(20000)
+_PERSON_DISPLAY_CACHE_TTL_SECONDS = 300.0
+
+
+def person_display(person: Person) -> tuple[str, str]:
+    """Return ``(name, initials)`` for a person, memoized per person id."""
+    key = str(person.id)
+    now = monotonic()
+    cached = _PERSON_DISPLAY_CACHE.get(key)
+    if cached and now - cached[2] < _PERSON_DISPLAY_CACHE_TTL_SECONDS:
+        return cached[0], cached[1]
+
+    name = person.display_name or f"{person.first_name} {person.last_name}"
+    first_initial = person.first_name[0] if person.first_name else ""
+    last_initial = person.last_name[0] if person.last_name else ""
+    initials = (first_initial + last_initial).upper() or "?"
+
+    _PERSON_DISPLAY_CACHE.set(key, (name, initials, now))
+    return name, initials
+
+
+def invalidate_person_display(person_id: str | uuid.UUID) -> None:
+    """Drop the memoized display name/initials after a person record changes."""
+    _PERSON_DISPLAY_CACHE.pop(str(person_id))
+
+
 class People(ListResponseMixin):
     @staticmethod
     def create(db: Session, payload: PersonCreate):
@@ -211,6 +239,7 @@ class People(ListResponseMixin):
                 setattr(person, key, value)
         db.flush()
         db.refresh(person)
+        invalidate_person_display(person.id)
         return person
 
     @staticmethod
@@ -222,6 +251,7 @@ class People(ListResponseMixin):
             raise HTTPException(status_code=404, detail="Person not found")
         db.delete(person)
         db.flush()
+        invalidate_person_display(person.id)
 
 
 people = People()
@@ -12,6 +12,7 @@ from app.models.person import Person
 from app.services import avatar as avatar_service
 from app.services.auth_flow import hash_password, revoke_sessions_for_person, verify_password
 from app.services.common import coerce_uuid
+from app.services.person import invalidate_person_display
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,7 @@ def update_profile(db: Session, person_id: str, fields: dict[str, object]) -> Pe
             setattr(person, field, value)
     db.flush()
     db.refresh(person)
+    invalidate_person_display(person.id)
     return person
 
 
@@ -0,0 +1,63 @@
+"""Process-wide Redis client shared by the auth and health badge caches.
+
+The client is created lazily from ``REDIS_URL`` and rebuilt if the URL changes.
+When Redis cannot be reached, callers get ``None`` for a short backoff window
+instead of paying a connection timeout on every request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+_RETRY_SECONDS = 5
+
+_lock = threading.Lock()
+_client: redis.Redis | None = None
+_client_url: str | None = None
+_retry_after = 0.0
+
+
+def get_redis_client(ignore_backoff: bool = False) -> redis.Redis | None:
+    """Return the shared client, or ``None`` if Redis is unset or backing off.
+
+    ``ignore_backoff`` forces a connection attempt during the backoff window,
+    for writes that must not be dropped (e.g. session invalidations).
+    """
+    global _client, _client_url, _retry_after
+    url = os.getenv("REDIS_URL")
+    with _lock:
+        if not url:
+            _client = None
+            _client_url = None
+            return None
+        if _client is not None and _client_url == url:
+            return _client
+        now = time.time()
+        if now < _retry_after and not ignore_backoff:
+            return None
+        try:
+            client = redis.Redis.from_url(url, socket_timeout=2)
+            client.ping()
+        except redis.RedisError as exc:
+            logger.warning("Redis unavailable: %s", exc)
+            _client = None
+            _retry_after = now + _RETRY_SECONDS
+            return None
+        _client = client
+        _client_url = url
+        return client
+
+
+def mark_redis_unavailable() -> None:
+    """Drop the shared client after a command failed and start the backoff window."""
+    global _client, _retry_after
+    with _lock:
+        _client = None
+        _retry_after = time.time() + _RETRY_SECONDS
@@ -35,7 +35,14 @@ class ResourceEnforcementService:
     def __init__(self, db: Session):
         self.db = db
 
-    def check_plan_compliance(self, instance_id: UUID) -> list[PlanViolation]:
+    def check_plan_compliance(
+        self,
+        instance_id: UUID,
+        *,
+        usage_summary: dict | None = None,
+        flag_entries: list[dict] | None = None,
+    ) -> list[PlanViolation]:
+        """List plan violations; callers that already hold the usage summary or flag list can pass them in."""
         instance, plan = self._get_instance_and_plan(instance_id)
         if not instance or not plan:
             return []
@@ -58,7 +65,8 @@ class ResourceEnforcementService:
 
         # Flags (only if enabled/true)
         if plan.allowed_flags:
-            flag_entries = FeatureFlagService(self.db).list_for_instance(instance_id)
+            if flag_entries is None:
+                flag_entries = FeatureFlagService(self.db).list_for_instance(instance_id)
             for entry in flag_entries:
                 if _is_truthy(entry["value"]) and entry["key"] not in plan.allowed_flags:
                     violations.append(
@@ -71,7 +79,7 @@ class ResourceEnforcementService:
                     )
 
         # Usage limits
-        summary = self.get_usage_summary(instance_id)
+        summary = usage_summary if usage_summary is not None else self.get_usage_summary(instance_id)
         users_violation = _limit_violation(
             kind="users",
             label="Active users",
@@ -6,9 +6,10 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime
+from time import monotonic
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, event, select
 from sqlalchemy.orm import Session
 
 from app.models.catalog import AppCatalogItem
@@ -17,6 +18,34 @@ from app.services.ssh_service import get_ssh_for_server
 
 logger = logging.getLogger(__name__)
 
+# Instance-form server rows. They are plain column tuples, so they are safe to share across sessions. Writes through
+# ServerService drop them once their transaction ends; the TTL bounds how stale another worker's copy can get.
+_FORM_ROWS_CACHE: tuple[list[Row], float] | None = None
+_FORM_ROWS_CACHE_TTL_SECONDS = 30.0
+_PENDING_INFO_KEY = "server_service.form_rows_dirty"
+
+
+def invalidate_server_form_rows() -> None:
+    """Drop the memoized instance-form server rows after a server is created, changed or deleted."""
+    global _FORM_ROWS_CACHE
+    _FORM_ROWS_CACHE = None
+
+
+def invalidate_server_form_rows_on_commit(db: Session) -> None:
+    """Queue :func:`invalidate_server_form_rows` for when ``db`` commits or rolls back.
+
+    Dropping the rows at flush time would let a concurrent request re-cache the pre-commit list.
+    """
+    db.info[_PENDING_INFO_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _apply_pending_form_rows_invalidation(session: Session) -> None:
+    # A rollback still invalidates: this session may have memoized its own uncommitted rows.
+    if session.info.pop(_PENDING_INFO_KEY, False):
+        invalidate_server_form_rows()
+
 
 class ServerService:
     def __init__(self, db: Session):
@@ -26,6 +55,18 @@ class ServerService:
         stmt = select(Server).order_by(Server.created_at.desc())
         return list(self.db.scalars(stmt).all())
 
+    def list_for_form(self) -> list[Row]:
+        """Servers as ``(server_id, name, hostname)`` rows for the instance form's select, newest first."""
+        global _FORM_ROWS_CACHE
+        now = monotonic()
+        cached = _FORM_ROWS_CACHE
+        if cached and now - cached[1] < _FORM_ROWS_CACHE_TTL_SECONDS:
+            return cached[0]
+        stmt = select(Server.server_id, Server.name, Server.hostname).order_by(Server.created_at.desc())
+        rows = list(self.db.execute(stmt).all())
+        _FORM_ROWS_CACHE = (rows, now)
+        return rows
+
     def get_by_id(self, server_id: UUID) -> Server | None:
         return self.db.get(Server, server_id)
 
@@ -58,6 +99,7 @@ class ServerService:
         )
         self.db.add(server)
         self.db.flush()
+        invalidate_server_form_rows_on_commit(self.db)
         logger.info("Created server: %s (%s)", name, hostname)
         return server
 
@@ -77,6 +119,7 @@ class ServerService:
             if key in allowed and value is not None:
                 setattr(server, key, value)
         self.db.flush()
+        invalidate_server_form_rows_on_commit(self.db)
         return server
 
     def delete(self, server_id: UUID) -> None:
@@ -89,6 +132,7 @@ class ServerService:
             )
         self.db.delete(server)
         self.db.flush()
+        invalidate_server_form_rows_on_commit(self.db)
         logger.info("Deleted server: %s", server.name)
 
     def test_connectivity(self, server_id: UUID) -> dict:
@@ -13,6 +13,7 @@ import shlex
 import threading
 import time
 from base64 import b64encode
+from collections.abc import Callable
 from hashlib import sha256
 from typing import Any, TypedDict, cast
 
@@ -66,7 +67,7 @@ def _circuit_record_failure(server_id: str | None) -> None:
             )
 
 
-# Connection cache: server_id -> {"client": SSHClient, "ts": float, "lock": Lock}
+# Connection cache: server_id -> {"client": SSHClient, "ts": last-used time, "lock": Lock}
 class _PoolEntry(TypedDict):
     client: Any
     ts: float
@@ -75,11 +76,17 @@ class _PoolEntry(TypedDict):
 
 _SSH_POOL: dict[str, _PoolEntry] = {}
 _SSH_POOL_LOCK = threading.Lock()
-_POOL_TTL = 300  # 5 minutes
+_POOL_TTL = 300  # 5 minutes idle
 _POOL_MAX = 100
 _SSH_CONNECT_TIMEOUT = int(os.getenv("SSH_CONNECT_TIMEOUT", "10"))
 _SSH_BANNER_TIMEOUT = int(os.getenv("SSH_BANNER_TIMEOUT", "45"))
 _SSH_AUTH_TIMEOUT = int(os.getenv("SSH_AUTH_TIMEOUT", "45"))
+# Keeps pooled connections from being dropped by NAT/firewall idle timeouts; 0 disables.
+_SSH_KEEPALIVE = int(os.getenv("SSH_KEEPALIVE", "30"))
+
+
+class _StaleConnectionError(Exception):
+    """A channel could not be opened on a pooled connection."""
 
 
 class SSHResult:
@@ -124,21 +131,23 @@ class SSHService:
         """Get or create an SSH client, with connection caching and circuit breaker."""
         _circuit_check(self.server_id)
 
+        # Only in-memory checks under the global lock; a dead peer is caught by the transport keepalive
+        # or by exec_command's reconnect-and-retry, and the stale client is closed outside the lock.
+        stale = None
         with _SSH_POOL_LOCK:
-            if self.server_id and self.server_id in _SSH_POOL:
-                entry = _SSH_POOL[self.server_id]
-                client = entry["client"]
-                ts = entry["ts"]
-                if time.time() - ts < _POOL_TTL:
-                    transport = client.get_transport()
-                    if transport and transport.is_active():
-                        return client
-                # Stale connection
-                try:
-                    client.close()
-                except Exception:
-                    pass
-                del _SSH_POOL[self.server_id]
+            entry = _SSH_POOL.get(self.server_id) if self.server_id else None
+            if entry is not None:
+                now = time.time()
+                transport = entry["client"].get_transport()
+                if now - entry["ts"] < _POOL_TTL and transport and transport.is_active():
+                    entry["ts"] = now
+                    return entry["client"]
+                stale = _SSH_POOL.pop(cast(str, self.server_id))["client"]
+        if stale is not None:
+            try:
+                stale.close()
+            except Exception:
+                pass
 
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.WarningPolicy())
@@ -181,6 +190,9 @@ class SSHService:
                             f"expected={self.expected_host_key_fingerprint} actual={remote_fp}"
                         )
                 _circuit_record_success(self.server_id)
+                transport = client.get_transport()
+                if transport and _SSH_KEEPALIVE:
+                    transport.set_keepalive(_SSH_KEEPALIVE)
                 break
             except Exception as e:
                 last_err = e
@@ -233,15 +245,12 @@ class SSHService:
 
         logger.info("SSH exec [%s]: %s", self.hostname, full_cmd[:200])
 
-        client = self._get_client()
-        lock = None
-        if self.server_id:
-            with _SSH_POOL_LOCK:
-                entry = _SSH_POOL.get(self.server_id)
-                lock = entry.get("lock") if entry else None
-
-        def _run() -> SSHResult:
-            _, stdout_ch, stderr_ch = client.exec_command(full_cmd, timeout=timeout)
+        def _run(client: paramiko.SSHClient) -> SSHResult:
+            try:
+                _, stdout_ch, stderr_ch = client.exec_command(full_cmd, timeout=timeout)
+            except (paramiko.SSHException, EOFError, OSError) as exc:
+                # The command never started, so it is safe to retry on a fresh connection.
+                raise _StaleConnectionError(str(exc)) from exc
             channel = stdout_ch.channel
             stdout_chunks: list[bytes] = []
             stderr_chunks: list[bytes] = []
@@ -267,10 +276,29 @@ class SSHService:
             exit_code = channel.recv_exit_status()
             return SSHResult(exit_code, stdout, stderr)
 
+        try:
+            return self._run_on_pooled_client(_run)
+        except _StaleConnectionError as exc:
+            # The pooled connection was dropped by the peer (keepalive had not noticed yet); reconnect once.
+            logger.info("SSH connection to %s is dead (%s); reconnecting", self.hostname, exc)
+            self.close()
+            try:
+                return self._run_on_pooled_client(_run)
+            except _StaleConnectionError as retry_exc:
+                raise cast(BaseException, retry_exc.__cause__) from None
+
+    def _run_on_pooled_client(self, run: Callable[[paramiko.SSHClient], SSHResult]) -> SSHResult:
+        """Run ``run`` on the pooled client, serialised by that connection's own lock."""
+        client = self._get_client()
+        lock = None
+        if self.server_id:
+            with _SSH_POOL_LOCK:
+                entry = _SSH_POOL.get(self.server_id)
+                lock = entry.get("lock") if entry else None
         if lock:
             with lock:
-                return _run()
-        return _run()
+                return run(client)
+        return run(client)
 
     def _exec_local(self, command: str, timeout: int, cwd: str | None) -> SSHResult:
         """Execute a command locally (for is_local servers)."""
@@ -94,12 +94,12 @@ class UpgradeService:
         try:
             upgrade.status = UpgradeStatus.running
             upgrade.started_at = datetime.now(UTC)
-            # NOTE: Intentional commit (not flush) — called from Celery tasks,
-            # intermediate commits are required for real-time progress visibility.
-            self.db.commit()
-
             # Update instance catalog selection
             instance.catalog_item_id = catalog_item.catalog_id
+            # NOTE: Intentional commit (not flush) — called from Celery tasks,
+            # intermediate commits are required for real-time progress visibility.
+            # One commit covers both updates, so the upgrade never shows as running
+            # against the old catalog item.
             self.db.commit()
 
             # Deploy using catalog item git_ref
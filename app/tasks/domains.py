@@ -0,0 +1,40 @@
+"""Domain Tasks — Celery tasks for the SSH-backed domain verify/remove actions."""
+
+import logging
+from uuid import UUID
+
+from celery import shared_task
+
+from app.db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def verify_domain_task(instance_id: str, domain_id: str) -> dict:
+    with SessionLocal() as db:
+        from app.services.domain_service import DomainService
+
+        try:
+            result = DomainService(db).verify_domain(UUID(instance_id), UUID(domain_id))
+        except Exception as e:
+            db.rollback()
+            logger.exception("Failed to verify domain %s", domain_id)
+            return {"verified": False, "error": str(e)}
+        db.commit()
+        return result
+
+
+@shared_task
+def remove_domain_task(instance_id: str, domain_id: str) -> dict:
+    with SessionLocal() as db:
+        from app.services.domain_service import DomainService
+
+        try:
+            DomainService(db).remove_domain(UUID(instance_id), UUID(domain_id))
+        except Exception as e:
+            db.rollback()
+            logger.exception("Failed to remove domain %s", domain_id)
+            return {"success": False, "error": str(e)}
+        db.commit()
+        return {"success": True}
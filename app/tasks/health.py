@@ -7,6 +7,7 @@ import logging
 from celery import shared_task
 
 from app.db import SessionLocal
+from app.services.health_badge_cache import invalidate_badge_etags
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ def poll_instance_health(self) -> dict:
         results = svc.poll_all_running()
         svc.prune_all_old_checks()
         db.commit()
+    invalidate_badge_etags()
 
     logger.info(
         "Health poll complete: %s healthy, %s unhealthy, %s unreachable (of %s)",
@@ -0,0 +1,47 @@
+"""Instance Operation Tasks — Celery tasks for the SSH-backed start/stop/restart/migrate actions."""
+
+import logging
+from uuid import UUID
+
+from celery import shared_task
+
+from app.db import SoftCommitSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _run_instance_op(instance_id: str, op: str) -> dict:
+    # These only record the container status; a lost flip is fixed by re-running the idempotent compose action.
+    with SoftCommitSessionLocal() as db:
+        from app.services.instance_service import InstanceService
+
+        run = getattr(InstanceService(db), f"{op}_instance")
+        try:
+            run(UUID(instance_id))
+        except Exception as e:
+            # start/stop/restart flag the instance as errored before raising; keep that status.
+            db.commit()
+            logger.exception("Failed to %s instance %s", op, instance_id)
+            return {"success": False, "error": str(e)}
+        db.commit()
+        return {"success": True}
+
+
+@shared_task
+def start_instance_task(instance_id: str) -> dict:
+    return _run_instance_op(instance_id, "start")
+
+
+@shared_task
+def stop_instance_task(instance_id: str) -> dict:
+    return _run_instance_op(instance_id, "stop")
+
+
+@shared_task
+def restart_instance_task(instance_id: str) -> dict:
+    return _run_instance_op(instance_id, "restart")
+
+
+@shared_task
+def migrate_instance_task(instance_id: str) -> dict:
+    return _run_instance_op(instance_id, "migrate")
@@ -7,15 +7,13 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin, validate_csrf_token
+from app.web.helpers import ctx, require_admin, templates, validate_csrf_token
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/approvals")
 
 
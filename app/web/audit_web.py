@@ -6,16 +6,14 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.services import audit as audit_service
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin
+from app.web.helpers import ctx, require_admin, templates
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/audit")
 
 
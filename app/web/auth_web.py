@@ -6,16 +6,14 @@ import logging
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.rate_limit import login_limiter, password_reset_limiter
 from app.web.deps import WebAuthContext, get_db, optional_web_auth
-from app.web.helpers import ctx, validate_csrf_token
+from app.web.helpers import ctx, templates, validate_csrf_token
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter()
 
 
@@ -6,14 +6,12 @@ import logging
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse, Response
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx
+from app.web.helpers import ctx, templates
 
 logger = logging.getLogger(__name__)
-templates = Jinja2Templates(directory="templates")
 router = APIRouter()
 
 
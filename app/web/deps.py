@@ -6,27 +6,21 @@ Uses cookie-based JWT auth with the starter's existing auth system.
 
 from __future__ import annotations
 
-from datetime import UTC
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.db import SessionLocal
+from app.db import ReadSessionLocal, SessionLocal
 from app.models.auth import Session as AuthSession
 from app.models.auth import SessionStatus
 from app.models.person import Person
 from app.models.rbac import PersonRole, Role
+from app.services.auth_cache import SessionState, get_session_state
 from app.services.auth_flow import AuthFlow, decode_access_token, hash_session_token
 from app.services.common import coerce_uuid
-
-
-def _as_utc(dt):
-    if dt is None:
-        return None
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=UTC)
-    return dt.astimezone(UTC)
+from app.services.person import person_display
 
 
 def get_db():
@@ -37,9 +31,32 @@ def get_db():
         db.close()
 
 
+# Set on a write's redirect so the follow-up GET reads the primary instead of a lagging replica.
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_SECONDS = 10
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)):
+    """Session for GET pages that never write.
+
+    Without a replica this is the request's primary session, the one ``require_web_auth`` already holds, so
+    a page never waits on a second connection from the same pool. Right after a write it is the primary too.
+    """
+    if ReadSessionLocal is None or request.cookies.get(READ_PRIMARY_COOKIE):
+        yield db
+        return
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
+
 class WebAuthContext:
     """Authentication context for web routes."""
 
+    __slots__ = ("is_authenticated", "person_id", "org_id", "user_name", "user_initials", "roles", "is_admin")
+
     def __init__(
         self,
         is_authenticated: bool = False,
@@ -55,29 +72,50 @@ class WebAuthContext:
         self.user_name = user_name
         self.user_initials = user_initials
         self.roles = roles or []
+        # Checked on every admin route; roles are fixed once the context is built.
+        self.is_admin = "admin" in self.roles
 
-    @property
-    def is_admin(self) -> bool:
-        return "admin" in self.roles
+
+class _LoginRedirect(HTTPException):
+    """Redirect to the login page, raised by the web auth dependencies."""
+
+    def __init__(self) -> None:
+        super().__init__(status_code=302, headers={"Location": "/login"})
 
 
 def _extract_token(request: Request) -> str | None:
-    """Extract JWT from cookie or Authorization header."""
+    """Extract JWT from cookie or Authorization header.
+
+    Scans the raw ASGI headers once rather than going through ``request.cookies``,
+    which parses every cookie on the request just to read one of them.
+    """
+    cookie_header: bytes | None = None
+    auth_header: bytes | None = None
+    for key, value in request.scope.get("headers", ()):
+        if key == b"cookie":
+            if cookie_header is None:
+                cookie_header = value
+        elif key == b"authorization" and auth_header is None:
+            auth_header = value
+
     # Check cookie first
-    token = request.cookies.get("access_token")
-    if token:
-        return token
+    if cookie_header:
+        token = b""
+        for chunk in cookie_header.split(b";"):
+            name, sep, value = chunk.partition(b"=")
+            if sep and name.strip() == b"access_token":
+                token = value.strip()
+        if token:
+            return token.decode("latin-1")
 
     # Fall back to Authorization header
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        return auth_header[7:]
+    if auth_header and auth_header.startswith(b"Bearer "):
+        return auth_header[7:].decode("latin-1")
 
     return None
 
 
-def _person_roles(db: Session, person_id: str) -> list[str]:
-    person_uuid = coerce_uuid(person_id)
+def _person_roles(db: Session, person_uuid: UUID) -> list[str]:
     stmt = (
         select(Role.name)
         .join(PersonRole, PersonRole.role_id == Role.id)
@@ -88,10 +126,7 @@ def _person_roles(db: Session, person_id: str) -> list[str]:
 
 
 def _build_auth_context(person: Person, org_id: str | None, roles: list[str] | None = None) -> WebAuthContext:
-    name = person.display_name or f"{person.first_name} {person.last_name}"
-    first_initial = person.first_name[0] if person.first_name else ""
-    last_initial = person.last_name[0] if person.last_name else ""
-    initials = (first_initial + last_initial).upper() or "?"
+    name, initials = person_display(person)
     return WebAuthContext(
         is_authenticated=True,
         person_id=str(person.id),
@@ -108,8 +143,6 @@ def _context_from_refresh_cookie(request: Request, db: Session) -> WebAuthContex
     if not refresh_token:
         return WebAuthContext()
 
-    from datetime import datetime
-
     session = db.scalar(
         select(AuthSession)
         .where(AuthSession.token_hash == hash_session_token(refresh_token))
@@ -119,15 +152,14 @@ def _context_from_refresh_cookie(request: Request, db: Session) -> WebAuthContex
     if not session:
         return WebAuthContext()
 
-    expires_at = _as_utc(session.expires_at)
-    if expires_at and expires_at <= datetime.now(UTC):
+    if not SessionState.from_session(session).is_valid():
         return WebAuthContext()
 
     person = db.get(Person, session.person_id)
     if not person:
         return WebAuthContext()
 
-    roles = _person_roles(db, str(person.id))
+    roles = _person_roles(db, person.id)
     org_id = str(session.org_id) if session.org_id else None
     return _build_auth_context(person, org_id, roles)
 
@@ -142,33 +174,30 @@ def require_web_auth(
         ctx = _context_from_refresh_cookie(request, db)
         if ctx.is_authenticated:
             return ctx
-        raise HTTPException(status_code=302, headers={"Location": "/login"})
+        raise _LoginRedirect()
 
     try:
-        from datetime import datetime
-
         payload = decode_access_token(db, token)
         person_id = payload.get("sub")
         org_id = payload.get("org_id")
         session_id = payload.get("session_id")
 
         if not person_id or not session_id:
-            raise HTTPException(status_code=302, headers={"Location": "/login"})
+            raise _LoginRedirect()
+
+        session_uuid = coerce_uuid(session_id)
+        person_uuid = coerce_uuid(person_id)
 
         # Validate session
-        now = datetime.now(UTC)
-        session = db.get(AuthSession, coerce_uuid(session_id))
-        if not session or session.status != SessionStatus.active:
-            raise HTTPException(status_code=302, headers={"Location": "/login"})
-        expires_at = _as_utc(session.expires_at)
-        if expires_at and expires_at <= now:
-            raise HTTPException(status_code=302, headers={"Location": "/login"})
-
-        person = db.get(Person, coerce_uuid(person_id))
+        session_state = get_session_state(db, session_uuid)
+        if not session_state or not session_state.is_valid():
+            raise _LoginRedirect()
+
+        person = db.get(Person, person_uuid)
         if not person:
-            raise HTTPException(status_code=302, headers={"Location": "/login"})
+            raise _LoginRedirect()
 
-        roles = payload.get("roles", []) or _person_roles(db, str(person.id))
+        roles = payload.get("roles", []) or _person_roles(db, person_uuid)
         return _build_auth_context(person, str(org_id) if org_id else None, roles)
     except HTTPException as exc:
         if exc.status_code == 302:
@@ -176,12 +205,12 @@ def require_web_auth(
         ctx = _context_from_refresh_cookie(request, db)
         if ctx.is_authenticated:
             return ctx
-        raise HTTPException(status_code=302, headers={"Location": "/login"})
+        raise _LoginRedirect()
     except Exception:
         ctx = _context_from_refresh_cookie(request, db)
         if ctx.is_authenticated:
             return ctx
-        raise HTTPException(status_code=302, headers={"Location": "/login"})
+        raise _LoginRedirect()
 
 
 def optional_web_auth(
@@ -201,21 +230,19 @@ def optional_web_auth(
         if not person_id or not session_id:
             return WebAuthContext()
 
-        # Validate session is still active (matches require_web_auth behaviour)
-        session = db.get(AuthSession, coerce_uuid(session_id))
-        if not session or session.status != SessionStatus.active:
-            return WebAuthContext()
-        from datetime import datetime
+        session_uuid = coerce_uuid(session_id)
+        person_uuid = coerce_uuid(person_id)
 
-        expires_at = _as_utc(session.expires_at)
-        if expires_at and expires_at <= datetime.now(UTC):
+        # Validate session is still active (matches require_web_auth behaviour)
+        session_state = get_session_state(db, session_uuid)
+        if not session_state or not session_state.is_valid():
             return WebAuthContext()
 
-        person = db.get(Person, coerce_uuid(person_id))
+        person = db.get(Person, person_uuid)
         if not person:
             return WebAuthContext()
 
-        roles = payload.get("roles", []) or _person_roles(db, str(person.id))
+        roles = payload.get("roles", []) or _person_roles(db, person_uuid)
         return _build_auth_context(person, str(payload.get("org_id")) if payload.get("org_id") else None, roles)
     except Exception:
         return _context_from_refresh_cookie(request, db)
@@ -5,51 +5,41 @@ Domains — Web routes for domain management.
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
+from app.services.domain_service import DomainService
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import require_admin, validate_csrf_token
+from app.web.helpers import redirect_302, require_admin_csrf
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/domains")
 
 
 def _redirect_with(instance_id: UUID | None, message: str | None = None, error: str | None = None):
     """Redirect to the instance detail domains tab after a domain mutation."""
     if instance_id:
-        return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
-    return RedirectResponse("/instances", status_code=302)
+        return redirect_302(f"/instances/{instance_id}?tab=domains")
+    return redirect_302("/instances")
 
 
 @router.get("", response_class=HTMLResponse)
 def domains_index(
     request: Request,
     auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
     instance_id: UUID | None = None,
 ):
     """Redirect to instance detail domains tab (standalone page removed)."""
-    if instance_id:
-        return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
-    return RedirectResponse("/instances", status_code=302)
+    return _redirect_with(instance_id)
 
 
 @router.post("/add")
 def domains_add(
-    request: Request,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
     domain: str = Form(""),
     is_primary: str = Form("off"),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.add_domain(instance_id, domain, is_primary == "on")
@@ -62,17 +52,11 @@ def domains_add(
 
 @router.post("/{domain_id}/verify")
 def domains_verify(
-    request: Request,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         result = svc.verify_domain(instance_id, domain_id)
@@ -87,17 +71,11 @@ def domains_verify(
 
 @router.post("/{domain_id}/provision-ssl")
 def domains_provision_ssl(
-    request: Request,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         result = svc.provision_ssl(instance_id, domain_id)
@@ -112,17 +90,11 @@ def domains_provision_ssl(
 
 @router.post("/{domain_id}/activate")
 def domains_activate(
-    request: Request,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.activate_domain(instance_id, domain_id)
@@ -135,17 +107,11 @@ def domains_activate(
 
 @router.post("/{domain_id}/primary")
 def domains_primary(
-    request: Request,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.set_primary(instance_id, domain_id)
@@ -158,17 +124,11 @@ def domains_primary(
 
 @router.post("/{domain_id}/delete")
 def domains_delete(
-    request: Request,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.remove_domain(instance_id, domain_id)
@@ -6,16 +6,23 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
-from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin, validate_csrf_token
+from app.services.dr_service import DisasterRecoveryService
+from app.web.deps import WebAuthContext, get_db, get_read_db, require_web_auth
+from app.web.helpers import (
+    ctx,
+    read_primary_next,
+    redirect_302,
+    require_admin,
+    require_admin_csrf,
+    stream_template,
+    templates,
+)
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/dr")
 
 
@@ -23,13 +30,12 @@ router = APIRouter(prefix="/dr")
 def dr_index(
     request: Request,
     auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     require_admin(auth)
-    from app.services.dr_service import DisasterRecoveryService
-
     bundle = DisasterRecoveryService(db).get_index_bundle()
-    return templates.TemplateResponse(
+    return stream_template(
+        templates,
         "dr/index.html",
         ctx(
             request,
@@ -45,19 +51,13 @@ def dr_index(
 
 @router.post("/create")
 def dr_create(
-    request: Request,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     instance_id: UUID = Form(...),
     backup_schedule_cron: str = Form("0 2 * * *"),
     retention_days: int = Form(30),
     target_server_id: UUID | None = Form(None),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.dr_service import DisasterRecoveryService
-
     try:
         DisasterRecoveryService(db).create_dr_plan(
             instance_id,
@@ -69,55 +69,43 @@ def dr_create(
     except Exception as e:
         db.rollback()
         logger.exception("Failed to create DR plan: %s", e)
-    return RedirectResponse("/dr", status_code=302)
+    return read_primary_next(redirect_302("/dr"))
 
 
 @router.post("/{dr_plan_id}/backup")
 def dr_backup(
-    request: Request,
     dr_plan_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
     from app.tasks.dr import run_dr_backup
 
     run_dr_backup.delay(str(dr_plan_id))
-    return RedirectResponse("/dr", status_code=302)
+    return redirect_302("/dr")
 
 
 @router.post("/{dr_plan_id}/test")
 def dr_test(
-    request: Request,
     dr_plan_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
     from app.tasks.dr import run_dr_test
 
     run_dr_test.delay(str(dr_plan_id))
-    return RedirectResponse("/dr", status_code=302)
+    return redirect_302("/dr")
 
 
 @router.post("/{dr_plan_id}/restore")
 def dr_restore(
-    request: Request,
     dr_plan_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     backup_id: UUID = Form(...),
     target_server_id: UUID = Form(...),
     new_org_code: str = Form(...),
     new_org_name: str | None = Form(None),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
     from app.tasks.dr import run_dr_restore
 
     run_dr_restore.delay(
@@ -126,25 +114,19 @@ def dr_restore(
         new_org_code,
         new_org_name=new_org_name,
     )
-    return RedirectResponse("/dr", status_code=302)
+    return redirect_302("/dr")
 
 
 @router.post("/{dr_plan_id}/delete")
 def dr_delete(
-    request: Request,
     dr_plan_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.dr_service import DisasterRecoveryService
-
     try:
         DisasterRecoveryService(db).delete_dr_plan(dr_plan_id)
         db.commit()
     except Exception as e:
         db.rollback()
         logger.exception("Failed to delete DR plan: %s", e)
-    return RedirectResponse("/dr", status_code=302)
+    return read_primary_next(redirect_302("/dr"))
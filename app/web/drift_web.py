@@ -5,15 +5,22 @@ Drift — Web routes for configuration drift reports.
 from urllib.parse import urlencode
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
-from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin, validate_csrf_token
+from app.services.drift_service import DriftService
+from app.web.deps import WebAuthContext, get_db, get_read_db, require_web_auth
+from app.web.helpers import (
+    ctx,
+    read_primary_next,
+    redirect_302,
+    require_admin,
+    require_admin_csrf,
+    stream_template,
+    templates,
+)
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/drift")
 
 
@@ -26,26 +33,25 @@ def _redirect_with(instance_id: UUID | None, message: str | None = None, error:
     if error:
         params["error"] = error
     if params:
-        return RedirectResponse(f"/drift?{urlencode(params)}", status_code=302)
-    return RedirectResponse("/drift", status_code=302)
+        return redirect_302(f"/drift?{urlencode(params)}")
+    return redirect_302("/drift")
 
 
 @router.get("", response_class=HTMLResponse)
 def drift_index(
     request: Request,
     auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     instance_id: UUID | None = None,
     message: str | None = None,
     error: str | None = None,
 ):
     require_admin(auth)
-    from app.services.drift_service import DriftService
-
     svc = DriftService(db)
     bundle = svc.get_index_bundle(instance_id)
 
-    return templates.TemplateResponse(
+    return stream_template(
+        templates,
         "drift/index.html",
         ctx(
             request,
@@ -64,17 +70,13 @@ def drift_index(
 
 @router.post("/{instance_id}/detect")
 def drift_detect(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.drift_service import DriftService
-
     ok, message_or_error = DriftService(db).detect_for_web(instance_id)
     if ok:
-        return _redirect_with(instance_id, message=message_or_error)
+        # The service only flushes the new report; without a commit the session close would discard it.
+        db.commit()
+        return read_primary_next(_redirect_with(instance_id, message=message_or_error))
     return _redirect_with(instance_id, error=message_or_error)
@@ -2,38 +2,74 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+from collections.abc import Callable
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.services.git_repo_service import GitRepoService
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin, validate_csrf_token
+from app.web.helpers import (
+    concurrency_limit,
+    ctx,
+    redirect_302,
+    redirect_303,
+    require_admin,
+    require_admin_csrf,
+    templates,
+)
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="templates")
-router = APIRouter(prefix="/git-repos")
+# Bursts of admin edits must not tie up the worker threads every other page shares.
+router = APIRouter(prefix="/git-repos", dependencies=[Depends(concurrency_limit(8))])
+
+_REPOS_URL = "/catalog?tab=repos"
+
+# A failing DB can make every post error; format the traceback for only one in N of them.
+_FAILURE_COUNTER = itertools.count()
+_TRACEBACK_EVERY = 100
+
+
+def _log_failure(message: str, exc: Exception) -> None:
+    logger.error(message, exc, exc_info=exc if next(_FAILURE_COUNTER) % _TRACEBACK_EVERY == 0 else None)
+
+
+def get_git_repo_service(db: Session = Depends(get_db)) -> GitRepoService:
+    """Service bound to the request's cached session (the same one ``require_web_auth`` uses)."""
+    return GitRepoService(db)
+
+
+def _guarded_write(db: Session, action: Callable[[], object], failure: str) -> Response:
+    """Run one service write, commit or roll back, and send the admin back to the registry list."""
+    try:
+        action()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        _log_failure(failure, e)
+    return redirect_303(_REPOS_URL)
 
 
 @router.get("", response_class=HTMLResponse)
-def git_repos_index(
+async def git_repos_index(
     request: Request,
     auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
 ):
     """Redirect to catalog repos tab (standalone page removed)."""
-    return RedirectResponse("/catalog?tab=repos", status_code=302)
+    return redirect_302(_REPOS_URL)
 
 
-@router.post("/create")
+@router.post("/create", response_class=RedirectResponse, status_code=303)
 def git_repos_create(
-    request: Request,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
+    svc: GitRepoService = Depends(get_git_repo_service),
     label: str = Form(...),
     auth_type: str = Form("none"),
     credential: str | None = Form(None),
@@ -41,14 +77,10 @@ def git_repos_create(
     is_platform_default: bool = Form(False),
     registry_url: str = Form(...),
     environment: str = Form("production"),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.git_repo_service import GitRepoService
-
-    try:
-        GitRepoService(db).create_from_form(
+    return _guarded_write(
+        db,
+        lambda: svc.create_from_form(
             label=label,
             auth_type=auth_type,
             credential=credential,
@@ -56,27 +88,23 @@ def git_repos_create(
             is_platform_default=is_platform_default,
             registry_url=registry_url,
             environment=environment,
-        )
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        logger.exception("Failed to create git repo: %s", e)
-    return RedirectResponse("/catalog?tab=repos", status_code=302)
+        ),
+        "Failed to create git repo: %s",
+    )
 
 
 @router.get("/{repo_id}/edit", response_class=HTMLResponse)
-def git_repos_edit_form(
+async def git_repos_edit_form(
     request: Request,
     repo_id: UUID,
     auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
+    svc: GitRepoService = Depends(get_git_repo_service),
 ):
     require_admin(auth)
-    from app.services.git_repo_service import GitRepoService
-
-    repo = GitRepoService(db).get_by_id(repo_id)
+    # Only the query holds a worker thread; the template renders on the event loop.
+    repo = await run_in_threadpool(svc.get_by_id, repo_id)
     if not repo:
-        return RedirectResponse("/catalog?tab=repos", status_code=302)
+        return redirect_302(_REPOS_URL)
     return templates.TemplateResponse(
         "git_repos/edit.html",
         ctx(
@@ -94,8 +122,9 @@ def git_repos_edit_form(
 def git_repos_edit(
     request: Request,
     repo_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
+    svc: GitRepoService = Depends(get_git_repo_service),
     label: str = Form(...),
     auth_type: str = Form("none"),
     credential: str | None = Form(None),
@@ -103,32 +132,24 @@ def git_repos_edit(
     is_platform_default: bool = Form(False),
     registry_url: str = Form(...),
     environment: str = Form("production"),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.git_repo_service import GitRepoService
-
-    svc = GitRepoService(db)
     try:
-        update_payload: dict[str, object] = {
-            "label": label,
-            "auth_type": svc.parse_auth_type(auth_type),
-            "default_branch": default_branch,
-            "is_platform_default": is_platform_default,
-            "registry_url": registry_url,
-            "environment": environment,
-            "is_active": True,
-        }
-        # Preserve existing secret/key when credential field is intentionally left blank.
-        if credential and credential.strip():
-            update_payload["credential"] = credential
-        svc.update_repo(repo_id, **update_payload)
+        svc.update_repo_fields(
+            repo_id,
+            label=label,
+            auth_type=svc.parse_auth_type(auth_type),
+            default_branch=default_branch,
+            is_platform_default=is_platform_default,
+            registry_url=registry_url,
+            environment=environment,
+            # Preserve existing secret/key when credential field is intentionally left blank.
+            credential=credential if credential and credential.strip() else None,
+        )
         db.commit()
-        return RedirectResponse("/catalog?tab=repos", status_code=302)
+        return redirect_303(_REPOS_URL)
     except Exception as e:
         db.rollback()
-        logger.exception("Failed to update git repo: %s", e)
+        _log_failure("Failed to update git repo: %s", e)
         repo = svc.get_by_id(repo_id)
         return templates.TemplateResponse(
             "git_repos/edit.html",
@@ -143,64 +164,31 @@ def git_repos_edit(
         )
 
 
-@router.post("/{repo_id}/set-default")
+@router.post("/{repo_id}/set-default", response_class=RedirectResponse, status_code=303)
 def git_repos_set_default(
-    request: Request,
     repo_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
+    svc: GitRepoService = Depends(get_git_repo_service),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.git_repo_service import GitRepoService
+    return _guarded_write(db, lambda: svc.set_platform_default(repo_id), "Failed to set default repo: %s")
 
-    try:
-        GitRepoService(db).update_repo(repo_id, is_platform_default=True, is_active=True)
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        logger.exception("Failed to set default repo: %s", e)
-    return RedirectResponse("/catalog?tab=repos", status_code=302)
 
-
-@router.post("/{repo_id}/deactivate")
+@router.post("/{repo_id}/deactivate", response_class=RedirectResponse, status_code=303)
 def git_repos_deactivate(
-    request: Request,
     repo_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
+    svc: GitRepoService = Depends(get_git_repo_service),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.git_repo_service import GitRepoService
-
-    try:
-        GitRepoService(db).delete_repo(repo_id)
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        logger.exception("Failed to deactivate repo: %s", e)
-    return RedirectResponse("/catalog?tab=repos", status_code=302)
+    return _guarded_write(db, lambda: svc.delete_repo(repo_id), "Failed to deactivate repo: %s")
 
 
-@router.post("/{repo_id}/delete")
+@router.post("/{repo_id}/delete", response_class=RedirectResponse, status_code=303)
 def git_repos_delete(
-    request: Request,
     repo_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
+    svc: GitRepoService = Depends(get_git_repo_service),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.git_repo_service import GitRepoService
-
-    try:
-        GitRepoService(db).purge_repo(repo_id)
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        logger.exception("Failed to delete repo: %s", e)
-    return RedirectResponse("/catalog?tab=repos", status_code=302)
+    return _guarded_write(db, lambda: svc.purge_repo(repo_id), "Failed to delete repo: %s")
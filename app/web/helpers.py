@@ -4,46 +4,79 @@ Shared web helpers — brand context, template context builder, and CSRF protect
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import logging
 import os
 import secrets
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from functools import cache
 
-from fastapi import HTTPException, Request
+from fastapi import Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from app.config import settings
+from app.services.bounded_cache import BoundedCache
+from app.web.deps import READ_PRIMARY_COOKIE, READ_PRIMARY_SECONDS, WebAuthContext, require_web_auth
 
 logger = logging.getLogger(__name__)
 
+# Shared by every web module so each template is compiled once per process.
+templates = Jinja2Templates(directory="templates")
+templates.env.auto_reload = settings.template_auto_reload
+# Every template fits; a plain dict skips the LRU bookkeeping on each lookup.
+templates.env.cache = {}
+if settings.template_bytecode_cache_dir:
+    os.makedirs(settings.template_bytecode_cache_dir, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(settings.template_bytecode_cache_dir)
+# Fixed after startup, so they live on the environment instead of being copied into every ctx().
+templates.env.globals["testing"] = settings.testing
+templates.env.globals["use_cdn_assets"] = settings.use_cdn_assets
+
+
+def precompile_templates() -> int:
+    """Compile all HTML templates up front so the first request to each page skips parsing."""
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.get_template(name)
+    return len(names)
+
 
 CSRF_COOKIE_NAME = "csrf_session"
 
 
-def _csrf_session_id(request: Request) -> str:
-    """Return a per-client binding for CSRF tokens.
+def _csrf_session_id(request: Request) -> bytes:
+    """Return a per-client binding for CSRF tokens, already encoded for the MAC.
 
     Uses the access_token cookie when present (authenticated users).
     For anonymous visitors, derives a binding from client IP + User-Agent.
     """
     token = request.cookies.get("access_token")
     if token:
-        return str(token)
+        return token.encode()
     csrf_session = request.cookies.get(CSRF_COOKIE_NAME)
     if csrf_session:
-        return str(csrf_session)
+        return csrf_session.encode()
     csrf_session = getattr(request.state, "csrf_session", None)
     if csrf_session:
-        return str(csrf_session)
+        return str(csrf_session).encode()
     # Generate a unique binding for anonymous visitors instead of a shared constant
     csrf_session = secrets.token_urlsafe(32)
     request.state.csrf_session = csrf_session
-    return csrf_session
+    return csrf_session.encode()
 
 
+@cache
 def brand() -> dict:
-    """Build brand context dict for templates."""
+    """Build brand context dict for templates.
+
+    Brand settings are fixed after startup, so the dict is built once and shared; templates must not mutate it.
+    Tests that change ``settings.brand_*`` should call ``brand.cache_clear()``.
+    """
     name = settings.brand_name
     parts = [p for p in name.split() if p]
     if len(parts) >= 2:
@@ -69,12 +102,74 @@ def ctx(request, auth, title: str, active_page: str = "", **extra) -> dict:
         "auth": auth,
         "active_page": active_page,
         "csrf_token": generate_csrf_token(request),
-        "testing": settings.testing,
-        "use_cdn_assets": settings.use_cdn_assets,
         **extra,
     }
 
 
+_STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def _buffered(chunks: Iterator[str], size: int) -> Iterator[str]:
+    # Jinja yields one chunk per text node/expression; coalesce them so the
+    # threadpool hop per chunk in StreamingResponse stays cheap.
+    buffer: list[str] = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_template(templates: Jinja2Templates, name: str, context: dict) -> StreamingResponse:
+    """Render a template incrementally so the first bytes go out before the whole page is built.
+
+    Only pass fully loaded objects in ``context`` — the DB session may be closed before rendering finishes.
+    """
+    template = templates.get_template(name)
+    return StreamingResponse(_buffered(template.generate(context), _STREAM_CHUNK_SIZE), media_type="text/html")
+
+
+def redirect_302(url: str) -> Response:
+    """Bare 302 for form posts; ``url`` must already be quoted.
+
+    A fresh instance per call — middleware mutates response headers (cookies, X-API-Version) in place.
+    """
+    return Response(status_code=302, headers={"location": url})
+
+
+def read_primary_next(response: Response) -> Response:
+    """Send the client's GETs for the next few seconds to the primary, so a write's redirect never hits replica lag."""
+    if settings.database_read_url:
+        response.set_cookie(READ_PRIMARY_COOKIE, "1", max_age=READ_PRIMARY_SECONDS, httponly=True, samesite="lax")
+    return response
+
+
+def redirect_303(url: str) -> Response:
+    """Bare 303 See Other (POST-redirect-GET); same contract as :func:`redirect_302`."""
+    return Response(status_code=303, headers={"location": url})
+
+
+def concurrency_limit(limit: int) -> Callable[[], AsyncIterator[None]]:
+    """Router dependency that admits at most ``limit`` concurrent requests and answers 503 beyond that.
+
+    Runs on the event loop before any sync dependency, so rejected requests never take a worker thread.
+    """
+    slots = asyncio.Semaphore(limit)
+
+    async def _acquire() -> AsyncIterator[None]:
+        if slots.locked():
+            raise HTTPException(status_code=503, detail="Too many concurrent requests", headers={"Retry-After": "1"})
+        async with slots:
+            yield
+
+    return _acquire
+
+
 # ---------------------------------------------------------------------------
 # CSRF protection
 # ---------------------------------------------------------------------------
@@ -91,15 +186,35 @@ if not _csrf_env:
         logger.warning("CSRF_SECRET_KEY not set — using random key (tokens won't survive restarts)")
 _CSRF_SECRET_KEY = bytes.fromhex(_csrf_env) if _csrf_env else secrets.token_bytes(32)
 _CSRF_TOKEN_TTL = 3600 * 4  # 4 hours
+# Keyed BLAKE2b is a MAC on its own (no HMAC wrapper). Keyed once at import; copying skips
+# re-hashing the key block per token.
+_CSRF_MAC = hashlib.blake2b(key=_CSRF_SECRET_KEY[:64], digest_size=16)
+
+
+def _csrf_signature(session_id: bytes, timestamp: bytes) -> bytes:
+    mac = _CSRF_MAC.copy()
+    mac.update(session_id + b":" + timestamp)
+    return mac.hexdigest().encode("ascii")
+
+
+# Any unexpired token is valid, so renders within the same minute reuse the last token for a session.
+_CSRF_TOKEN_CACHE: BoundedCache[bytes, tuple[int, str]] = BoundedCache(4096)
+_CSRF_TOKEN_BUCKET_SECONDS = 60
 
 
 def generate_csrf_token(request: Request) -> str:
     """Generate a CSRF token tied to the session cookie."""
     session_id = _csrf_session_id(request)
-    timestamp = str(int(time.time()))
-    payload = f"{session_id}:{timestamp}"
-    sig = hmac.new(_CSRF_SECRET_KEY, payload.encode(), hashlib.sha256).hexdigest()
-    return f"{timestamp}:{sig}"
+    now = int(time.time())
+    bucket = now // _CSRF_TOKEN_BUCKET_SECONDS
+    cached = _CSRF_TOKEN_CACHE.get(session_id)
+    if cached and cached[0] == bucket:
+        return cached[1]
+
+    timestamp = b"%d" % now
+    token = (timestamp + b":" + _csrf_signature(session_id, timestamp)).decode("ascii")
+    _CSRF_TOKEN_CACHE.set(session_id, (bucket, token))
+    return token
 
 
 def validate_csrf_token(request: Request, token: str | None) -> None:
@@ -107,28 +222,44 @@ def validate_csrf_token(request: Request, token: str | None) -> None:
     if not token:
         raise HTTPException(status_code=403, detail="Missing CSRF token")
 
-    parts = token.split(":", 1)
-    if len(parts) != 2:
+    # Work on bytes throughout: compare_digest rejects non-ASCII str, and no intermediate strings are built.
+    timestamp_bytes, sep, provided_sig = token.encode().partition(b":")
+    if not sep:
         raise HTTPException(status_code=403, detail="Invalid CSRF token")
 
-    timestamp_str, provided_sig = parts
     try:
-        timestamp = int(timestamp_str)
+        timestamp = int(timestamp_bytes)
     except ValueError:
         raise HTTPException(status_code=403, detail="Invalid CSRF token")
 
     if time.time() - timestamp > _CSRF_TOKEN_TTL:
         raise HTTPException(status_code=403, detail="CSRF token expired")
 
-    session_id = _csrf_session_id(request)
-    payload = f"{session_id}:{timestamp_str}"
-    expected_sig = hmac.new(_CSRF_SECRET_KEY, payload.encode(), hashlib.sha256).hexdigest()
-
+    expected_sig = _csrf_signature(_csrf_session_id(request), timestamp_bytes)
     if not hmac.compare_digest(provided_sig, expected_sig):
         raise HTTPException(status_code=403, detail="Invalid CSRF token")
 
 
-def require_admin(auth) -> None:
+def require_admin(auth: WebAuthContext | None) -> None:
     """Raise 403 if the authenticated user is not an admin."""
-    if not auth or not getattr(auth, "is_admin", False):
+    if auth is None or not auth.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
+
+
+async def require_admin_csrf(
+    request: Request,
+    auth: WebAuthContext = Depends(require_web_auth),
+) -> WebAuthContext:
+    """Dependency for admin-only form posts: checks the admin role and the CSRF token.
+
+    HTMX sends the token as ``X-CSRF-Token`` (see ``hx-headers`` in the base layouts); checking the
+    header first means posts with no other form fields are rejected without parsing their body.
+    Plain form submits fall back to the ``csrf_token`` field.
+    """
+    require_admin(auth)
+    token = request.headers.get("x-csrf-token")
+    if not token:
+        form = await request.form()
+        token = str(form.get("csrf_token") or "")
+    validate_csrf_token(request, token)
+    return auth
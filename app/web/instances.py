@@ -4,33 +4,72 @@ Instance Management — Web routes for ERP instance CRUD, deployment, and operat
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
+from urllib.parse import urlencode
 from uuid import UUID
 
-if TYPE_CHECKING:
-    from collections.abc import Sequence
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, Response
+from markupsafe import Markup, escape
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models.organization import Organization
+from app.services.backup_service import BackupService
+from app.services.bounded_cache import BoundedCache
+from app.services.catalog_service import CatalogService
+from app.services.deploy_service import DeployService
+from app.services.domain_service import DomainService
+from app.services.feature_flag_service import FeatureFlagService
+from app.services.health_badge_cache import get_badge_etag, remember_badge_etag
+from app.services.health_service import HealthService
+from app.services.instance_service import InstanceService
+from app.services.lifecycle_service import LifecycleService
+from app.services.module_service import ModuleService
+from app.services.organization_service import OrganizationService
+from app.services.server_service import ServerService
+from app.services.upgrade_service import UpgradeService
+from app.tasks.deploy import deploy_instance
+from app.tasks.domains import remove_domain_task, verify_domain_task
+from app.tasks.instance_ops import (
+    migrate_instance_task,
+    restart_instance_task,
+    start_instance_task,
+    stop_instance_task,
+)
+from app.tasks.secrets import rotate_all_secrets_task, rotate_secret_task
+from app.web.deps import WebAuthContext, get_db, require_web_auth
+from app.web.helpers import ctx, generate_csrf_token, redirect_303, require_admin, require_admin_csrf, templates
 
-    from app.models.catalog import AppCatalogItem
+if TYPE_CHECKING:
+    from sqlalchemy import Row
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+router = APIRouter(prefix="/instances")
 
-from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin, validate_csrf_token
 
-templates = Jinja2Templates(directory="templates")
-router = APIRouter(prefix="/instances")
+# (catalog signature, form rows, escaped map JSON); rebuilt only when the active catalog changes.
+_CATALOG_FORM_CACHE: tuple[str, list[Row], Markup] | None = None
+
 
+def _catalog_form_data(db: Session) -> tuple[list[Row], Markup]:
+    """Catalog rows for the instance form's select plus the catalog_id -> summary JSON, HTML-escaped once.
 
-def _build_catalog_map_json(catalog_items: Sequence[AppCatalogItem]) -> str:
-    """Build a JSON string mapping catalog_id -> summary for the instance form."""
-    import json
+    The template drops the JSON into a quoted attribute; returning Markup lets Jinja skip its own escape on every
+    render. Rows are plain column tuples, so they are safe to share across sessions.
+    """
+    global _CATALOG_FORM_CACHE
+    signature = CatalogService(db).get_catalog_signature()
+    cached = _CATALOG_FORM_CACHE
+    if cached and cached[0] == signature:
+        return cached[1], cached[2]
 
+    catalog_items = CatalogService(db).list_for_form()
     catalog_map: dict[str, dict[str, str | None]] = {}
     for c in catalog_items:
         catalog_map[str(c.catalog_id)] = {
@@ -38,7 +77,36 @@ def _build_catalog_map_json(catalog_items: Sequence[AppCatalogItem]) -> str:
             "version": c.version,
             "git_ref": c.git_ref,
         }
-    return json.dumps(catalog_map)
+    catalog_json = escape(json.dumps(catalog_map))
+    _CATALOG_FORM_CACHE = (signature, catalog_items, catalog_json)
+    return catalog_items, catalog_json
+
+
+def _load_form_context(db: Session) -> dict:
+    """Servers and catalog data shared by the new-instance form and its error re-renders."""
+    catalog_items, catalog_map_json = _catalog_form_data(db)
+    return {
+        "servers": ServerService(db).list_for_form(),
+        "catalog_items": catalog_items,
+        "catalog_map_json": catalog_map_json,
+    }
+
+
+def _render_form_with_errors(request: Request, auth: WebAuthContext, db: Session, errors: list[str]) -> HTMLResponse:
+    """Re-render the new-instance form after a failed create."""
+    return templates.TemplateResponse(
+        "instances/form.html",
+        ctx(request, auth, "New Instance", active_page="instances", errors=errors, **_load_form_context(db)),
+    )
+
+
+_VALID_VIEWS = frozenset(("table", "cards"))
+_DETAIL_TABS = frozenset(("modules", "flags", "plan", "upgrades", "backups", "secrets", "domains", "audit"))
+_VALID_DIRS = frozenset(("asc", "desc"))
+
+# Rendered list pages keyed by their ETag. The tag already covers the fleet signature, the query,
+# the viewer and the CSRF token, so a stale entry is simply never looked up again.
+_LIST_PAGE_CACHE: BoundedCache[str, str] = BoundedCache(64)
 
 
 @router.get("", response_class=HTMLResponse)
@@ -47,8 +115,6 @@ def instance_list(
     auth: WebAuthContext = Depends(require_web_auth),
     db: Session = Depends(get_db),
 ):
-    from app.services.instance_service import InstanceService
-
     svc = InstanceService(db)
 
     # Filters
@@ -57,8 +123,12 @@ def instance_list(
     status_filter = (params.get("status") or "").strip().lower() or None
     health_filter = (params.get("health") or "").strip().lower() or None
     view = (params.get("view") or "table").strip().lower()
+    if view not in _VALID_VIEWS:
+        view = "table"
     sort_key = (params.get("sort") or "org_code").strip().lower()
     sort_dir = (params.get("dir") or "asc").strip().lower()
+    if sort_dir not in _VALID_DIRS:
+        sort_dir = "asc"
 
     # Pagination
     try:
@@ -70,60 +140,115 @@ def instance_list(
     except ValueError:
         page_size = 25
 
+    # The CSRF token is part of the page and rolls every minute, which also bounds how long a
+    # health check can cross the staleness cutoff without the tag changing.
+    tag_parts = f"{svc.get_list_signature()}:{request.url.query}:{auth.person_id}:{generate_csrf_token(request)}"
+    etag = '"' + hashlib.sha256(tag_parts.encode()).hexdigest()[:16] + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    body = _LIST_PAGE_CACHE.get(etag)
+    if body is not None:
+        return HTMLResponse(body, headers=headers)
+
+    # Keyset cursor for the default org_code sort; page numbers still work for every sort.
+    after = (params.get("after") or "").strip() or None
+    keyset = sort_key == "org_code" and after is not None
+
     result = svc.list_for_web(
         q=q,
         status_filter=status_filter,
         health_filter=health_filter,
         sort_key=sort_key,
-        sort_dir=sort_dir if sort_dir in {"asc", "desc"} else "asc",
+        sort_dir=sort_dir,
         page=page,
-        page_size=page_size,
+        # A seek page has no offset to compare against the total, so fetch one extra row to see if more follow.
+        page_size=page_size + 1 if keyset else page_size,
+        after=after,
     )
-
-    return templates.TemplateResponse(
-        "instances/list.html",
+    items = result.items[:page_size]
+    has_more = len(result.items) > page_size if keyset else page * page_size < result.total
+    next_after = None
+    if sort_key == "org_code" and items and has_more:
+        next_after = items[-1].instance.org_code
+    # The table scrolls on through /instances/rows instead of numbered pages whenever a keyset cursor exists.
+    next_rows_url = None
+    if view == "table" and next_after:
+        next_rows_url = _rows_url(q, status_filter, health_filter, sort_dir, page_size, next_after)
+
+    body = templates.get_template("instances/list.html").render(
         ctx(
             request,
             auth,
             "Instances",
             active_page="instances",
-            instances=result.items,
+            instances=items,
             total=result.total,
             page=page,
             page_size=page_size,
             q=q,
             status_filter=status_filter or "",
             health_filter=health_filter or "",
-            view=view if view in {"table", "cards"} else "table",
+            view=view,
             sort=sort_key,
-            sort_dir=sort_dir if sort_dir in {"asc", "desc"} else "asc",
+            sort_dir=sort_dir,
+            next_after=next_after,
+            next_rows_url=next_rows_url,
         ),
     )
+    _LIST_PAGE_CACHE.set(etag, body)
+    return HTMLResponse(body, headers=headers)
 
 
-@router.get("/new", response_class=HTMLResponse)
-def instance_form(
-    request: Request,
+def _rows_url(
+    q: str, status_filter: str | None, health_filter: str | None, sort_dir: str, page_size: int, after: str
+) -> str:
+    query = {"q": q, "status": status_filter or "", "health": health_filter or "", "dir": sort_dir}
+    return "/instances/rows?" + urlencode({**query, "page_size": page_size, "after": after})
+
+
+@router.get("/rows", response_class=HTMLResponse)
+async def instance_rows(
+    after: str,
     auth: WebAuthContext = Depends(require_web_auth),
     db: Session = Depends(get_db),
+    q: str = "",
+    status: str = "",
+    health: str = "",
+    sort_dir: str = Query("asc", alias="dir"),
+    page_size: int = Query(25, ge=10, le=100),
 ):
-    require_admin(auth)
-    from app.services.catalog_service import CatalogService
-    from app.services.organization_service import OrganizationService
-    from app.services.server_service import ServerService
+    """HTMX partial: the next batch of org_code-sorted table rows after ``after``, without a COUNT."""
+    if sort_dir not in _VALID_DIRS:
+        sort_dir = "asc"
+    status_filter = status.strip().lower() or None
+    health_filter = health.strip().lower() or None
+    result = await run_in_threadpool(
+        InstanceService(db).list_for_web,
+        q=q,
+        status_filter=status_filter,
+        health_filter=health_filter,
+        sort_key="org_code",
+        sort_dir=sort_dir,
+        page=1,
+        page_size=page_size + 1,
+        after=after,
+        with_total=False,
+    )
+    items = result.items[:page_size]
+    next_rows_url = None
+    if len(result.items) > page_size:
+        next_rows_url = _rows_url(q, status_filter, health_filter, sort_dir, page_size, items[-1].instance.org_code)
+    body = templates.get_template("partials/instance_rows.html").render(instances=items, next_rows_url=next_rows_url)
+    return HTMLResponse(body)
 
-    servers = ServerService(db).list_all()
-    catalog_items = CatalogService(db).list_catalog_items(active_only=True)
-    catalog_map_json = _build_catalog_map_json(catalog_items)
-    selected_server_id = (request.query_params.get("server_id") or "").strip()
-    selected_catalog_item_id = (request.query_params.get("catalog_item_id") or "").strip()
 
+def _load_new_form(db: Session, org_id_param: str) -> tuple[dict, Organization | None, list[Organization]]:
+    """Form context plus the pre-selected organization, or every active one to pick from."""
+    form_context = _load_form_context(db)
     # Org-first flow: if org_id is provided, pre-select the organization
-    from app.models.organization import Organization as OrgModel
-
-    selected_org: OrgModel | None = None
-    organizations: list[OrgModel] = []
-    org_id_param = (request.query_params.get("org_id") or "").strip()
+    selected_org: Organization | None = None
+    organizations: list[Organization] = []
     if org_id_param:
         try:
             selected_org = OrganizationService(db).get_by_id(UUID(org_id_param))
@@ -131,6 +256,23 @@ def instance_form(
             pass
     if not selected_org:
         organizations = OrganizationService(db).list_all(active_only=True)
+    return form_context, selected_org, organizations
+
+
+@router.get("/new", response_class=HTMLResponse)
+async def instance_form(
+    request: Request,
+    auth: WebAuthContext = Depends(require_web_auth),
+    db: Session = Depends(get_db),
+):
+    require_admin(auth)
+
+    selected_server_id = (request.query_params.get("server_id") or "").strip()
+    selected_catalog_item_id = (request.query_params.get("catalog_item_id") or "").strip()
+    org_id_param = (request.query_params.get("org_id") or "").strip()
+    # The lookups share one session, so they run back to back in a single worker thread; the template
+    # renders on the event loop.
+    form_context, selected_org, organizations = await run_in_threadpool(_load_new_form, db, org_id_param)
 
     return templates.TemplateResponse(
         "instances/form.html",
@@ -139,14 +281,12 @@ def instance_form(
             auth,
             "New Instance",
             active_page="instances",
-            servers=servers,
-            catalog_items=catalog_items,
-            catalog_map_json=catalog_map_json,
             selected_server_id=selected_server_id,
             selected_catalog_item_id=selected_catalog_item_id,
             selected_org=selected_org,
             organizations=organizations,
             errors=None,
+            **form_context,
         ),
     )
 
@@ -154,9 +294,9 @@ def instance_form(
 @router.post("/new", response_class=HTMLResponse)
 def instance_create(
     request: Request,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    server_id: str = Form(...),
+    server_id: UUID = Form(...),
     org_id: str = Form(""),
     org_code: str = Form(""),
     org_name: str = Form(""),
@@ -166,20 +306,12 @@ def instance_create(
     admin_email: str = Form(""),
     admin_username: str = Form("admin"),
     domain: str = Form(""),
-    catalog_item_id: str = Form(""),
-    app_port: str = Form(""),
-    db_port: str = Form(""),
-    redis_port: str = Form(""),
+    catalog_item_id: UUID | None = Form(None),
+    app_port: int | None = Form(None),
+    db_port: int | None = Form(None),
+    redis_port: int | None = Form(None),
     admin_password: str = Form(""),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.instance_service import InstanceService
-    from app.services.organization_service import OrganizationService
-    from app.services.server_service import ServerService
-
     svc = InstanceService(db)
     try:
         # Resolve org from org_id if provided (org-first flow)
@@ -197,93 +329,50 @@ def instance_create(
 
         if not catalog_item_id:
             raise ValueError("Catalog item is required")
-        catalog_id = UUID(catalog_item_id)
         instance, deployment_id = svc.create_with_catalog(
-            server_id=UUID(server_id),
+            server_id=server_id,
             org_code=org_code,
             org_name=org_name,
-            catalog_item_id=catalog_id,
+            catalog_item_id=catalog_item_id,
             sector_type=sector_type or None,
             framework=framework or None,
             currency=currency or None,
             admin_email=admin_email or None,
             admin_username=admin_username or "admin",
             domain=domain or None,
-            app_port=int(app_port) if app_port else None,
-            db_port=int(db_port) if db_port else None,
-            redis_port=int(redis_port) if redis_port else None,
+            app_port=app_port,
+            db_port=db_port,
+            redis_port=redis_port,
             admin_password=admin_password or None,
         )
         db.commit()
 
         if deployment_id:
-            from app.tasks.deploy import deploy_instance
-
             deploy_instance.delay(str(instance.instance_id), deployment_id)
-            return RedirectResponse(
-                f"/instances/{instance.instance_id}/deploy-log?deployment_id={deployment_id}",
-                status_code=302,
-            )
-        return RedirectResponse(f"/instances/{instance.instance_id}", status_code=302)
+            return redirect_303(f"/instances/{instance.instance_id}/deploy-log?deployment_id={deployment_id}")
+        return redirect_303(f"/instances/{instance.instance_id}")
     except ValueError as e:
         db.rollback()
-        servers = ServerService(db).list_all()
-        from app.services.catalog_service import CatalogService
-        from app.services.git_repo_service import GitRepoService
-
-        repos = GitRepoService(db).list_repos(active_only=True)
-        catalog_items = CatalogService(db).list_catalog_items(active_only=True)
-        return templates.TemplateResponse(
-            "instances/form.html",
-            ctx(
-                request,
-                auth,
-                "New Instance",
-                active_page="instances",
-                servers=servers,
-                repos=repos,
-                catalog_items=catalog_items,
-                catalog_map_json=_build_catalog_map_json(catalog_items),
-                errors=[str(e)],
-            ),
-        )
+        return _render_form_with_errors(request, auth, db, [str(e)])
     except Exception:
         db.rollback()
         logger.exception("Failed to create instance")
-        servers = ServerService(db).list_all()
-        from app.services.catalog_service import CatalogService
-        from app.services.git_repo_service import GitRepoService
-
-        repos = GitRepoService(db).list_repos(active_only=True)
-        catalog_items = CatalogService(db).list_catalog_items(active_only=True)
-        return templates.TemplateResponse(
-            "instances/form.html",
-            ctx(
-                request,
-                auth,
-                "New Instance",
-                active_page="instances",
-                servers=servers,
-                repos=repos,
-                catalog_items=catalog_items,
-                catalog_map_json=_build_catalog_map_json(catalog_items),
-                errors=["An unexpected error occurred. Please try again."],
-            ),
-        )
+        return _render_form_with_errors(request, auth, db, ["An unexpected error occurred. Please try again."])
 
 
 @router.get("/{instance_id}", response_class=HTMLResponse)
-def instance_detail(
+async def instance_detail(
     request: Request,
     instance_id: UUID,
     auth: WebAuthContext = Depends(require_web_auth),
     db: Session = Depends(get_db),
+    tab: str = "modules",
 ):
-    from app.services.instance_service import InstanceService
-
-    svc = InstanceService(db)
-    active_tab = (request.query_params.get("tab") or "modules").strip().lower()
-    bundle = svc.get_detail_bundle(instance_id)
+    active_tab = (tab or "modules").strip().lower()
+    if active_tab not in _DETAIL_TABS:
+        active_tab = "modules"
+    # Only the bundle queries hold a worker thread; the template renders on the event loop.
+    bundle = await run_in_threadpool(InstanceService(db).get_detail_bundle, instance_id, active_tab)
 
     return templates.TemplateResponse(
         "instances/detail.html",
@@ -292,81 +381,57 @@ def instance_detail(
             auth,
             bundle["instance"].org_code,
             active_page="instances",
-            instance=bundle["instance"],
-            latest_health=bundle["latest_health"],
-            recent_checks=bundle["recent_checks"],
-            deploy_logs=bundle["deploy_logs"],
-            latest_deploy_id=bundle["latest_deploy_id"],
-            modules=bundle["modules"],
-            flags=bundle["flags"],
-            plans=bundle["plans"],
-            backups=bundle["backups"],
-            domains=bundle["domains"],
-            expiring_certs=bundle["expiring_certs"],
-            audit_logs=bundle["audit_logs"],
-            usage_summary=bundle["usage_summary"],
-            compliance_violations=bundle["compliance_violations"],
-            rotation_history=bundle["rotation_history"],
             active_tab=active_tab,
-            repos=bundle["repos"],
-            catalog_items=bundle["catalog_items"],
-            catalog_map=bundle["catalog_map"],
-            upgrades=bundle["upgrades"],
-            pending_upgrade_ids=bundle["pending_upgrade_ids"],
-            uptime_seconds=bundle["uptime_seconds"],
+            **bundle,
         ),
     )
 
 
-@router.post("/{instance_id}/deploy", response_class=HTMLResponse)
-def instance_deploy(
+@router.get("/{instance_id}/tabs/{tab}", response_class=HTMLResponse)
+async def instance_detail_tab(
     request: Request,
     instance_id: UUID,
+    tab: str,
     auth: WebAuthContext = Depends(require_web_auth),
     db: Session = Depends(get_db),
-    admin_password: str = Form(...),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
+    """HTMX partial: one detail tab, fetched the first time it is shown."""
+    if tab not in _DETAIL_TABS:
+        raise HTTPException(status_code=404, detail="Unknown tab")
+    svc = InstanceService(db)
+    instance = await run_in_threadpool(svc.get_or_404, instance_id)
+    data = await run_in_threadpool(svc.get_detail_tab, instance_id, tab)
+    return templates.TemplateResponse(
+        f"partials/instance_tabs/{tab}.html",
+        ctx(request, auth, instance.org_code, instance=instance, **data),
+    )
 
-    from app.services.deploy_service import DeployService
-    from app.tasks.deploy import deploy_instance
 
+@router.post("/{instance_id}/deploy", response_class=HTMLResponse)
+def instance_deploy(
+    instance_id: UUID,
+    auth: WebAuthContext = Depends(require_admin_csrf),
+    db: Session = Depends(get_db),
+    admin_password: str = Form(...),
+    git_ref: str | None = None,
+):
     deploy_svc = DeployService(db)
-    deployment_id = deploy_svc.create_deployment(
-        instance_id,
-        admin_password,
-        git_ref=request.query_params.get("git_ref"),
-    )
+    deployment_id = deploy_svc.create_deployment(instance_id, admin_password, git_ref=git_ref)
     db.commit()
 
     # Kick off async deployment via Celery (password stored in DB, not task args)
-    deploy_instance.delay(
-        str(instance_id),
-        deployment_id,
-        git_ref=request.query_params.get("git_ref"),
-    )
+    deploy_instance.delay(str(instance_id), deployment_id, git_ref=git_ref)
 
-    return RedirectResponse(
-        f"/instances/{instance_id}/deploy-log?deployment_id={deployment_id}",
-        status_code=302,
-    )
+    return redirect_303(f"/instances/{instance_id}/deploy-log?deployment_id={deployment_id}")
 
 
 @router.post("/{instance_id}/git-repo")
 def instance_set_git_repo(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     git_repo_id: str = Form(""),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.instance_service import InstanceService
-
     try:
         if not git_repo_id:
             raise ValueError("Git repository is required")
@@ -374,23 +439,17 @@ def instance_set_git_repo(
         db.commit()
     except ValueError:
         db.rollback()
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
+    return redirect_303(f"/instances/{instance_id}")
 
 
 @router.post("/{instance_id}/upgrades")
 def instance_create_upgrade(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     catalog_item_id: str = Form(""),
     scheduled_for: str | None = Form(None),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.upgrade_service import UpgradeService
-
     try:
         if not catalog_item_id:
             raise ValueError("Catalog item is required")
@@ -406,23 +465,17 @@ def instance_create_upgrade(
         svc.dispatch_pending()
     except Exception:
         db.rollback()
-    return RedirectResponse(f"/instances/{instance_id}?tab=upgrades", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=upgrades")
 
 
 @router.post("/{instance_id}/upgrades/{upgrade_id}/cancel")
 def instance_cancel_upgrade(
-    request: Request,
     instance_id: UUID,
     upgrade_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     reason: str = Form(""),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-    from app.services.upgrade_service import UpgradeService
-
     try:
         UpgradeService(db).cancel_for_instance(
             instance_id,
@@ -434,20 +487,18 @@ def instance_cancel_upgrade(
         db.commit()
     except Exception:
         db.rollback()
-    return RedirectResponse(f"/instances/{instance_id}?tab=upgrades", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=upgrades")
 
 
 @router.get("/{instance_id}/deploy-log", response_class=HTMLResponse)
-def instance_deploy_log(
+async def instance_deploy_log(
     request: Request,
     instance_id: UUID,
     deployment_id: str | None = None,
     auth: WebAuthContext = Depends(require_web_auth),
     db: Session = Depends(get_db),
 ):
-    from app.services.deploy_service import DeployService
-
-    bundle = DeployService(db).get_deploy_log_bundle(instance_id, deployment_id)
+    bundle = await run_in_threadpool(DeployService(db).get_deploy_log_bundle, instance_id, deployment_id)
 
     return templates.TemplateResponse(
         "instances/deploy_log.html",
@@ -464,117 +515,53 @@ def instance_deploy_log(
     )
 
 
-@router.post("/{instance_id}/start")
-def instance_start(
-    request: Request,
-    instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
-):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.instance_service import InstanceService
-
-    svc = InstanceService(db)
-    try:
-        svc.start_instance(instance_id)
-        db.commit()
-    except Exception:
-        db.rollback()
-        logger.exception("Failed to start instance %s", instance_id)
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
-
-
-@router.post("/{instance_id}/stop")
-def instance_stop(
+@router.get("/{instance_id}/deploy-log/steps", response_class=HTMLResponse)
+async def instance_deploy_steps(
     request: Request,
     instance_id: UUID,
+    deployment_id: str | None = None,
     auth: WebAuthContext = Depends(require_web_auth),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.instance_service import InstanceService
+    """HTMX partial: the deploy step list, polled while the deployment runs.
 
-    svc = InstanceService(db)
-    try:
-        svc.stop_instance(instance_id)
-        db.commit()
-    except Exception:
-        db.rollback()
-        logger.exception("Failed to stop instance %s", instance_id)
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
+    The fragment drops its own polling trigger once no step is pending or running.
+    """
+    bundle = await run_in_threadpool(DeployService(db).get_deploy_log_bundle, instance_id, deployment_id)
+    return templates.TemplateResponse(
+        "partials/deploy_steps.html",
+        ctx(
+            request,
+            auth,
+            f"Deploy - {bundle['instance'].org_code}",
+            instance=bundle["instance"],
+            logs=bundle["logs"],
+            deployment_id=bundle["deployment_id"],
+            is_running=bundle["is_running"],
+        ),
+    )
 
 
-@router.post("/{instance_id}/restart")
-def instance_restart(
-    request: Request,
+@router.post("/{instance_id}/delete")
+def instance_delete(
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.instance_service import InstanceService
-
-    svc = InstanceService(db)
     try:
-        svc.restart_instance(instance_id)
-        db.commit()
-    except Exception:
+        deleted = InstanceService(db).delete_if_not_running(instance_id)
+    except ValueError:
+        deleted = False
+    if not deleted:
         db.rollback()
-        logger.exception("Failed to restart instance %s", instance_id)
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
-
-
-@router.post("/{instance_id}/migrate")
-def instance_migrate(
-    request: Request,
-    instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
-):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.instance_service import InstanceService
-
-    svc = InstanceService(db)
-    svc.migrate_instance(instance_id)
+        return redirect_303(f"/instances/{instance_id}")
     db.commit()
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
+    return redirect_303("/instances")
 
 
-@router.post("/{instance_id}/delete")
-def instance_delete(
-    request: Request,
-    instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
-):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.models.instance import InstanceStatus
-    from app.services.instance_service import InstanceService
-
-    svc = InstanceService(db)
-    instance = svc.get_or_404(instance_id)
-
-    if instance.status == InstanceStatus.running:
-        return RedirectResponse(f"/instances/{instance_id}", status_code=302)
-
-    svc.delete(instance_id)
-    db.commit()
-    return RedirectResponse("/instances", status_code=302)
+# Rendered badge keyed by everything the partial reads: (status, response_ms, is_stale). The ETag also
+# covers checked_at, so it changes on every check and would never hit.
+_BADGE_CACHE: BoundedCache[tuple[str | None, int | None, bool], str] = BoundedCache(1024)
 
 
 @router.get("/{instance_id}/health", response_class=HTMLResponse)
@@ -585,24 +572,29 @@ def instance_health_badge(
     db: Session = Depends(get_db),
 ):
     """HTMX partial: health status badge with ETag caching."""
-    from fastapi.responses import Response
 
-    from app.services.health_service import HealthService
+    # A tag cached since the last health poll answers the 304 without querying health checks.
+    if_none_match = request.headers.get("if-none-match")
+    generation, cached_etag = get_badge_etag(instance_id)
+    if if_none_match and if_none_match == cached_etag:
+        return Response(status_code=304, headers={"ETag": cached_etag})
 
     state = HealthService(db).get_badge_state(instance_id)
     etag = state["etag"]
+    if etag != cached_etag:
+        remember_badge_etag(instance_id, generation, etag, state["fresh_seconds"])
 
     # Return 304 if client already has this version
-    if_none_match = request.headers.get("if-none-match")
     if if_none_match and if_none_match == etag:
         return Response(status_code=304, headers={"ETag": etag})
 
-    response = templates.TemplateResponse(
-        "partials/health_badge.html",
-        {"request": request, "health": state["health"], "is_stale": state["is_stale"]},
-    )
-    response.headers["ETag"] = etag
-    return response
+    health = state["health"]
+    key = (health.status.value if health else None, health.response_ms if health else None, state["is_stale"])
+    body = _BADGE_CACHE.get(key)
+    if body is None:
+        body = templates.get_template("partials/health_badge.html").render(health=health, is_stale=state["is_stale"])
+        _BADGE_CACHE.set(key, body)
+    return HTMLResponse(body, headers={"ETag": etag})
 
 
 # ──────────────────── Reconfigure (lightweight deploy) ───────────
@@ -610,26 +602,15 @@ def instance_health_badge(
 
 @router.post("/{instance_id}/reconfigure")
 def instance_reconfigure(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.deploy_service import DeployService
-    from app.tasks.deploy import deploy_instance
-
     deploy_svc = DeployService(db)
     deployment_id = deploy_svc.create_deployment(instance_id, deployment_type="reconfigure")
     db.commit()
     deploy_instance.delay(str(instance_id), deployment_id, deployment_type="reconfigure")
-    return RedirectResponse(
-        f"/instances/{instance_id}/deploy-log?deployment_id={deployment_id}",
-        status_code=302,
-    )
+    return redirect_303(f"/instances/{instance_id}/deploy-log?deployment_id={deployment_id}")
 
 
 # ──────────────────── Module toggle ──────────────────────────────
@@ -637,26 +618,19 @@ def instance_reconfigure(
 
 @router.post("/{instance_id}/modules/{module_id}/toggle")
 def toggle_module(
-    request: Request,
     instance_id: UUID,
     module_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     enabled: str = Form("off"),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.module_service import ModuleService
-
     svc = ModuleService(db)
     try:
         svc.set_module_enabled(instance_id, module_id, enabled == "on")
         db.commit()
     except ValueError as e:
         logger.warning("Module toggle failed: %s", e)
-    return RedirectResponse(f"/instances/{instance_id}#modules", status_code=302)
+    return redirect_303(f"/instances/{instance_id}#modules")
 
 
 # ──────────────────── Feature flag toggle ────────────────────────
@@ -664,23 +638,16 @@ def toggle_module(
 
 @router.post("/{instance_id}/flags/{flag_key}/toggle")
 def toggle_flag(
-    request: Request,
     instance_id: UUID,
     flag_key: str,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     value: str = Form("false"),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.feature_flag_service import FeatureFlagService
-
     svc = FeatureFlagService(db)
     svc.set_flag(instance_id, flag_key, value)
     db.commit()
-    return RedirectResponse(f"/instances/{instance_id}#flags", status_code=302)
+    return redirect_303(f"/instances/{instance_id}#flags")
 
 
 # ──────────────────── Plan assignment ────────────────────────────
@@ -688,21 +655,14 @@ def toggle_flag(
 
 @router.post("/{instance_id}/plan")
 def assign_plan(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     plan_id: str = Form(""),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.instance_service import InstanceService
-
     InstanceService(db).assign_plan(instance_id, UUID(plan_id) if plan_id else None)
     db.commit()
-    return RedirectResponse(f"/instances/{instance_id}#plan", status_code=302)
+    return redirect_303(f"/instances/{instance_id}#plan")
 
 
 # ──────────────────── Backups ────────────────────────────────────
@@ -710,128 +670,84 @@ def assign_plan(
 
 @router.post("/{instance_id}/backup")
 def create_backup(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.backup_service import BackupService
-
     svc = BackupService(db)
     svc.create_backup(instance_id)
     db.commit()
-    return RedirectResponse(f"/instances/{instance_id}#backups", status_code=302)
+    return redirect_303(f"/instances/{instance_id}#backups")
 
 
 # ──────────────────── Lifecycle actions ──────────────────────────
 
+# Each action keeps its own "/{instance_id}/<action>" URL but shares one handler body. A single
+# "/{instance_id}/{action}" route would shadow later routers' posts such as otel_web's "/otel".
+# The SSH-backed actions are queued on Celery so no request thread waits on docker compose.
+_INSTANCE_ACTIONS: dict[str, Callable[[Session, UUID, str], object]] = {
+    "start": lambda db, instance_id, reason: start_instance_task.delay(str(instance_id)),
+    "stop": lambda db, instance_id, reason: stop_instance_task.delay(str(instance_id)),
+    "restart": lambda db, instance_id, reason: restart_instance_task.delay(str(instance_id)),
+    "migrate": lambda db, instance_id, reason: migrate_instance_task.delay(str(instance_id)),
+    "suspend": lambda db, instance_id, reason: LifecycleService(db).suspend_instance(instance_id, reason or None),
+    "reactivate": lambda db, instance_id, reason: LifecycleService(db).reactivate_instance(instance_id),
+    "archive": lambda db, instance_id, reason: LifecycleService(db).archive_instance(instance_id),
+}
+
+
+def _add_instance_action_route(action: str, run: Callable[[Session, UUID, str], object]) -> None:
+    def instance_action(
+        instance_id: UUID,
+        auth: WebAuthContext = Depends(require_admin_csrf),
+        db: Session = Depends(get_db),
+        reason: str = Form(""),
+    ):
+        try:
+            run(db, instance_id, reason)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to %s instance %s", action, instance_id)
+        return redirect_303(f"/instances/{instance_id}")
 
-@router.post("/{instance_id}/suspend")
-def suspend_instance(
-    request: Request,
-    instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
-    reason: str = Form(""),
-    csrf_token: str = Form(""),
-):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
+    router.add_api_route(f"/{{instance_id}}/{action}", instance_action, methods=["POST"], name=f"instance_{action}")
 
-    from app.services.lifecycle_service import LifecycleService
 
-    svc = LifecycleService(db)
-    svc.suspend_instance(instance_id, reason or None)
-    db.commit()
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
+for _action, _run in _INSTANCE_ACTIONS.items():
+    _add_instance_action_route(_action, _run)
 
 
 @router.post("/{instance_id}/secrets/rotate")
 def instance_rotate_secret(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     secret_name: str = Form(...),
     confirm_destructive: str | None = Form(None),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.tasks.secrets import rotate_secret_task
-
     rotate_secret_task.delay(
         str(instance_id),
         secret_name,
         rotated_by=str(auth.person_id) if auth else None,
         confirm_destructive=bool(confirm_destructive),
     )
-    return RedirectResponse(f"/instances/{instance_id}?tab=secrets", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=secrets")
 
 
 @router.post("/{instance_id}/secrets/rotate-all")
 def instance_rotate_all_secrets(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     confirm_destructive: str | None = Form(None),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.tasks.secrets import rotate_all_secrets_task
-
     rotate_all_secrets_task.delay(
         str(instance_id),
         rotated_by=str(auth.person_id) if auth else None,
         confirm_destructive=bool(confirm_destructive),
     )
-    return RedirectResponse(f"/instances/{instance_id}?tab=secrets", status_code=302)
-
-
-@router.post("/{instance_id}/reactivate")
-def reactivate_instance(
-    request: Request,
-    instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
-):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.lifecycle_service import LifecycleService
-
-    svc = LifecycleService(db)
-    svc.reactivate_instance(instance_id)
-    db.commit()
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
-
-
-@router.post("/{instance_id}/archive")
-def archive_instance(
-    request: Request,
-    instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
-    db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
-):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.lifecycle_service import LifecycleService
-
-    svc = LifecycleService(db)
-    svc.archive_instance(instance_id)
-    db.commit()
-    return RedirectResponse(f"/instances/{instance_id}", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=secrets")
 
 
 # ──────────────────── Domain management ──────────────────────────
@@ -839,82 +755,52 @@ def archive_instance(
 
 @router.post("/{instance_id}/domains/add")
 def add_domain(
-    request: Request,
     instance_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
     domain: str = Form(...),
     is_primary: str = Form("off"),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.add_domain(instance_id, domain, is_primary == "on")
         db.commit()
     except ValueError as e:
         logger.warning("Domain add failed: %s", e)
-    return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=domains")
 
 
 @router.post("/{instance_id}/domains/{domain_id}/verify")
 def verify_domain(
-    request: Request,
     instance_id: UUID,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.domain_service import DomainService
-
-    svc = DomainService(db)
-    svc.verify_domain(instance_id, domain_id)
-    db.commit()
-    return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
+    # The DNS lookup runs over SSH (up to 15s), so it is queued rather than holding a request thread.
+    verify_domain_task.delay(str(instance_id), str(domain_id))
+    return redirect_303(f"/instances/{instance_id}?tab=domains")
 
 
 @router.post("/{instance_id}/domains/{domain_id}/delete")
 def delete_domain(
-    request: Request,
     instance_id: UUID,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.domain_service import DomainService
-
-    svc = DomainService(db)
-    svc.remove_domain(instance_id, domain_id)
-    db.commit()
-    return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
+    # Removal also clears the Caddy config over SSH.
+    remove_domain_task.delay(str(instance_id), str(domain_id))
+    return redirect_303(f"/instances/{instance_id}?tab=domains")
 
 
 @router.post("/{instance_id}/domains/{domain_id}/provision-ssl")
 def provision_ssl(
-    request: Request,
     instance_id: UUID,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.provision_ssl(instance_id, domain_id)
@@ -922,23 +808,16 @@ def provision_ssl(
     except ValueError as e:
         db.rollback()
         logger.warning("SSL provision failed: %s", e)
-    return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=domains")
 
 
 @router.post("/{instance_id}/domains/{domain_id}/activate")
 def activate_domain(
-    request: Request,
     instance_id: UUID,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.activate_domain(instance_id, domain_id)
@@ -946,23 +825,16 @@ def activate_domain(
     except ValueError as e:
         db.rollback()
         logger.warning("Domain activation failed: %s", e)
-    return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=domains")
 
 
 @router.post("/{instance_id}/domains/{domain_id}/primary")
 def set_primary_domain(
-    request: Request,
     instance_id: UUID,
     domain_id: UUID,
-    auth: WebAuthContext = Depends(require_web_auth),
+    auth: WebAuthContext = Depends(require_admin_csrf),
     db: Session = Depends(get_db),
-    csrf_token: str = Form(""),
 ):
-    require_admin(auth)
-    validate_csrf_token(request, csrf_token)
-
-    from app.services.domain_service import DomainService
-
     svc = DomainService(db)
     try:
         svc.set_primary(instance_id, domain_id)
@@ -970,4 +842,4 @@ def set_primary_domain(
     except ValueError as e:
         db.rollback()
         logger.warning("Set primary domain failed: %s", e)
-    return RedirectResponse(f"/instances/{instance_id}?tab=domains", status_code=302)
+    return redirect_303(f"/instances/{instance_id}?tab=domains")
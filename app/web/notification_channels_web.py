@@ -7,13 +7,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.models.notification_channel import ChannelType
 from app.services.common import coerce_uuid
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin, validate_csrf_token
+from app.web.helpers import ctx, require_admin, templates, validate_csrf_token
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +22,6 @@ def _auth_person_uuid(auth: WebAuthContext) -> UUID | None:
     return coerce_uuid(auth.person_id) if auth and auth.person_id else None
 
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/notification-preferences")
 
 
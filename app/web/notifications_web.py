@@ -7,16 +7,14 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.services.common import coerce_uuid
 from app.web.deps import WebAuthContext, get_db, optional_web_auth, require_web_auth
-from app.web.helpers import validate_csrf_token
+from app.web.helpers import templates, validate_csrf_token
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/notifications")
 
 
@@ -4,16 +4,14 @@ import logging
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, Response
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.services.common import coerce_uuid
 from app.services.onboarding_service import OnboardingService
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, validate_csrf_token
+from app.web.helpers import ctx, templates, validate_csrf_token
 
 logger = logging.getLogger(__name__)
-templates = Jinja2Templates(directory="templates")
 router = APIRouter()
 
 
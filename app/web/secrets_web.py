@@ -4,13 +4,11 @@ Secrets — Web routes for secret resolution status.
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin
+from app.web.helpers import ctx, require_admin, templates
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/secrets")
 
 
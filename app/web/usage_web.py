@@ -6,13 +6,11 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.web.deps import WebAuthContext, get_db, require_web_auth
-from app.web.helpers import ctx, require_admin
+from app.web.helpers import ctx, require_admin, templates
 
-templates = Jinja2Templates(directory="templates")
 router = APIRouter(prefix="/usage")
 
 
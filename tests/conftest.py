@@ -121,6 +121,8 @@ _TestSessionLocal = sessionmaker(bind=_test_engine, autoflush=False, autocommit=
 mock_db_module = ModuleType("app.db")
 mock_db_module.Base = TestBase  # type: ignore[attr-defined]
 mock_db_module.SessionLocal = _TestSessionLocal  # type: ignore[attr-defined]
+mock_db_module.ReadSessionLocal = _TestSessionLocal  # type: ignore[attr-defined]
+mock_db_module.SoftCommitSessionLocal = _TestSessionLocal  # type: ignore[attr-defined]
 mock_db_module.get_engine = lambda: _test_engine  # type: ignore[attr-defined]
 
 # Also mock app.config to prevent .env loading
@@ -133,6 +135,8 @@ class MockSettings:
     db_max_overflow = 10
     db_pool_timeout = 30
     db_pool_recycle = 1800
+    database_read_url = None
+    threadpool_size = 40
     avatar_upload_dir = "static/avatars"
     avatar_max_size_bytes = 2 * 1024 * 1024
     avatar_allowed_types = "image/jpeg,image/png,image/gif,image/webp"
@@ -142,6 +146,8 @@ class MockSettings:
     brand_logo_url = None
     testing = True
     use_cdn_assets = False
+    template_auto_reload = False
+    template_bytecode_cache_dir = ""
     health_stale_seconds = 180
 
 
@@ -322,6 +328,7 @@ def client(db_session):
         seed_scheduler_settings,
     )
     from app.web.deps import get_db as web_get_db
+    from app.web.deps import get_read_db as web_get_read_db
 
     def override_get_db():
         return db_session
@@ -338,6 +345,7 @@ def client(db_session):
     app.dependency_overrides[scheduler_get_db] = override_get_db
     app.dependency_overrides[auth_deps_get_db] = override_get_db
     app.dependency_overrides[web_get_db] = override_get_db
+    app.dependency_overrides[web_get_read_db] = override_get_db
     app.dependency_overrides[deps_get_db] = override_get_db
 
     # Seed defaults up front in the shared test session to avoid lifespan startup
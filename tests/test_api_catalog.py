@@ -100,3 +100,33 @@ def test_deactivate_catalog_item(client, admin_headers, db_session):
     assert response.status_code == 204
     db_session.refresh(item)
     assert item.is_active is False
+
+
+def test_catalog_signature_changes_on_create_and_deactivate(db_session):
+    from app.services.catalog_service import CatalogService
+
+    svc = CatalogService(db_session)
+    repo = _seed_repo(db_session)
+    before = svc.get_catalog_signature()
+    item = _seed_item(db_session, repo.repo_id)
+    after_create = svc.get_catalog_signature()
+    assert after_create != before
+    assert svc.get_catalog_signature() == after_create
+
+    svc.deactivate_catalog_item(item.catalog_id)
+    assert svc.get_catalog_signature() != after_create
+
+
+def test_list_for_form_returns_active_item_columns(db_session):
+    from app.services.catalog_service import CatalogService
+
+    repo = _seed_repo(db_session)
+    item = _seed_item(db_session, repo.repo_id)
+    hidden = _seed_item(db_session, repo.repo_id)
+    hidden.is_active = False
+    db_session.commit()
+
+    rows = {row.catalog_id: row for row in CatalogService(db_session).list_for_form()}
+    assert hidden.catalog_id not in rows
+    row = rows[item.catalog_id]
+    assert (row.label, row.version, row.git_ref) == (item.label, "1.0.0", "main")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.models.auth import SessionStatus
+from app.services import auth_cache
+from app.services.auth_session_service import revoke_session
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def incr(self, key):
+        value = int(self.store.get(key, b"0")) + 1
+        self.store[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setenv("REDIS_URL", "redis://cache")
+    monkeypatch.setattr(auth_cache, "get_redis_client", lambda ignore_backoff=False: client)
+    monkeypatch.setattr(auth_cache, "_invalidation_missed", False)
+    return client
+
+
+def test_session_state_without_redis_reads_db(db_session, auth_session, monkeypatch):
+    monkeypatch.setattr(auth_cache, "get_redis_client", lambda ignore_backoff=False: None)
+    state = auth_cache.get_session_state(db_session, auth_session.id)
+    assert state is not None
+    assert state.is_valid()
+
+
+def test_session_state_is_cached_on_miss(db_session, auth_session, fake_redis):
+    key = f"auth:sess:{auth_session.id}"
+    state = auth_cache.get_session_state(db_session, auth_session.id)
+    assert state is not None and state.is_valid()
+    assert key in fake_redis.store
+    assert fake_redis.ttls[key] == 60
+
+    # A hit is served from the cache without consulting the row.
+    auth_session.status = SessionStatus.revoked
+    db_session.commit()
+    assert auth_cache.get_session_state(db_session, auth_session.id) == state
+
+
+def test_session_state_invalidated_on_revoke(db_session, person, auth_session, fake_redis):
+    key = f"auth:sess:{auth_session.id}"
+    auth_cache.get_session_state(db_session, auth_session.id)
+    revoke_session(db_session, str(person.id), str(auth_session.id))
+    # Nothing is invalidated until the revocation is committed.
+    assert fake_redis.store[key] != auth_cache._TOMBSTONE
+    db_session.commit()
+    assert fake_redis.store[key] == auth_cache._TOMBSTONE
+
+    state = auth_cache.get_session_state(db_session, auth_session.id)
+    assert state is not None
+    assert not state.is_valid()
+    # Readers never overwrite the tombstone, so a racing pre-commit read cannot re-cache "active".
+    assert fake_redis.store[key] == auth_cache._TOMBSTONE
+
+
+def test_pending_invalidation_dropped_on_rollback(db_session, person, auth_session, fake_redis):
+    key = f"auth:sess:{auth_session.id}"
+    auth_cache.get_session_state(db_session, auth_session.id)
+    revoke_session(db_session, str(person.id), str(auth_session.id))
+    db_session.rollback()
+    db_session.commit()
+    assert fake_redis.store[key] != auth_cache._TOMBSTONE
+
+
+def test_missed_invalidation_bumps_generation_before_reading(db_session, auth_session, fake_redis, monkeypatch):
+    key = f"auth:sess:{auth_session.id}"
+    auth_cache.get_session_state(db_session, auth_session.id)
+
+    monkeypatch.setattr(auth_cache, "get_redis_client", lambda ignore_backoff=False: None)
+    auth_session.status = SessionStatus.revoked
+    db_session.commit()
+    auth_cache.invalidate_session_state(auth_session.id)
+    assert auth_cache._invalidation_missed is True
+
+    # Redis is back but still holds the stale "active" entry.
+    monkeypatch.setattr(auth_cache, "get_redis_client", lambda ignore_backoff=False: fake_redis)
+    state = auth_cache.get_session_state(db_session, auth_session.id)
+    assert not state.is_valid()
+    assert fake_redis.store["auth:sess:gen"] == b"1"
+    assert auth_cache._invalidation_missed is False
+    assert key in fake_redis.store
+
+
+def test_session_state_ttl_capped_by_expiry(db_session, auth_session, fake_redis):
+    auth_session.expires_at = datetime.now(UTC) + timedelta(seconds=20)
+    db_session.commit()
+
+    auth_cache.get_session_state(db_session, auth_session.id)
+    assert fake_redis.ttls[f"auth:sess:{auth_session.id}"] <= 20
+
+
+def test_session_state_expired_is_invalid():
+    past = int((datetime.now(UTC) - timedelta(seconds=1)).timestamp())
+    assert not auth_cache.SessionState(active=True, expires_at=past).is_valid()
+    assert auth_cache.SessionState(active=True, expires_at=None).is_valid()
@@ -115,6 +115,87 @@ def test_decode_access_token_uses_openbao_secret(monkeypatch):
     assert decoded["typ"] == "access"
 
 
+def test_decode_access_token_caches_verified_payload(monkeypatch):
+    from app.services import auth_flow
+
+    calls = []
+    real_decode = auth_flow._decode_jwt
+
+    def counting_decode(db, token, expected_type):
+        calls.append(token)
+        return real_decode(db, token, expected_type)
+
+    monkeypatch.setattr(auth_flow, "_decode_jwt", counting_decode)
+    now = datetime.now(UTC)
+    payload = {
+        "sub": f"user-{uuid.uuid4().hex}",
+        "session_id": "session-id",
+        "typ": "access",
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(minutes=5)).timestamp()),
+    }
+    token = jwt.encode(payload, "test-secret", algorithm="HS256")
+
+    first = decode_access_token(None, token)
+    first["sub"] = "mutated"
+    second = decode_access_token(None, token)
+
+    assert second["sub"] == payload["sub"]
+    assert calls == [token]
+
+
+def test_decode_access_token_cache_respects_expiry(monkeypatch):
+    from app.services import auth_flow
+
+    calls = []
+    real_decode = auth_flow._decode_jwt
+
+    def counting_decode(db, token, expected_type):
+        calls.append(token)
+        return real_decode(db, token, expected_type)
+
+    monkeypatch.setattr(auth_flow, "_decode_jwt", counting_decode)
+    now = datetime.now(UTC)
+    payload = {
+        "sub": f"user-{uuid.uuid4().hex}",
+        "session_id": "session-id",
+        "typ": "access",
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(minutes=5)).timestamp()),
+    }
+    token = jwt.encode(payload, "test-secret", algorithm="HS256")
+    decode_access_token(None, token)
+
+    # Once the cached exp has passed the token is verified again.
+    monkeypatch.setattr(auth_flow.time, "time", lambda: now.timestamp() + 600)
+    decode_access_token(None, token)
+    assert calls == [token, token]
+
+
+def test_decode_access_token_cache_dropped_on_secret_rotation(monkeypatch):
+    from fastapi import HTTPException
+
+    from app.services import auth_flow
+
+    monkeypatch.setenv("JWT_SECRET", "test-secret")
+    now = datetime.now(UTC)
+    payload = {
+        "sub": f"user-{uuid.uuid4().hex}",
+        "session_id": "session-id",
+        "typ": "access",
+        "iat": int(now.timestamp()),
+        "exp": int((now + timedelta(minutes=5)).timestamp()),
+    }
+    token = jwt.encode(payload, "test-secret", algorithm="HS256")
+    assert decode_access_token(None, token)["sub"] == payload["sub"]
+
+    monkeypatch.setenv("JWT_SECRET", "rotated-secret")
+    monkeypatch.setattr(auth_flow, "_token_cache_key_checked_at", float("-inf"))
+    with pytest.raises(HTTPException) as exc:
+        decode_access_token(None, token)
+    assert exc.value.status_code == 401
+
+
 # ---------------------------------------------------------------------------
 # _jwt_algorithm allowlist guard tests
 # ---------------------------------------------------------------------------
@@ -112,7 +112,7 @@ def test_session_delete_revokes(db_session, person):
 
 def test_api_key_generate_with_redis(monkeypatch, db_session):
     fake = _FakeRedis()
-    monkeypatch.setattr(auth_service, "_get_redis_client", lambda: fake)
+    monkeypatch.setattr(auth_service, "get_redis_client", lambda: fake)
     payload = ApiKeyGenerateRequest(label="test")
     result = auth_service.api_keys.generate_with_rate_limit(db_session, payload, None)
     raw_key = result["key"]
@@ -121,7 +121,7 @@ def test_api_key_generate_with_redis(monkeypatch, db_session):
 
 
 def test_api_key_rate_limit_requires_redis(monkeypatch, db_session):
-    monkeypatch.setattr(auth_service, "_get_redis_client", lambda: None)
+    monkeypatch.setattr(auth_service, "get_redis_client", lambda: None)
     with pytest.raises(HTTPException) as exc:
         auth_service.api_keys.generate_with_rate_limit(db_session, ApiKeyGenerateRequest(label="test"), None)
     assert exc.value.status_code == 503
@@ -130,7 +130,7 @@ def test_api_key_rate_limit_requires_redis(monkeypatch, db_session):
 def test_api_key_rate_limit_uses_forwarded_for_for_trusted_proxy(monkeypatch, db_session):
     monkeypatch.setenv("TRUSTED_PROXY_IPS", "10.0.0.1")
     fake = _FakeRedis()
-    monkeypatch.setattr(auth_service, "_get_redis_client", lambda: fake)
+    monkeypatch.setattr(auth_service, "get_redis_client", lambda: fake)
 
     request = MagicMock()
     request.client.host = "10.0.0.1"
@@ -144,7 +144,7 @@ def test_api_key_rate_limit_uses_forwarded_for_for_trusted_proxy(monkeypatch, db
 def test_api_key_rate_limit_ignores_forwarded_for_for_untrusted_peer(monkeypatch, db_session):
     monkeypatch.setenv("TRUSTED_PROXY_IPS", "10.0.0.1")
     fake = _FakeRedis()
-    monkeypatch.setattr(auth_service, "_get_redis_client", lambda: fake)
+    monkeypatch.setattr(auth_service, "get_redis_client", lambda: fake)
 
     request = MagicMock()
     request.client.host = "203.0.113.10"
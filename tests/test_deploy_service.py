@@ -215,3 +215,33 @@ class TestRunDeployment:
         mock_get_ssh.assert_not_called()
         mock_ssh_service.assert_not_called()
         mock_step_backup.assert_not_called()
+
+
+class TestDeploymentLogQueries:
+    def test_latest_deployment_logs_returns_only_the_newest_deployment(self, db_session):
+        svc = DeployService(db_session)
+        instance = _make_instance(db_session, _make_server(db_session))
+        assert svc.get_latest_deployment_logs(instance.instance_id) == (None, [])
+
+        older = _create_pending_deployment(svc, instance)
+        for log in svc.get_deployment_logs(instance.instance_id, older):
+            log.status = DeployStepStatus.success
+        db_session.commit()
+        newest = _create_pending_deployment(svc, instance)
+
+        deployment_id, logs = svc.get_latest_deployment_logs(instance.instance_id)
+        assert deployment_id == newest == svc.get_latest_deployment_id(instance.instance_id)
+        assert [log.id for log in logs] == [log.id for log in svc.get_deployment_logs(instance.instance_id, newest)]
+
+    def test_active_deployment_tracks_pending_and_running_steps(self, db_session):
+        svc = DeployService(db_session)
+        instance = _make_instance(db_session, _make_server(db_session))
+        assert svc.has_active_deployment(instance.instance_id) is False
+
+        deployment_id = _create_pending_deployment(svc, instance)
+        assert svc.has_active_deployment(instance.instance_id) is True
+
+        for log in svc.get_deployment_logs(instance.instance_id, deployment_id):
+            log.status = DeployStepStatus.success
+        db_session.commit()
+        assert svc.has_active_deployment(instance.instance_id) is False
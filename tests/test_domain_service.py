@@ -0,0 +1,68 @@
+"""Tests for DomainService."""
+
+import uuid
+
+from app.models.instance import Instance, InstanceStatus
+from app.models.instance_domain import DomainStatus, InstanceDomain
+from app.models.server import Server
+from app.services.domain_service import DomainService
+
+
+def _make_instance(db_session):
+    server = Server(
+        name=f"server-{uuid.uuid4().hex[:6]}",
+        hostname="localhost",
+        ssh_port=22,
+        ssh_user="root",
+        ssh_key_path="/root/.ssh/id_rsa",
+        is_local=True,
+    )
+    db_session.add(server)
+    db_session.commit()
+    code = f"org{uuid.uuid4().hex[:6]}"
+    instance = Instance(
+        server_id=server.server_id,
+        org_code=code,
+        org_name=f"Org {code}",
+        app_port=8080,
+        db_port=5432,
+        redis_port=6379,
+        status=InstanceStatus.running,
+    )
+    db_session.add(instance)
+    db_session.commit()
+    db_session.refresh(instance)
+    return instance
+
+
+def _make_domain(db_session, instance, *, ssl_expires_at=None, is_primary=False):
+    domain = InstanceDomain(
+        instance_id=instance.instance_id,
+        domain=f"d-{uuid.uuid4().hex[:8]}.example.com",
+        status=DomainStatus.active,
+        is_primary=is_primary,
+        ssl_expires_at=ssl_expires_at,
+    )
+    db_session.add(domain)
+    db_session.commit()
+    return domain
+
+
+def test_primary_domain_moves_with_add_and_set_primary(db_session):
+    instance = _make_instance(db_session)
+    other = _make_instance(db_session)
+    old = _make_domain(db_session, instance, is_primary=True)
+    plain = _make_domain(db_session, instance)
+    plain_updated_at = plain.updated_at
+    other_primary = _make_domain(db_session, other, is_primary=True)
+    svc = DomainService(db_session)
+
+    added = svc.add_domain(instance.instance_id, f"n-{uuid.uuid4().hex[:8]}.example.com", is_primary=True)
+    db_session.commit()
+    assert (old.is_primary, plain.is_primary, added.is_primary) == (False, False, True)
+
+    svc.set_primary(instance.instance_id, old.domain_id)
+    db_session.commit()
+    assert (old.is_primary, plain.is_primary, added.is_primary) == (True, False, False)
+    assert plain.updated_at == plain_updated_at
+    assert other_primary.is_primary is True
@@ -0,0 +1,92 @@
+"""Tests for the SSH-backed domain tasks and the routes that queue them."""
+
+from __future__ import annotations
+
+import re
+import uuid
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from app.models.instance import Instance, InstanceStatus
+from app.models.instance_domain import DomainStatus, InstanceDomain
+from app.models.server import Server
+from app.tasks.domains import remove_domain_task, verify_domain_task
+from tests.conftest import TestBase, _test_engine
+
+TestBase.metadata.create_all(_test_engine)
+
+
+def _make_domain(db_session) -> InstanceDomain:
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    instance = Instance(
+        server_id=server.server_id,
+        org_code=f"DOM{uuid.uuid4().hex[:6].upper()}",
+        org_name="Domain Org",
+        app_port=8003,
+        db_port=5435,
+        redis_port=6382,
+        status=InstanceStatus.running,
+    )
+    db_session.add(instance)
+    db_session.flush()
+    domain = InstanceDomain(
+        instance_id=instance.instance_id,
+        domain=f"example-{uuid.uuid4().hex[:6]}.com",
+        status=DomainStatus.pending_verification,
+        verification_token="token-123",
+    )
+    db_session.add(domain)
+    db_session.commit()
+    db_session.refresh(domain)
+    return domain
+
+
+@contextmanager
+def _task_session(db_session):
+    with patch("app.tasks.domains.SessionLocal") as mock_sl:
+        mock_sl.return_value.__enter__ = lambda s: db_session
+        mock_sl.return_value.__exit__ = MagicMock(return_value=False)
+        yield
+
+
+def test_verify_task_commits_the_verified_status(db_session) -> None:
+    domain = _make_domain(db_session)
+    ssh = MagicMock()
+    ssh.exec_command.return_value.stdout = '"token-123"\n'
+
+    with _task_session(db_session), patch("app.services.domain_service.get_ssh_for_server", return_value=ssh):
+        result = verify_domain_task(str(domain.instance_id), str(domain.domain_id))
+
+    db_session.refresh(domain)
+    assert result == {"verified": True}
+    assert domain.status == DomainStatus.verified
+
+
+def test_remove_task_rejects_a_domain_from_another_instance(db_session) -> None:
+    domain = _make_domain(db_session)
+
+    with _task_session(db_session):
+        result = remove_domain_task(str(uuid.uuid4()), str(domain.domain_id))
+
+    assert result["success"] is False
+    assert db_session.get(InstanceDomain, domain.domain_id) is not None
+
+
+def test_delete_route_queues_the_task(client, admin_token, db_session) -> None:
+    domain = _make_domain(db_session)
+    client.cookies.set("access_token", admin_token)
+    page = client.get("/instances/new")
+    csrf_token = re.search(r'name="csrf_token"\s+value="([^"]+)"', page.text).group(1)
+
+    with patch("app.tasks.domains.remove_domain_task.delay") as mock_delay:
+        response = client.post(
+            f"/instances/{domain.instance_id}/domains/{domain.domain_id}/delete",
+            headers={"X-CSRF-Token": csrf_token},
+            follow_redirects=False,
+        )
+
+    assert response.status_code == 303
+    mock_delay.assert_called_once_with(str(domain.instance_id), str(domain.domain_id))
+    assert db_session.get(InstanceDomain, domain.domain_id) is not None
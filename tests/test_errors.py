@@ -0,0 +1,19 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.errors import register_error_handlers
+
+
+def test_pool_timeout_returns_503_with_retry_after():
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.get("/busy")
+    def busy():
+        raise PoolTimeoutError("QueuePool limit reached")
+
+    response = TestClient(app, raise_server_exceptions=False).get("/busy")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["code"] == "db_pool_exhausted"
@@ -216,3 +216,103 @@ def test_create_repo_with_environment_staging(db_session):
 
     assert repo.environment == RegistryEnvironment.staging
     assert repo.registry_url == "ghcr.io/acme/staging"
+
+
+def test_list_for_web_returns_display_columns_only(db_session):
+    svc = GitRepoService(db_session)
+    repo = svc.create_repo(
+        label=f"web-{uuid.uuid4().hex[:6]}",
+        auth_type=GitAuthType.token,
+        registry_url="ghcr.io/acme/repo",
+        credential="ghp_test123",
+    )
+    db_session.commit()
+
+    rows = svc.list_for_web()
+    assert [row.repo_id for row in rows] == [repo.repo_id]
+    assert rows[0].registry_url == "ghcr.io/acme/repo"
+    assert "token_encrypted" not in rows[0]._fields
+
+
+def test_set_platform_default_moves_flag(db_session):
+    svc = GitRepoService(db_session)
+    old = svc.create_repo(
+        label=f"old-{uuid.uuid4().hex[:6]}",
+        auth_type=GitAuthType.none,
+        registry_url="ghcr.io/acme/old",
+        is_platform_default=True,
+    )
+    new = svc.create_repo(
+        label=f"new-{uuid.uuid4().hex[:6]}", auth_type=GitAuthType.none, registry_url="ghcr.io/acme/new"
+    )
+    new.is_active = False
+    db_session.commit()
+
+    svc.set_platform_default(new.repo_id)
+    db_session.commit()
+
+    assert new.is_platform_default is True
+    assert new.is_active is True
+    assert old.is_platform_default is False
+    assert old.is_active is True
+
+
+def test_set_platform_default_missing_repo(db_session):
+    with pytest.raises(ValueError, match="Repo not found"):
+        GitRepoService(db_session).set_platform_default(uuid.uuid4())
+
+
+def test_update_repo_fields_keeps_token_when_credential_blank(db_session):
+    svc = GitRepoService(db_session)
+    repo = svc.create_repo(
+        label=f"edit-{uuid.uuid4().hex[:6]}",
+        auth_type=GitAuthType.token,
+        registry_url="ghcr.io/acme/repo",
+        credential="ghp_test123",
+    )
+    db_session.commit()
+    token_before = repo.token_encrypted
+
+    svc.update_repo_fields(
+        repo.repo_id,
+        label="renamed",
+        auth_type=GitAuthType.token,
+        default_branch="develop",
+        is_platform_default=False,
+        registry_url=" ghcr.io/acme/other ",
+        environment="staging",
+    )
+    db_session.commit()
+
+    assert repo.label == "renamed"
+    assert repo.default_branch == "develop"
+    assert repo.registry_url == "ghcr.io/acme/other"
+    assert repo.environment == RegistryEnvironment.staging
+    assert repo.token_encrypted == token_before
+
+
+def test_update_repo_fields_requires_token_for_token_auth(db_session):
+    svc = GitRepoService(db_session)
+    repo = svc.create_repo(label=f"none-{uuid.uuid4().hex[:6]}", auth_type=GitAuthType.none, registry_url="ghcr.io/a/b")
+    db_session.commit()
+
+    with pytest.raises(ValueError, match="Token is required"):
+        svc.update_repo_fields(
+            repo.repo_id,
+            label=repo.label,
+            auth_type=GitAuthType.token,
+            default_branch="main",
+            is_platform_default=False,
+            registry_url="ghcr.io/a/b",
+            environment="production",
+        )
+    with pytest.raises(ValueError, match="Repo not found"):
+        svc.update_repo_fields(
+            uuid.uuid4(),
+            label="x",
+            auth_type=GitAuthType.none,
+            default_branch="main",
+            is_platform_default=False,
+            registry_url="ghcr.io/a/b",
+            environment="production",
+        )
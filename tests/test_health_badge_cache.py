@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from app.services import health_badge_cache
+from app.services.health_service import HealthService
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    def incr(self, key):
+        value = int(self.store.get(key, b"0")) + 1
+        self.store[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setattr(health_badge_cache, "get_redis_client", lambda: client)
+    return client
+
+
+def test_badge_etag_without_redis_is_a_miss(monkeypatch):
+    monkeypatch.setattr(health_badge_cache, "get_redis_client", lambda: None)
+    assert health_badge_cache.get_badge_etag(uuid.uuid4()) == (None, None)
+
+
+def test_badge_etag_round_trip_and_ttl(fake_redis):
+    instance_id = uuid.uuid4()
+    generation, etag = health_badge_cache.get_badge_etag(instance_id)
+    assert (generation, etag) == (b"0", None)
+
+    health_badge_cache.remember_badge_etag(instance_id, generation, '"abc"', fresh_seconds=30)
+    assert health_badge_cache.get_badge_etag(instance_id) == (b"0", '"abc"')
+    assert fake_redis.ttls[f"health:badge:{instance_id}"] == 30
+
+    health_badge_cache.remember_badge_etag(instance_id, generation, '"abc"', fresh_seconds=None)
+    assert fake_redis.ttls[f"health:badge:{instance_id}"] == 90
+
+
+def test_badge_etag_invalidated_by_new_generation(fake_redis):
+    instance_id = uuid.uuid4()
+    generation, _ = health_badge_cache.get_badge_etag(instance_id)
+    health_badge_cache.remember_badge_etag(instance_id, generation, '"abc"', fresh_seconds=None)
+
+    health_badge_cache.invalidate_badge_etags()
+    assert health_badge_cache.get_badge_etag(instance_id) == (b"1", None)
+
+
+def test_badge_route_answers_304_from_cached_etag(client, admin_token, fake_redis, monkeypatch):
+    client.cookies.set("access_token", admin_token)
+    url = f"/instances/{uuid.uuid4()}/health"
+    etag = client.get(url).headers["etag"]
+
+    monkeypatch.setattr(HealthService, "get_badge_state", lambda self, instance_id: pytest.fail("health queried"))
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
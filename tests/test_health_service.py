@@ -233,3 +233,53 @@ class TestQueryMethods:
         recent = svc.get_recent_checks(instance.instance_id, limit=5)
         for i in range(len(recent) - 1):
             assert recent[i].checked_at >= recent[i + 1].checked_at
+
+    def test_get_latest_checks_batch_picks_one_check_per_instance(self, db_session):
+        from app.services.health_service import HealthService
+
+        server = _make_server(db_session, is_local=True)
+        first = _make_instance(db_session, server)
+        second = _make_instance(db_session, server)
+        first_checks = _make_checks(db_session, first.instance_id, 3)
+        tied_at = datetime.now(UTC)
+        tied = _make_checks(db_session, second.instance_id, 1, base_time=tied_at)
+        tied += _make_checks(db_session, second.instance_id, 1, base_time=tied_at)
+
+        latest = HealthService(db_session).get_latest_checks_batch(
+            [first.instance_id, second.instance_id, uuid.uuid4()]
+        )
+        assert set(latest) == {first.instance_id, second.instance_id}
+        assert latest[first.instance_id].id == first_checks[0].id
+        assert latest[second.instance_id].id == max(check.id for check in tied)
+
+    def test_badge_etag_tracks_latest_check_and_staleness(self, db_session):
+        from app.services.health_service import HealthService
+
+        server = _make_server(db_session, is_local=True)
+        instance = _make_instance(db_session, server)
+        svc = HealthService(db_session)
+        empty = svc.get_badge_state(instance.instance_id)
+
+        (check,) = _make_checks(db_session, instance.instance_id, 1)
+        fresh = svc.get_badge_state(instance.instance_id)
+        assert empty["etag"] == '"0-0"'
+        assert fresh["etag"] == f'"{check.id}-0"'
+        assert fresh["etag"] == svc.get_badge_state(instance.instance_id)["etag"]
+        assert 0 < fresh["fresh_seconds"] <= 180
+
+        _make_checks(db_session, instance.instance_id, 1, base_time=datetime.now(UTC) + timedelta(minutes=1))
+        newer = svc.get_badge_state(instance.instance_id)
+        assert newer["etag"] != fresh["etag"]
+
+    def test_badge_fields_project_latest_check_columns(self, db_session):
+        from app.services.health_service import HealthService
+
+        server = _make_server(db_session, is_local=True)
+        instance = _make_instance(db_session, server)
+        svc = HealthService(db_session)
+        assert svc.get_badge_fields(instance.instance_id) is None
+
+        latest = _make_checks(db_session, instance.instance_id, 2)[0]
+        row = svc.get_badge_fields(instance.instance_id)
+        assert row._fields == ("id", "status", "response_ms", "checked_at")
+        assert (row.id, row.status, row.response_ms) == (latest.id, latest.status, latest.response_ms)
@@ -73,3 +73,26 @@ def test_delete_instance_cleans_dependencies(db_session):
     persisted_endpoint = db_session.get(WebhookEndpoint, endpoint.endpoint_id)
     assert persisted_endpoint is not None
     assert persisted_endpoint.instance_id is None
+
+
+def test_delete_if_not_running_skips_running_instances(db_session):
+    from app.services.instance_service import InstanceService
+
+    server = _make_server(db_session)
+    running = _make_instance(db_session, server)
+    running.status = InstanceStatus.running
+    stopped = _make_instance(db_session, server)
+    db_session.add(DeploymentLog(instance_id=stopped.instance_id, deployment_id="d1", step="deploy_start"))
+    db_session.commit()
+    running_id, stopped_id = running.instance_id, stopped.instance_id
+
+    svc = InstanceService(db_session)
+    assert svc.delete_if_not_running(running_id) is False
+    assert svc.delete_if_not_running(uuid.uuid4()) is False
+    assert svc.delete_if_not_running(stopped_id) is True
+    db_session.commit()
+    db_session.expire_all()
+
+    assert db_session.get(Instance, running_id) is not None
+    assert db_session.get(Instance, stopped_id) is None
+    assert db_session.query(DeploymentLog).filter_by(instance_id=stopped_id).count() == 0
@@ -0,0 +1,66 @@
+"""Tests for the SSH-backed instance action tasks and the routes that queue them."""
+
+from __future__ import annotations
+
+import re
+import uuid
+from unittest.mock import MagicMock, patch
+
+from app.models.instance import Instance, InstanceStatus
+from app.models.server import Server
+from app.tasks.instance_ops import start_instance_task
+from tests.conftest import TestBase, _test_engine
+
+TestBase.metadata.create_all(_test_engine)
+
+
+def _make_instance(db_session, status: InstanceStatus) -> Instance:
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    instance = Instance(
+        server_id=server.server_id,
+        org_code=f"OPS{uuid.uuid4().hex[:6].upper()}",
+        org_name="Ops Org",
+        app_port=8002,
+        db_port=5434,
+        redis_port=6381,
+        status=status,
+    )
+    db_session.add(instance)
+    db_session.commit()
+    db_session.refresh(instance)
+    return instance
+
+
+def test_start_task_commits_the_error_status_when_compose_fails(db_session) -> None:
+    # No deploy_path, so the compose call fails before any SSH.
+    instance = _make_instance(db_session, InstanceStatus.stopped)
+
+    with patch("app.tasks.instance_ops.SoftCommitSessionLocal") as mock_sl:
+        mock_sl.return_value.__enter__ = lambda s: db_session
+        mock_sl.return_value.__exit__ = MagicMock(return_value=False)
+        result = start_instance_task(str(instance.instance_id))
+
+    db_session.refresh(instance)
+    assert result["success"] is False
+    assert instance.status == InstanceStatus.error
+
+
+def test_start_route_queues_the_task(client, admin_token, db_session) -> None:
+    instance = _make_instance(db_session, InstanceStatus.stopped)
+    client.cookies.set("access_token", admin_token)
+    page = client.get("/instances/new")
+    csrf_token = re.search(r'name="csrf_token"\s+value="([^"]+)"', page.text).group(1)
+
+    with patch("app.tasks.instance_ops.start_instance_task.delay") as mock_delay:
+        response = client.post(
+            f"/instances/{instance.instance_id}/start",
+            headers={"X-CSRF-Token": csrf_token},
+            follow_redirects=False,
+        )
+
+    assert response.status_code == 303
+    mock_delay.assert_called_once_with(str(instance.instance_id))
+    db_session.refresh(instance)
+    assert instance.status == InstanceStatus.stopped
@@ -1,7 +1,183 @@
-from app.services.instance_service import _quote_env_value
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models.catalog import AppCatalogItem
+from app.models.git_repository import GitAuthType, GitRepository
+from app.models.health_check import HealthCheck, HealthStatus
+from app.models.instance import Instance, InstanceStatus
+from app.models.server import Server
+from app.services.instance_service import InstanceService, _quote_env_value
 
 
 def test_quote_env_value_escapes_backslashes_before_wrapping():
     value = "pass\\word\\"
 
     assert _quote_env_value(value) == '"pass\\\\word\\\\"'
+
+
+def test_create_rejects_org_code_with_trailing_newline(db_session):
+    with pytest.raises(ValueError, match="Invalid org_code"):
+        InstanceService(db_session).create(uuid.uuid4(), "acme\n", "Acme")
+
+
+def test_get_with_server_loads_server_in_the_same_query(db_session):
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="joined.example.com", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    instance = Instance(
+        server_id=server.server_id,
+        org_code=f"JS{uuid.uuid4().hex[:6].upper()}",
+        org_name="Joined",
+        app_port=9960,
+        db_port=9961,
+        redis_port=9962,
+    )
+    db_session.add(instance)
+    db_session.commit()
+    db_session.expire_all()
+
+    loaded = InstanceService(db_session).get_with_server(instance.instance_id)
+    assert "server" not in inspect(loaded).unloaded
+    assert loaded.server.hostname == "joined.example.com"
+    with pytest.raises(ValueError, match="not found"):
+        InstanceService(db_session).get_with_server(uuid.uuid4())
+
+
+def test_list_for_web_after_cursor_matches_offset_page(db_session):
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    prefix = f"ks{uuid.uuid4().hex[:6]}"
+    for i in range(5):
+        db_session.add(
+            Instance(
+                server_id=server.server_id,
+                org_code=f"{prefix}{i}",
+                org_name=f"Org {i}",
+                app_port=9000 + i,
+                db_port=9100 + i,
+                redis_port=9200 + i,
+                status=InstanceStatus.stopped,
+            )
+        )
+    db_session.commit()
+
+    svc = InstanceService(db_session)
+    params = {"q": prefix, "status_filter": None, "health_filter": None, "sort_key": "org_code", "page_size": 2}
+    first = svc.list_for_web(sort_dir="asc", page=1, **params)
+    by_offset = svc.list_for_web(sort_dir="asc", page=2, **params)
+    by_cursor = svc.list_for_web(sort_dir="asc", page=2, after=first.items[-1].instance.org_code, **params)
+
+    assert by_cursor.total == by_offset.total == 5
+    assert [r.instance.org_code for r in by_cursor.items] == [r.instance.org_code for r in by_offset.items]
+    assert [r.instance.org_code for r in by_cursor.items] == [f"{prefix}2", f"{prefix}3"]
+
+    desc = svc.list_for_web(sort_dir="desc", page=2, after=f"{prefix}3", **params)
+    assert [r.instance.org_code for r in desc.items] == [f"{prefix}2", f"{prefix}1"]
+
+
+def test_list_for_web_filters_on_several_statuses(db_session):
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    prefix = f"st{uuid.uuid4().hex[:6]}"
+    statuses = [InstanceStatus.running, InstanceStatus.stopped, InstanceStatus.error]
+    for i, status in enumerate(statuses):
+        db_session.add(
+            Instance(
+                server_id=server.server_id,
+                org_code=f"{prefix}{i}",
+                org_name=f"Org {i}",
+                app_port=9300 + i,
+                db_port=9400 + i,
+                redis_port=9500 + i,
+                status=status,
+            )
+        )
+    db_session.commit()
+
+    svc = InstanceService(db_session)
+    params = {"q": prefix, "health_filter": None, "sort_key": "org_code", "sort_dir": "asc", "page": 1, "page_size": 10}
+    both = svc.list_for_web(status_filter="running, error", **params)
+    assert [r.instance.org_code for r in both.items] == [f"{prefix}0", f"{prefix}2"]
+    assert both.total == 2
+    assert [r.instance.org_code for r in svc.list_for_web(status_filter="stopped", **params).items] == [f"{prefix}1"]
+    assert svc.list_for_web(status_filter="running,bogus", **params).total == 0
+
+
+def test_list_for_web_joins_latest_health_and_catalog(db_session):
+    repo = GitRepository(
+        label=f"repo-{uuid.uuid4().hex[:8]}",
+        auth_type=GitAuthType.none,
+        registry_url="ghcr.io/acme/repo",
+        is_active=True,
+    )
+    db_session.add(repo)
+    db_session.flush()
+    item = AppCatalogItem(
+        label=f"Catalog-{uuid.uuid4().hex[:6]}",
+        version="2.1.0",
+        git_ref="main",
+        git_repo_id=repo.repo_id,
+        module_slugs=[],
+        flag_keys=[],
+        is_active=True,
+    )
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add_all([item, server])
+    db_session.flush()
+    prefix = f"jh{uuid.uuid4().hex[:6]}"
+    running = Instance(
+        server_id=server.server_id,
+        org_code=f"{prefix}0",
+        org_name="Org 0",
+        app_port=9300,
+        db_port=9400,
+        redis_port=9500,
+        status=InstanceStatus.running,
+        catalog_item_id=item.catalog_id,
+    )
+    bare = Instance(
+        server_id=server.server_id,
+        org_code=f"{prefix}1",
+        org_name="Org 1",
+        app_port=9301,
+        db_port=9401,
+        redis_port=9501,
+        status=InstanceStatus.stopped,
+    )
+    db_session.add_all([running, bare])
+    db_session.flush()
+    now = datetime.now(UTC)
+    db_session.add_all(
+        [
+            HealthCheck(
+                instance_id=running.instance_id, checked_at=now - timedelta(minutes=5), status=HealthStatus.unhealthy
+            ),
+            HealthCheck(instance_id=running.instance_id, checked_at=now, status=HealthStatus.healthy, response_ms=42),
+        ]
+    )
+    db_session.commit()
+
+    result = InstanceService(db_session).list_for_web(
+        q=prefix,
+        status_filter=None,
+        health_filter=None,
+        sort_key="org_code",
+        sort_dir="asc",
+        page=1,
+        page_size=10,
+    )
+
+    first, second = result.items
+    with pytest.raises(InvalidRequestError):
+        _ = first.instance.server
+    assert first.health.response_ms == 42
+    assert first.health_state == "healthy"
+    assert (first.catalog_label, first.release_version) == (item.label, "2.1.0")
+    assert second.health is None and second.health_state == "n/a"
+    assert (second.catalog_label, second.release_version) == (None, None)
@@ -153,6 +153,18 @@ def test_update_person(db_session):
     assert updated.last_name == "Person"
 
 
+def test_person_display_cache_invalidated_on_update(db_session):
+    """Test that updating a person refreshes the memoized name and initials."""
+    person = person_service.people.create(
+        db_session,
+        PersonCreate(first_name="ada", last_name="lovelace", email=_unique_email()),
+    )
+    assert person_service.person_display(person) == ("ada lovelace", "AL")
+
+    person_service.people.update(db_session, str(person.id), PersonUpdate(display_name="Countess"))
+    assert person_service.person_display(person) == ("Countess", "AL")
+
+
 def test_delete_person(db_session):
     """Test deleting a person."""
     person = person_service.people.create(
@@ -153,6 +153,18 @@ def test_check_plan_compliance_reports_disallowed_flags(db_session):
     assert any(v.kind == "flag" for v in violations)
 
 
+def test_check_plan_compliance_uses_preloaded_summary_and_flags(db_session):
+    server = _make_server(db_session)
+    plan = _make_plan(db_session, max_users=5, allowed_modules=["core"], allowed_flags=["FEATURE_API_ACCESS"])
+    instance = _make_instance(db_session, server, plan=plan)
+
+    svc = ResourceEnforcementService(db_session)
+    summary = {**svc.get_usage_summary(instance.instance_id), "current_users": 9}
+    flags = [{"key": "FEATURE_SSO_ENABLED", "value": "true"}]
+    violations = svc.check_plan_compliance(instance.instance_id, usage_summary=summary, flag_entries=flags)
+    assert {v.kind for v in violations} >= {"users", "flag"}
+
+
 def test_check_plan_compliance_reports_disallowed_modules(db_session):
     server = _make_server(db_session)
     plan = _make_plan(db_session, allowed_modules=["core"], allowed_flags=["FEATURE_API_ACCESS"])
@@ -3,12 +3,14 @@
 import time
 from unittest.mock import MagicMock, patch
 
+import paramiko
 import pytest
 
 from app.services.ssh_service import (
     _CIRCUIT_FAILURE_THRESHOLD,
     _CIRCUIT_LOCK,
     _CIRCUIT_STATE,
+    _SSH_POOL,
     SSHResult,
     SSHService,
     _circuit_check,
@@ -138,3 +140,62 @@ class TestSSHRetry:
                 with pytest.raises(ConnectionError, match="always fail"):
                     svc._get_client()
         assert mock_client.connect.call_count == 3
+
+
+class TestSSHPool:
+    @pytest.fixture(autouse=True)
+    def clear_pool(self):
+        _SSH_POOL.clear()
+        yield
+        _SSH_POOL.clear()
+
+    def _connect(self, svc):
+        mock_client = MagicMock()
+        mock_client.get_transport.return_value.is_active.return_value = True
+        with patch("app.services.ssh_service.paramiko.SSHClient", return_value=mock_client):
+            assert svc._get_client() is mock_client
+        return mock_client
+
+    def test_reuse_refreshes_idle_time_without_touching_the_socket(self):
+        svc = SSHService(hostname="remote.test", is_local=False, server_id="pool-reuse")
+        client = self._connect(svc)
+        transport = client.get_transport.return_value
+        transport.set_keepalive.assert_called_once()
+        _SSH_POOL["pool-reuse"]["ts"] = time.time() - 200
+
+        with patch("app.services.ssh_service.paramiko.SSHClient") as new_client:
+            assert svc._get_client() is client
+        new_client.assert_not_called()
+        transport.send_ignore.assert_not_called()
+        assert time.time() - _SSH_POOL["pool-reuse"]["ts"] < 5
+
+    def test_exec_reconnects_once_when_the_pooled_channel_cannot_open(self):
+        svc = SSHService(hostname="remote.test", is_local=False, server_id="pool-dead")
+        stale = self._connect(svc)
+        stale.exec_command.side_effect = paramiko.SSHException("SSH session not active")
+
+        fresh = MagicMock()
+        fresh.get_transport.return_value.is_active.return_value = True
+        stdout = MagicMock()
+        fresh.exec_command.return_value = (MagicMock(), stdout, MagicMock())
+        channel = stdout.channel
+        channel.recv_ready.return_value = False
+        channel.recv_stderr_ready.return_value = False
+        channel.exit_status_ready.return_value = True
+        channel.recv_exit_status.return_value = 0
+        with patch("app.services.ssh_service.paramiko.SSHClient", return_value=fresh):
+            result = svc.exec_command("true")
+
+        assert result.ok
+        stale.close.assert_called_once()
+        assert _SSH_POOL["pool-dead"]["client"] is fresh
+
+    def test_exec_surfaces_the_error_when_the_fresh_connection_also_fails(self):
+        svc = SSHService(hostname="remote.test", is_local=False, server_id="pool-down")
+        client = self._connect(svc)
+        client.exec_command.side_effect = paramiko.SSHException("SSH session not active")
+
+        with patch("app.services.ssh_service.paramiko.SSHClient", return_value=client):
+            with pytest.raises(paramiko.SSHException):
+                svc.exec_command("true")
+        assert client.exec_command.call_count == 2
@@ -6,11 +6,12 @@ from datetime import UTC, datetime, timedelta
 from app.api.instances import create_upgrade
 from app.models.app_upgrade import AppUpgrade
 from app.models.catalog import AppCatalogItem
-from app.models.deploy_approval import DeployApproval
+from app.models.deploy_approval import ApprovalStatus, DeployApproval
 from app.models.git_repository import GitAuthType, GitRepository
 from app.models.instance import Instance
 from app.models.instance_tag import InstanceTag
 from app.models.server import Server
+from app.services.approval_service import ApprovalService
 from tests.conftest import TestBase, _test_engine
 
 TestBase.metadata.create_all(_test_engine)
@@ -119,3 +120,38 @@ def test_upgrade_response_includes_approval_id(db_session):
 
     assert resp["approval_required"] is True
     assert resp["approval_id"]
+
+
+def test_pending_upgrade_ids_skips_expired_without_writing(db_session):
+    server = _make_server(db_session)
+    catalog_item = _make_catalog(db_session)
+    instance = _make_instance(db_session, server.server_id)
+    fresh = AppUpgrade(instance_id=instance.instance_id, catalog_item_id=catalog_item.catalog_id)
+    stale = AppUpgrade(instance_id=instance.instance_id, catalog_item_id=catalog_item.catalog_id)
+    db_session.add_all([fresh, stale])
+    db_session.flush()
+    old = DeployApproval(
+        instance_id=instance.instance_id,
+        upgrade_id=stale.upgrade_id,
+        requested_by="admin-user",
+        deployment_type="upgrade",
+        created_at=datetime.now(UTC) - timedelta(days=30),
+    )
+    db_session.add_all(
+        [
+            DeployApproval(
+                instance_id=instance.instance_id,
+                upgrade_id=fresh.upgrade_id,
+                requested_by="admin-user",
+                deployment_type="upgrade",
+            ),
+            old,
+        ]
+    )
+    db_session.commit()
+
+    assert ApprovalService(db_session).get_pending_upgrade_ids(instance.instance_id) == {fresh.upgrade_id}
+    assert old.status == ApprovalStatus.pending
+    # The test DB is shared; leave no stale pending approval behind for the expiry tests.
+    db_session.delete(old)
+    db_session.commit()
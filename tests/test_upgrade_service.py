@@ -95,10 +95,15 @@ def test_run_upgrade_marks_upgrade_completed_when_deploy_succeeds(db_session):
             "app.services.deploy_service.DeployService.run_deployment",
             return_value={"success": True},
         ):
-            UpgradeService(db_session).run_upgrade(upgrade.upgrade_id)
+            with patch.object(db_session, "commit", wraps=db_session.commit) as mock_commit:
+                UpgradeService(db_session).run_upgrade(upgrade.upgrade_id)
 
     db_session.refresh(upgrade)
+    db_session.refresh(instance)
     assert upgrade.status == UpgradeStatus.completed
+    assert instance.catalog_item_id == catalog_item.catalog_id
+    # One commit when the upgrade starts (status + catalog selection), one when it finishes.
+    assert mock_commit.call_count == 2
 
 
 def test_run_upgrade_marks_upgrade_failed_and_sets_error_when_deploy_raises(db_session):
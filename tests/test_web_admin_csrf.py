@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.web import helpers
+from app.web.helpers import generate_csrf_token, validate_csrf_token
+
+
+def _extract_csrf_token(html: str) -> str:
+    match = re.search(r'name="csrf_token"\s+value="([^"]+)"', html)
+    assert match, "csrf_token hidden input not found"
+    return match.group(1)
+
+
+def test_admin_form_post_rejects_non_admin(client, auth_token):
+    client.cookies.set("access_token", auth_token)
+    response = client.post(f"/dr/{uuid.uuid4()}/delete", data={"csrf_token": "x"}, follow_redirects=False)
+    assert response.status_code == 403
+
+
+def test_admin_form_post_rejects_missing_csrf(client, admin_token):
+    client.cookies.set("access_token", admin_token)
+    response = client.post(f"/dr/{uuid.uuid4()}/delete", data={}, follow_redirects=False)
+    assert response.status_code == 403
+
+
+def test_admin_form_post_accepts_valid_csrf(client, admin_token):
+    client.cookies.set("access_token", admin_token)
+    page = client.get("/dr")
+    assert page.status_code == 200
+    csrf_token = _extract_csrf_token(page.text)
+
+    response = client.post(f"/dr/{uuid.uuid4()}/delete", data={"csrf_token": csrf_token}, follow_redirects=False)
+    assert response.status_code == 302
+    assert response.headers["location"] == "/dr"
+
+
+def test_admin_post_accepts_csrf_header_without_form_body(client, admin_token):
+    client.cookies.set("access_token", admin_token)
+    page = client.get("/dr")
+    csrf_token = _extract_csrf_token(page.text)
+    assert f'"X-CSRF-Token": "{csrf_token}"' in page.text
+
+    response = client.post(f"/dr/{uuid.uuid4()}/delete", headers={"X-CSRF-Token": csrf_token}, follow_redirects=False)
+    assert response.status_code == 302
+
+
+def test_admin_post_rejects_bad_csrf_header(client, admin_token):
+    client.cookies.set("access_token", admin_token)
+    response = client.post(f"/dr/{uuid.uuid4()}/delete", headers={"X-CSRF-Token": "1:bad"}, follow_redirects=False)
+    assert response.status_code == 403
+
+
+def test_csrf_token_round_trip_and_tamper():
+    request = Request({"type": "http", "headers": [(b"cookie", b"access_token=abc")]})
+    token = generate_csrf_token(request)
+    validate_csrf_token(request, token)
+
+    with pytest.raises(HTTPException):
+        validate_csrf_token(request, token[:-1] + ("0" if token[-1] != "0" else "1"))
+
+
+def test_csrf_token_reused_within_bucket(monkeypatch):
+    request = Request({"type": "http", "headers": [(b"cookie", b"access_token=bucketed")]})
+    calls = []
+    real_signature = helpers._csrf_signature
+
+    def counting_signature(session_id, timestamp):
+        calls.append(session_id)
+        return real_signature(session_id, timestamp)
+
+    monkeypatch.setattr(helpers, "_csrf_signature", counting_signature)
+
+    first = generate_csrf_token(request)
+    assert generate_csrf_token(request) == first
+    assert len(calls) == 1
+    validate_csrf_token(request, first)
+
+
+def test_csrf_token_with_non_ascii_signature_is_rejected():
+    request = Request({"type": "http", "headers": [(b"cookie", b"access_token=abc")]})
+    timestamp = generate_csrf_token(request).split(":", 1)[0]
+    with pytest.raises(HTTPException) as exc_info:
+        validate_csrf_token(request, f"{timestamp}:é")
+    assert exc_info.value.status_code == 403
+
+
+def test_dr_backup_rejects_malformed_plan_id_before_enqueuing(client, admin_token, monkeypatch):
+    from app.tasks import dr
+
+    queued = []
+    monkeypatch.setattr(dr.run_dr_backup, "delay", lambda *args: queued.append(args))
+    client.cookies.set("access_token", admin_token)
+    csrf_token = _extract_csrf_token(client.get("/dr").text)
+
+    response = client.post("/dr/not-a-uuid/backup", data={"csrf_token": csrf_token}, follow_redirects=False)
+    assert response.status_code == 422
+    assert queued == []
+
+    plan_id = uuid.uuid4()
+    response = client.post(f"/dr/{plan_id}/backup", data={"csrf_token": csrf_token}, follow_redirects=False)
+    assert response.status_code == 302
+    assert queued == [(str(plan_id),)]
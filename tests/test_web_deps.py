@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.web import deps
+from app.web.deps import _extract_token, get_read_db, require_web_auth
+
+
+def _request(headers: list[tuple[bytes, bytes]]) -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/dashboard", "headers": headers})
+
+
+def test_extract_token_prefers_cookie_over_bearer():
+    request = _request(
+        [
+            (b"authorization", b"Bearer header-token"),
+            (b"cookie", b"theme=dark; access_token=cookie-token; other=1"),
+        ]
+    )
+    assert _extract_token(request) == "cookie-token"
+
+
+def test_extract_token_ignores_similarly_named_cookies():
+    request = _request([(b"cookie", b"x_access_token=nope; access_token_old=nope")])
+    assert _extract_token(request) is None
+
+
+def test_extract_token_falls_back_to_bearer_header():
+    request = _request([(b"cookie", b"access_token=; theme=dark"), (b"authorization", b"Bearer header-token")])
+    assert _extract_token(request) == "header-token"
+
+
+def test_extract_token_requires_bearer_scheme():
+    assert _extract_token(_request([(b"authorization", b"Basic abc")])) is None
+    assert _extract_token(_request([])) is None
+
+
+def test_require_web_auth_redirects_to_login_without_token(db_session):
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            require_web_auth(_request([]), db_session)
+        assert exc_info.value.status_code == 302
+        assert exc_info.value.headers == {"Location": "/login"}
+
+
+def test_read_db_reuses_the_request_session_without_a_replica(db_session, monkeypatch):
+    monkeypatch.setattr(deps, "ReadSessionLocal", None)
+    assert next(get_read_db(_request([]), db_session)) is db_session
+
+
+def test_read_db_uses_the_replica_unless_the_client_just_wrote(db_session, monkeypatch):
+    replica_session = MagicMock()
+    monkeypatch.setattr(deps, "ReadSessionLocal", lambda: replica_session)
+    reads = get_read_db(_request([]), db_session)
+    assert next(reads) is replica_session
+    reads.close()
+    replica_session.close.assert_called_once()
+    assert next(get_read_db(_request([(b"cookie", b"read_primary=1")]), db_session)) is db_session
@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.web.helpers import concurrency_limit, precompile_templates, templates
+
+
+def test_all_templates_compile():
+    assert precompile_templates() == len(templates.env.list_templates(extensions=["html"])) > 0
+
+
+def test_concurrency_limit_rejects_overflow_with_503():
+    async def scenario():
+        acquire = concurrency_limit(1)
+        held = acquire()
+        await held.__anext__()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await acquire().__anext__()
+        assert exc_info.value.status_code == 503
+
+        # Releasing the slot admits the next request.
+        with pytest.raises(StopAsyncIteration):
+            await held.__anext__()
+        await acquire().__anext__()
+
+    asyncio.run(scenario())
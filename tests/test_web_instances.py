@@ -0,0 +1,229 @@
+import re
+import uuid
+from html import unescape
+
+import pytest
+
+from app.models.catalog import AppCatalogItem
+from app.models.deployment_log import DeploymentLog, DeployStepStatus
+from app.models.git_repository import GitAuthType, GitRepository
+from app.models.instance import Instance
+from app.models.server import Server
+from app.services.server_service import ServerService
+from app.web import instances
+
+
+def _extract_csrf_token(html: str) -> str:
+    match = re.search(r'name="csrf_token"\s+value="([^"]+)"', html)
+    assert match, "csrf_token hidden input not found"
+    return match.group(1)
+
+
+def test_instance_list_etag_round_trip(client, admin_token):
+    client.cookies.set("access_token", admin_token)
+
+    first = client.get("/instances?page_size=10")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=0, must-revalidate"
+
+    again = client.get("/instances?page_size=10", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+
+    other_query = client.get("/instances?page_size=20", headers={"If-None-Match": etag})
+    assert other_query.status_code == 200
+
+
+def test_instance_list_reuses_rendered_page_for_same_etag(client, admin_token, monkeypatch):
+    # Pin the per-minute token so both requests land on the same ETag.
+    monkeypatch.setattr(instances, "generate_csrf_token", lambda request: "1:pinned")
+    client.cookies.set("access_token", admin_token)
+    first = client.get("/instances?page_size=15")
+    assert first.status_code == 200
+
+    def fail(*args, **kwargs):
+        raise AssertionError("list_for_web should not run for a cached page")
+
+    monkeypatch.setattr(instances.InstanceService, "list_for_web", fail)
+    again = client.get("/instances?page_size=15")
+    assert again.status_code == 200
+    assert again.headers["etag"] == first.headers["etag"]
+    assert again.text == first.text
+
+
+def test_instance_form_catalog_map_is_attribute_escaped(client, admin_token, db_session):
+    repo = GitRepository(label=f"repo-{uuid.uuid4().hex[:8]}", auth_type=GitAuthType.none, registry_url="r")
+    db_session.add(repo)
+    db_session.flush()
+    db_session.add(AppCatalogItem(label="O'Brien <ERP>", version="1.0", git_ref="main", git_repo_id=repo.repo_id))
+    db_session.commit()
+    client.cookies.set("access_token", admin_token)
+
+    html = client.get("/instances/new").text
+    attr = html.split("data-catalog-map='", 1)[1].split("'", 1)[0]
+    assert "O&#39;Brien &lt;ERP&gt;" in attr
+    assert "&amp;#39;" not in attr
+
+
+def test_health_badge_renders_from_cache_and_honours_etag(client, admin_token, monkeypatch):
+    client.cookies.set("access_token", admin_token)
+    instances._BADGE_CACHE.clear()
+    url = f"/instances/{uuid.uuid4()}/health"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert "No data" in first.text
+    assert (None, None, False) in instances._BADGE_CACHE
+
+    monkeypatch.setattr(instances.templates, "get_template", lambda name: pytest.fail("badge re-rendered"))
+    assert client.get(url).text == first.text
+    assert client.get(url, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+
+def test_instance_create_parses_typed_form_fields(client, admin_token):
+    client.cookies.set("access_token", admin_token)
+    token = _extract_csrf_token(client.get("/instances/new").text)
+    form = {
+        "csrf_token": token,
+        "server_id": str(uuid.uuid4()),
+        "org_code": "ACME",
+        "org_name": "Acme",
+        "catalog_item_id": "",
+        "app_port": "",
+    }
+
+    rerender = client.post("/instances/new", data=form)
+    assert rerender.status_code == 200
+    assert "Catalog item is required" in rerender.text
+
+    assert client.post("/instances/new", data={**form, "app_port": "abc"}).status_code == 422
+    assert client.post("/instances/new", data={**form, "server_id": "not-a-uuid"}).status_code == 422
+
+
+def test_instance_form_lists_servers_from_column_rows(client, admin_token, db_session):
+    server = ServerService(db_session).create(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="form.example.com")
+    db_session.commit()
+    client.cookies.set("access_token", admin_token)
+
+    html = client.get("/instances/new").text
+    assert f'value="{server.server_id}"' in html
+    assert f"{server.name} (form.example.com)" in html
+
+
+def test_instance_form_server_rows_are_memoized_until_a_server_write(db_session, monkeypatch):
+    svc = ServerService(db_session)
+    rows = svc.list_for_form()
+    monkeypatch.setattr(db_session, "execute", lambda *a, **kw: pytest.fail("server rows queried"))
+    assert svc.list_for_form() is rows
+    monkeypatch.undo()
+
+    server = svc.create(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="memo.example.com")
+    # Other requests keep the committed list until the write commits.
+    assert svc.list_for_form() is rows
+    db_session.commit()
+    assert server.server_id in {row.server_id for row in svc.list_for_form()}
+
+
+def test_instance_table_scrolls_through_rows_endpoint(client, admin_token, db_session):
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    prefix = f"sc{uuid.uuid4().hex[:6]}"
+    for i in range(12):
+        db_session.add(
+            Instance(
+                server_id=server.server_id,
+                org_code=f"{prefix}{i:02d}",
+                org_name=f"Org {i}",
+                app_port=9600 + i,
+                db_port=9700 + i,
+                redis_port=9800 + i,
+            )
+        )
+    db_session.commit()
+    client.cookies.set("access_token", admin_token)
+
+    page = client.get(f"/instances?q={prefix}&page_size=10").text
+    assert f"{prefix}09" in page and f"{prefix}10" not in page
+    assert 'aria-label="Pagination"' not in page
+    rows_url = unescape(re.search(r'hx-get="(/instances/rows\?[^"]+)"', page).group(1))
+    assert f"after={prefix}09" in rows_url
+
+    rows = client.get(rows_url)
+    assert rows.status_code == 200
+    assert f"{prefix}10" in rows.text and f"{prefix}11" in rows.text
+    assert f"{prefix}09" not in rows.text
+    assert "hx-get" not in rows.text
+
+    # A cursor page that reaches the end offers no further cursor, whatever the overall total.
+    tail = client.get(f"/instances?q={prefix}&page_size=10&after={prefix}01").text
+    assert f"{prefix}11" in tail and f"{prefix}01" not in tail
+    assert "/instances/rows?" not in tail
+
+
+def test_instance_detail_renders_active_tab_and_defers_the_rest(client, admin_token, db_session):
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    instance = Instance(
+        server_id=server.server_id,
+        org_code=f"tab{uuid.uuid4().hex[:6]}",
+        org_name="Tabbed Org",
+        app_port=9950,
+        db_port=9951,
+        redis_port=9952,
+    )
+    db_session.add(instance)
+    db_session.commit()
+    client.cookies.set("access_token", admin_token)
+    base = f"/instances/{instance.instance_id}"
+
+    page = client.get(f"{base}?tab=audit")
+    assert page.status_code == 200
+    assert "No audit log entries yet." in page.text
+    assert f'hx-get="{base}/tabs/audit"' not in page.text
+    assert f'hx-get="{base}/tabs/modules"' in page.text
+    assert "Modules</h2>" not in page.text
+
+    tab = client.get(f"{base}/tabs/modules")
+    assert tab.status_code == 200
+    assert "Modules</h2>" in tab.text
+    assert "<html" not in tab.text
+    for name in instances._DETAIL_TABS:
+        assert client.get(f"{base}/tabs/{name}").status_code == 200
+        assert client.get(f"{base}?tab={name}").status_code == 200
+    assert client.get(f"{base}/tabs/unknown").status_code == 404
+
+
+def test_deploy_steps_fragment_renders_only_the_step_list(client, admin_token, db_session):
+    server = Server(name=f"srv-{uuid.uuid4().hex[:6]}", hostname="localhost", is_local=True)
+    db_session.add(server)
+    db_session.flush()
+    instance = Instance(
+        server_id=server.server_id,
+        org_code=f"dep{uuid.uuid4().hex[:6]}",
+        org_name="Deploying Org",
+        app_port=9960,
+        db_port=9961,
+        redis_port=9962,
+    )
+    db_session.add(instance)
+    db_session.flush()
+    deployment_id = str(uuid.uuid4())
+    for step, status in (("pull_image", DeployStepStatus.success), ("start_containers", DeployStepStatus.running)):
+        db_session.add(
+            DeploymentLog(instance_id=instance.instance_id, deployment_id=deployment_id, step=step, status=status)
+        )
+    db_session.commit()
+    client.cookies.set("access_token", admin_token)
+
+    page = client.get(f"/instances/{instance.instance_id}/deploy-log?deployment_id={deployment_id}")
+    assert page.status_code == 200
+    assert 'id="deploy-steps"' in page.text
+
+    steps = client.get(f"/instances/{instance.instance_id}/deploy-log/steps?deployment_id={deployment_id}")
+    assert steps.status_code == 200
+    assert steps.text.lstrip().startswith('<div id="deploy-steps"')
+    assert "Pull Image" in steps.text and "Start Containers" in steps.text
+    assert "<html" not in steps.text